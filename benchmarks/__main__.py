@@ -0,0 +1,64 @@
+"""Runs the benchmark suites, optionally saving results and comparing them to a baseline.
+
+Run from the repository root:
+
+    python -m benchmarks                                  # all suites
+    python -m benchmarks construction                     # import time and model construction
+    python -m benchmarks throughput -k json/load          # benchmarks with "json/load" in the name
+    python -m benchmarks --output before.json             # save results
+    python -m benchmarks --baseline before.json           # flag benchmarks slower by more than 10%
+
+Exits with status 1 when any benchmark regressed against the baseline, or a suite reported a problem
+(like superlinear growth of model construction time).
+"""
+import argparse
+import sys
+from types import ModuleType
+from typing import Dict
+
+from . import construction, throughput
+from .runner import run_all, print_header, print_result, save, load_baseline, compare, print_comparison, matching
+
+suites: Dict[str, ModuleType] = {
+    'throughput': throughput,
+    'construction': construction,
+}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks', description=__doc__.splitlines()[0])
+    parser.add_argument('suites', nargs='*', help=f'suites to run: {", ".join(suites)} (default: all)')
+    parser.add_argument('-k', dest='pattern', help='run only benchmarks with the pattern in the name')
+    parser.add_argument('--rounds', type=int, default=7, help='timed rounds per benchmark (default: 7)')
+    parser.add_argument('--min-time', type=float, default=0.1, help='minimal seconds per round (default: 0.1)')
+    parser.add_argument('--output', help='JSON file to write the results to')
+    parser.add_argument('--baseline', help='JSON results of an earlier run to compare to')
+    parser.add_argument('--threshold', type=float, default=0.1,
+                        help='slowdown against the baseline reported as a regression (default: 0.1)')
+    args = parser.parse_args()
+
+    names = args.suites or list(suites)
+    unknown = [name for name in names if name not in suites]
+    if unknown:
+        parser.error(f'unknown suites: {", ".join(unknown)}')
+    baseline = load_baseline(args.baseline) if args.baseline else None
+    print_header()
+    results = []
+    problems = []
+    for name in names:
+        suite = suites[name]
+        suite_results = run_all(matching(suite.benchmarks(), args.pattern), rounds=args.rounds,
+                                min_time=args.min_time, report=print_result)
+        summarize = getattr(suite, 'summarize', None)
+        if summarize is not None:
+            problems.extend(summarize(suite_results))
+        results.extend(suite_results)
+    if args.output:
+        save(results, args.output, '+'.join(names))
+    if baseline is not None:
+        problems.extend(print_comparison(compare(results, baseline), args.threshold))
+    return 1 if problems else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,124 @@
+"""Cold-start costs: `import serious` and model construction for growing synthetic schemas.
+
+Run from the repository root with the rest of the suite:
+
+    python -m benchmarks construction
+
+Import time is measured in a new interpreter per round. Models are built for new dataclasses on every call,
+so caches kept across models (descriptors, immutability verdicts) only help with types shared by the schemas,
+like they do when an application builds its models at startup.
+
+Schemas grow in three directions — fields per dataclass, depth of nesting, and distinct instantiations
+of a generic dataclass. After the run, the growth of construction time is fitted to `size ** exponent`:
+an exponent well above 1 means model building got superlinear, and is reported as a regression.
+"""
+import math
+import subprocess
+import sys
+import time
+from dataclasses import make_dataclass
+from datetime import datetime
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, Callable, Dict, Generic, List, NamedTuple, Optional, Sequence, Type, TypeVar
+from uuid import UUID
+
+from serious import DictModel
+from .runner import Benchmark, Result
+
+MODELS_PER_CALL = 10
+MAX_EXPONENT = 1.5
+
+_IMPORT = 'import time; start = time.perf_counter(); import serious; print(time.perf_counter() - start)'
+_FIELD_TYPES = [int, str, float, Optional[str], List[int], Dict[str, float], datetime, UUID, Decimal]
+
+T = TypeVar('T')
+
+
+class Family(NamedTuple):
+    name: str
+    schema: Callable[[int], Type]  # Creates a new dataclass of the size.
+    sizes: Sequence[int]
+
+
+def wide(size: int) -> Type:
+    """A dataclass with `size` fields of common types."""
+    return make_dataclass('Wide', [(f'field_{i}', _FIELD_TYPES[i % len(_FIELD_TYPES)]) for i in range(size)])
+
+
+def deep(size: int) -> Type:
+    """A chain of `size` nested dataclasses."""
+    cls = make_dataclass('Leaf', [('id', int), ('name', str)])
+    for level in range(size):
+        cls = make_dataclass(f'Level{level}', [('id', int), ('name', str), ('tags', List[str]), ('child', cls)])
+    return cls
+
+
+def generic(size: int) -> Type:
+    """A dataclass with fields of `size` different instantiations of a generic dataclass."""
+    box = make_dataclass('Box', [('item', T), ('note', Optional[str])], bases=(Generic[T],))
+    items = [make_dataclass(f'Item{i}', [('id', int), ('value', _FIELD_TYPES[i % len(_FIELD_TYPES)])])
+             for i in range(size)]
+    return make_dataclass('Boxes', [(f'box_{i}', box[item]) for i, item in enumerate(items)])  # type: ignore
+
+
+# Models are built recursively, so nesting stays well below the recursion limit.
+families = [
+    Family('fields', wide, (10, 20, 40, 80, 160)),
+    Family('depth', deep, (5, 10, 20, 40, 80)),
+    Family('generics', generic, (10, 20, 40, 80, 160)),
+]
+
+
+def benchmarks() -> List[Benchmark]:
+    result = [Benchmark('import serious', _import_time, 1, self_timed=True)]
+    for family in families:
+        for size in family.sizes:
+            result.append(Benchmark(f'build/{family.name}-{size}', _build(family.schema, size), MODELS_PER_CALL,
+                                    self_timed=True))
+    return result
+
+
+def _import_time() -> float:
+    completed = subprocess.run([sys.executable, '-c', _IMPORT], stdout=subprocess.PIPE, universal_newlines=True,
+                               cwd=str(Path(__file__).parent.parent), check=True)
+    return float(completed.stdout)
+
+
+def _build(schema: Callable[[int], Type], size: int) -> Callable[[], float]:
+    def run() -> float:
+        classes = [schema(size) for _ in range(MODELS_PER_CALL)]
+        start = time.perf_counter()
+        for cls in classes:
+            DictModel(cls)
+        return time.perf_counter() - start
+
+    return run
+
+
+def summarize(results: List[Result]) -> List[str]:
+    """Prints the fitted scaling exponent of every schema family; returns the families above `MAX_EXPONENT`."""
+    latency = {result.name: result.latency_us for result in results}
+    superlinear = []
+    fitted = [(family, [(size, latency[f'build/{family.name}-{size}']) for size in family.sizes
+                        if f'build/{family.name}-{size}' in latency])
+              for family in families]
+    fitted = [(family, points) for family, points in fitted if len(points) > 1]
+    if fitted:
+        print(f'\n{"scaling":<40}{"smallest µs":>14}{"largest µs":>14}{"exponent":>10}')
+    for family, points in fitted:
+        exponent = _fit_exponent(points)
+        mark = '  SUPERLINEAR' if exponent > MAX_EXPONENT else ''
+        if mark:
+            superlinear.append(family.name)
+        print(f'{family.name:<40}{points[0][1]:>14.1f}{points[-1][1]:>14.1f}{exponent:>10.2f}{mark}')
+    return superlinear
+
+
+def _fit_exponent(points: List[Any]) -> float:
+    """The slope of the least-squares line through the points on a log-log scale."""
+    xs = [math.log(size) for size, _ in points]
+    ys = [math.log(value) for _, value in points]
+    mean_x, mean_y = sum(xs) / len(xs), sum(ys) / len(ys)
+    return (sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys))
+            / sum((x - mean_x) ** 2 for x in xs))
@@ -0,0 +1,80 @@
+"""Compares parsing of ISO 8601 date/time strings by `DateTimeIsoSerializer` with the previous implementation.
+
+Run from the repository root:
+
+    python -m benchmarks.iso8601
+
+The previous implementation matched a regular expression checking the calendar (including leap years)
+and then parsed the string again with `datetime.fromisoformat`. Both serializers are called the same way,
+so the difference is the parsing alone. Timestamps are written by `isoformat()` with offsets, and like
+JavaScript's `toISOString()` with milliseconds and "Z", which the previous implementation parsed
+only on Python 3.11+.
+"""
+import re
+import sys
+from datetime import datetime, timedelta, timezone
+from time import perf_counter
+from typing import Callable, List
+
+from serious.descriptors import describe
+from serious.errors import ValidationError
+from serious.serialization import Loading, DateTimeIsoSerializer
+from serious.serialization.iso8601 import parse_datetime
+
+COUNT = 1_000_000
+
+_previous_re = re.compile(
+    r'\A(?:\d{4}-(?:(?:0[1-9]|1[0-2])-(?:0[1-9]|1\d|2[0-8])|(?:0[13-9]|1[0-2])-(?:29|30)|(?:0[13578]|1[02])-31)'
+    r'|(?:[1-9]\d(?:0[48]|[2468][048]|[13579][26])|(?:[2468][048]|[13579][26])00)-02-29)'
+    r'T(?:[01]\d|2[0-3]):[0-5]\d:[0-5]\d(?:\.\d{1,9})?(?:Z|[+-][01]\d:[0-5]\d)?\Z'
+)
+
+
+class PreviousSerializer(DateTimeIsoSerializer):
+    @staticmethod
+    def _convert(value: str) -> datetime:
+        if _previous_re.match(value) is None:
+            raise ValidationError('Invalid date/time format. Check the ISO 8601 specification')
+        return datetime.fromisoformat(value)  # type: ignore # expecting datetime
+
+
+def isoformat_timestamps() -> List[str]:
+    offsets = [timezone.utc, timezone(timedelta(hours=2)), timezone(timedelta(hours=-5))]
+    return [moment.astimezone(offsets[i % 3]).isoformat() for i, moment in enumerate(_moments())]
+
+
+def javascript_timestamps() -> List[str]:
+    return [moment.isoformat(timespec='milliseconds').replace('+00:00', 'Z') for moment in _moments()]
+
+
+def _moments() -> List[datetime]:
+    start = datetime(2020, 1, 1, tzinfo=timezone.utc)
+    return [start + timedelta(seconds=i * 7.3) for i in range(COUNT)]
+
+
+def measure(name: str, parse: Callable[[str], datetime], values: List[str]) -> None:
+    start = perf_counter()
+    for value in values:
+        parse(value)
+    elapsed = perf_counter() - start
+    print(f'{name:<40}{elapsed:>10.2f}{COUNT / elapsed:>16,.0f}')
+
+
+def main() -> None:
+    ctx = Loading(validating=False)
+    previous = PreviousSerializer(describe(datetime), None)
+    serializer = DateTimeIsoSerializer(describe(datetime), None)
+    print(f'Parsing {COUNT:,} ISO 8601 timestamps per row')
+    print(f'{"parser":<40}{"seconds":>10}{"per second":>16}')
+    for kind, values in [('isoformat', isoformat_timestamps()), ('javascript', javascript_timestamps())]:
+        print(f'{kind}, e.g. {values[1]}')
+        if kind == 'isoformat' or sys.version_info >= (3, 11):
+            measure('  previous serializer', lambda value: previous.load(value, ctx), values)
+        measure('  DateTimeIsoSerializer', lambda value: serializer.load(value, ctx), values)
+        measure('  parse_datetime', parse_datetime, values)
+        if kind == 'isoformat' or sys.version_info >= (3, 11):
+            measure('  fromisoformat only', datetime.fromisoformat, values)
+
+
+if __name__ == '__main__':
+    main()
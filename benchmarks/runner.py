@@ -0,0 +1,147 @@
+"""Timing, statistics and baseline comparison shared by the benchmark suites.
+
+Each benchmark is a function processing a batch of objects. It is run for a warmup round first,
+then the number of calls per round is calibrated to last at least `min_time`, and several rounds are timed.
+The median round is reported, so a single slow round (a GC pause, a busy neighbour) does not move the result.
+
+Self-timed benchmarks return the seconds spent on the measured part of a call, and are called once per round.
+They are used when a call must prepare something which is not measured, like a fresh process or new classes.
+"""
+import json
+import platform
+import statistics
+import time
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional
+
+import serious
+
+
+class Benchmark(NamedTuple):
+    name: str
+    run: Callable[[], Any]
+    objects: int  # Number of objects processed by a single call.
+    self_timed: bool = False  # A call returns the seconds taken by the measured part.
+
+
+class Result(NamedTuple):
+    name: str
+    ops_per_sec: float  # Objects per second in the median round.
+    latency_us: float  # Median time per object.
+    stdev_us: float  # Standard deviation of time per object between rounds.
+    rounds: int
+    calls: int  # Calls per round.
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {key: value for key, value in self._asdict().items() if key != 'name'}
+
+
+class Change(NamedTuple):
+    name: str
+    baseline: float  # Objects per second.
+    current: float
+    ratio: float  # current / baseline
+
+
+def measure(benchmark: Benchmark, *, rounds: int = 7, min_time: float = 0.1) -> Result:
+    """Times the benchmark calls in rounds lasting at least `min_time` seconds each."""
+    benchmark.run()
+    if benchmark.self_timed:
+        calls = 1
+        per_object = [benchmark.run() / benchmark.objects for _ in range(rounds)]
+    else:
+        calls = _calibrate(benchmark.run, min_time)
+        per_object = []
+        for _ in range(rounds):
+            start = time.perf_counter()
+            for _ in range(calls):
+                benchmark.run()
+            per_object.append((time.perf_counter() - start) / (calls * benchmark.objects))
+    median = statistics.median(per_object)
+    return Result(
+        name=benchmark.name,
+        ops_per_sec=1 / median,
+        latency_us=median * 1e6,
+        stdev_us=statistics.stdev(per_object) * 1e6 if rounds > 1 else 0.0,
+        rounds=rounds,
+        calls=calls,
+    )
+
+
+def _calibrate(run: Callable[[], Any], min_time: float) -> int:
+    calls = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(calls):
+            run()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            return calls
+        calls = max(calls * 2, int(calls * min_time / elapsed) + 1) if elapsed > 0 else calls * 10
+
+
+def run_all(
+        benchmarks: Iterable[Benchmark],
+        *,
+        rounds: int,
+        min_time: float,
+        report: Callable[[Result], None] = lambda result: None,
+) -> List[Result]:
+    results = []
+    for benchmark in benchmarks:
+        result = measure(benchmark, rounds=rounds, min_time=min_time)
+        report(result)
+        results.append(result)
+    return results
+
+
+def print_header() -> None:
+    print(f'{"benchmark":<40}{"ops/s":>14}{"latency µs":>14}{"± µs":>10}')
+
+
+def print_result(result: Result) -> None:
+    print(f'{result.name:<40}{result.ops_per_sec:>14,.0f}{result.latency_us:>14.2f}{result.stdev_us:>10.2f}')
+
+
+def save(results: List[Result], path: str, suite: str) -> None:
+    """Writes results with the environment they were measured in to a JSON file."""
+    document = {
+        'suite': suite,
+        'serious': serious.__version__,
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'machine': platform.machine(),
+        'results': {result.name: result.as_dict() for result in results},
+    }
+    with open(path, 'w') as f:
+        json.dump(document, f, indent=2)
+        f.write('\n')
+
+
+def load_baseline(path: str) -> Dict[str, float]:
+    """Objects per second by benchmark name from a results file written by `save`."""
+    with open(path) as f:
+        document = json.load(f)
+    return {name: result['ops_per_sec'] for name, result in document['results'].items()}
+
+
+def compare(results: List[Result], baseline: Dict[str, float]) -> List[Change]:
+    """Changes of the results against the baseline, for benchmarks present in both."""
+    return [Change(result.name, baseline[result.name], result.ops_per_sec, result.ops_per_sec / baseline[result.name])
+            for result in results if result.name in baseline]
+
+
+def print_comparison(changes: List[Change], threshold: float) -> List[Change]:
+    """Prints the changes, marking those slower than the baseline by more than `threshold`; returns them."""
+    regressions = [change for change in changes if change.ratio < 1 - threshold]
+    print(f'\n{"benchmark":<40}{"baseline ops/s":>16}{"ops/s":>14}{"change":>10}')
+    for change in changes:
+        mark = '  REGRESSION' if change in regressions else ''
+        print(f'{change.name:<40}{change.baseline:>16,.0f}{change.current:>14,.0f}{change.ratio - 1:>+10.1%}{mark}')
+    if regressions:
+        print(f'\n{len(regressions)} of {len(changes)} benchmarks slower by more than {threshold:.0%}.')
+    return regressions
+
+
+def matching(benchmarks: Iterable[Benchmark], pattern: Optional[str]) -> List[Benchmark]:
+    return [benchmark for benchmark in benchmarks if pattern is None or pattern in benchmark.name]
+
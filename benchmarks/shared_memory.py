@@ -0,0 +1,118 @@
+"""Compares passing dataclasses between processes via pickle and via `SharedMemoryChannel`.
+
+Run from the repository root:
+
+    python -m benchmarks.shared_memory
+
+Two measurements are made for batches of test entities:
+
+- encoding: `pickle.dumps` + `pickle.loads` against model `dump_many` + `load_many`;
+- transfer: a child process sending batches via `multiprocessing.Queue` against `SharedMemoryChannel`.
+"""
+import pickle
+import time
+from multiprocessing import get_context
+from timeit import repeat
+from typing import Any, Callable, List, NamedTuple
+from uuid import UUID
+
+from serious import BinaryModel, StructModel
+from serious.shared import SharedMemoryChannel
+from tests.entities import DataclassX, DataclassXs, DataclassWithUuid, DataclassWithOptional, \
+    DataclassWithOptionalNested, DataclassWithDict
+
+BATCH_SIZE = 1000
+BATCHES = 200
+
+
+class Case(NamedTuple):
+    name: str
+    model: Any  # BinaryModel or StructModel
+    create: Callable[[int], Any]
+
+
+cases = [
+    Case('DataclassX', BinaryModel(DataclassX), lambda i: DataclassX(i)),
+    Case('DataclassX (StructModel)', StructModel(DataclassX), lambda i: DataclassX(i)),
+    Case('DataclassXs', BinaryModel(DataclassXs), lambda i: DataclassXs([DataclassX(i + j) for j in range(10)])),
+    Case('DataclassWithUuid', BinaryModel(DataclassWithUuid), lambda i: DataclassWithUuid(UUID(int=i))),
+    Case('DataclassWithOptionalNested', BinaryModel(DataclassWithOptionalNested),
+         lambda i: DataclassWithOptionalNested(DataclassWithOptional(i if i % 2 else None))),
+    Case('DataclassWithDict', BinaryModel(DataclassWithDict),
+         lambda i: DataclassWithDict({'name': f'item {i}', 'kind': 'entity'})),
+]
+
+
+def batch(case: Case) -> List[Any]:
+    return [case.create(i) for i in range(BATCH_SIZE)]
+
+
+def best_time(f: Callable[[], Any]) -> float:
+    return min(repeat(f, number=10, repeat=5)) / 10
+
+
+def bench_encoding(case: Case) -> None:
+    items = batch(case)
+    pickled = pickle.dumps(items, protocol=pickle.HIGHEST_PROTOCOL)
+    encoded = case.model.dump_many(items)
+    pickle_time = best_time(lambda: pickle.loads(pickle.dumps(items, protocol=pickle.HIGHEST_PROTOCOL)))
+    binary_time = best_time(lambda: case.model.load_many(case.model.dump_many(items)))
+    print(f'{case.name:<30}{len(pickled):>12,}{len(encoded):>12,}'
+          f'{pickle_time * 1e3:>12.2f}{binary_time * 1e3:>12.2f}')
+
+
+def produce_queue(queue, case_index: int) -> None:
+    items = batch(cases[case_index])
+    for _ in range(BATCHES):
+        queue.put(items)
+
+
+def produce_channel(channel: SharedMemoryChannel, case_index: int) -> None:
+    items = batch(cases[case_index])
+    for _ in range(BATCHES):
+        channel.send(items)
+    channel.close()
+
+
+def bench_transfer(case_index: int) -> None:
+    context = get_context('spawn')
+    case = cases[case_index]
+
+    queue = context.Queue()
+    process = context.Process(target=produce_queue, args=(queue, case_index))
+    process.start()
+    queue.get()
+    start = time.perf_counter()
+    for _ in range(BATCHES - 1):
+        queue.get()
+    queue_time = time.perf_counter() - start
+    process.join()
+
+    with SharedMemoryChannel(case.model, capacity=2 ** 22) as channel:
+        process = context.Process(target=produce_channel, args=(channel, case_index))
+        process.start()
+        channel.receive()
+        start = time.perf_counter()
+        for _ in range(BATCHES - 1):
+            channel.receive()
+        channel_time = time.perf_counter() - start
+        process.join()
+
+    objects = (BATCHES - 1) * BATCH_SIZE
+    print(f'{case.name:<30}{objects / queue_time:>16,.0f}{objects / channel_time:>16,.0f}')
+
+
+def main() -> None:
+    print(f'Encoding {BATCH_SIZE} objects per batch')
+    print(f'{"entity":<30}{"pickle B":>12}{"binary B":>12}{"pickle ms":>12}{"binary ms":>12}')
+    for case in cases:
+        bench_encoding(case)
+    print()
+    print(f'Transfer of {BATCHES} batches from a child process, objects per second')
+    print(f'{"entity":<30}{"queue+pickle":>16}{"shared memory":>16}')
+    for i in range(len(cases)):
+        bench_transfer(i)
+
+
+if __name__ == '__main__':
+    main()
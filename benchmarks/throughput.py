@@ -0,0 +1,132 @@
+"""Load and dump throughput of `DictModel` and `JsonModel` on typical schemas.
+
+Run from the repository root with the rest of the suite:
+
+    python -m benchmarks throughput
+
+Every schema is benchmarked for both models in both directions, on a batch of objects
+(`load_many`/`dump_many`), so the reported latency is per object and includes no per-call overhead of a batch.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, date, timezone
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Callable, Dict, Generic, List, NamedTuple, Optional, TypeVar
+from uuid import UUID
+
+from serious import DictModel, JsonModel
+from .runner import Benchmark
+
+BATCH_SIZE = 100
+
+T = TypeVar('T')
+
+
+@dataclass(frozen=True)
+class Flat:
+    id: int
+    name: str
+    price: float
+    available: bool
+    note: Optional[str]
+
+
+@dataclass(frozen=True)
+class Tree:
+    value: str
+    left: Optional[Tree]
+    right: Optional[Tree]
+
+
+@dataclass(frozen=True)
+class Wide:
+    ids: List[int]
+    names: List[str]
+    scores: Dict[str, float]
+
+
+@dataclass(frozen=True)
+class Pair(Generic[T]):
+    number: int
+    first: T
+    second: T
+
+
+@dataclass(frozen=True)
+class Envelope(Generic[T]):
+    sender: str
+    payload: T
+
+
+class Status(Enum):
+    NEW = 'new'
+    PAID = 'paid'
+    SHIPPED = 'shipped'
+
+
+class Priority(Enum):
+    LOW = 1
+    HIGH = 2
+
+
+@dataclass(frozen=True)
+class Ticket:
+    status: Status
+    priority: Priority
+    previous: List[Status]
+
+
+@dataclass(frozen=True)
+class Payment:
+    id: UUID
+    amount: Decimal
+    day: date
+    at: datetime
+
+
+class Schema(NamedTuple):
+    name: str
+    cls: Any
+    create: Callable[[int], Any]
+
+
+def _tree(depth: int, i: int) -> Optional[Tree]:
+    if depth == 0:
+        return None
+    return Tree(f'node {i}', _tree(depth - 1, i * 2), _tree(depth - 1, i * 2 + 1))
+
+
+schemas = [
+    Schema('flat', Flat, lambda i: Flat(i, f'item {i}', i / 4, i % 2 == 0, None if i % 3 else 'note')),
+    Schema('nested-depth-6', Tree, lambda i: _tree(6, i)),
+    Schema('wide-collections', Wide, lambda i: Wide(
+        list(range(100)), [f'name {j}' for j in range(100)], {f'key {j}': j / 2 for j in range(100)})),
+    Schema('generics', Envelope[Pair[Flat]], lambda i: Envelope(
+        f'sender {i}', Pair(i, Flat(i, f'item {i}', i / 4, True, None), Flat(i + 1, 'next', 0.5, False, 'note')))),
+    Schema('enums', Ticket, lambda i: Ticket(
+        Status.PAID, Priority.HIGH if i % 2 else Priority.LOW, [Status.NEW, Status.PAID])),
+    Schema('uuid-decimal-datetime', Payment, lambda i: Payment(
+        UUID(int=i, version=4), Decimal(f'{i}.25'), date(2019, 1, 1 + i % 28),
+        datetime(2019, 1, 1, 12, i % 60, tzinfo=timezone.utc))),
+]
+
+models = [('dict', DictModel), ('json', JsonModel)]
+
+
+def benchmarks() -> List[Benchmark]:
+    result = []
+    for schema in schemas:
+        objects = [schema.create(i) for i in range(BATCH_SIZE)]
+        for model_name, model_cls in models:
+            model = model_cls(schema.cls)
+            dumped = model.dump_many(objects)
+            assert model.load_many(dumped) == objects, f'{schema.name} does not load what it dumps'
+            result.append(_benchmark(f'{schema.name}/{model_name}/load', model.load_many, dumped))
+            result.append(_benchmark(f'{schema.name}/{model_name}/dump', model.dump_many, objects))
+    return result
+
+
+def _benchmark(name: str, run: Callable[[Any], Any], data: Any) -> Benchmark:
+    return Benchmark(name, lambda: run(data), BATCH_SIZE)
@@ -14,10 +14,12 @@ Test utils can be found in `serious.test_utils`.
 .. _Sources on GitHub.: https://github.com/mdrachuk/serious
 """
 
+from .binary import BinaryModel
 from .dict import DictModel
 from .errors import ModelError, ValidationError, LoadError, DumpError
 from .json import JsonModel
-from .types import Timestamp, Email, FrozenList, FrozenDict
+from .struct import StructModel
+from .types import Timestamp, Email, FrozenList, FrozenDict, PersistentList, PersistentDict
 from .validation import validate
 
 __version__ = '1.0.0.dev21'
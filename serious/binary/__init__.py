@@ -0,0 +1,4 @@
+"""A module with `BinaryModel` -- Serious model to transform between dataclasses and compact schema-driven bytes."""
+__all__ = ['BinaryModel']
+
+from .model import BinaryModel
@@ -0,0 +1,442 @@
+"""Binary codecs encoding field values positionally, as described by the model schema.
+
+Each codec mirrors one of the default field serializers and is picked by the type of serializer
+`SeriousModel` resolves for a field. This way the order and fitness rules of the model serializers are preserved.
+Fields handled by any other (custom) serializer are dumped by it to primitives and encoded as JSON text.
+"""
+from __future__ import annotations
+
+__all__ = ['BinaryCodec', 'ModelCodec', 'CodecRegistry']
+
+import json
+from abc import ABC, abstractmethod
+from dataclasses import replace
+from datetime import datetime, date, time, timedelta, timezone
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Dict, List, Optional, Set, Tuple, Type
+from uuid import UUID
+
+from serious.descriptors import TypeDescriptor
+from serious.serialization import FieldSerializer, SeriousModel, Loading, Dumping, OptionalSerializer, \
+    AnySerializer, EnumSerializer, DictSerializer, CollectionSerializer, TupleSerializer, StringSerializer, \
+    BooleanSerializer, IntegerSerializer, FloatSerializer, DataclassSerializer, UtcTimestampSerializer, \
+    DateTimeIsoSerializer, DateIsoSerializer, TimeIsoSerializer, UuidSerializer, DecimalSerializer
+from serious.types import Timestamp, PersistentDict
+from serious.utils import class_path
+from .encoding import Writer, Reader
+
+
+class BinaryCodec(ABC):
+    """Encodes values of a single field descriptor."""
+
+    def __init__(self, serializer: FieldSerializer, registry: CodecRegistry):
+        self.type = serializer.type
+        self.serializer = serializer
+        self.registry = registry
+
+    @abstractmethod
+    def encode(self, value: Any, writer: Writer) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def decode(self, reader: Reader) -> Any:
+        raise NotImplementedError
+
+    def signature(self, seen: Set[ModelCodec]) -> str:
+        """A textual description of the encoded layout, used to fingerprint the schema."""
+        return f'{type(self).__name__}:{class_path(self.type.cls)}'
+
+
+class OptionalCodec(BinaryCodec):
+    """A presence byte followed by the value. Optional dataclass fields are packed into a bitmap instead."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._codec = self.registry.find_codec(replace(self.type, is_optional=False))
+
+    def encode(self, value: Any, writer: Writer) -> None:
+        if value is None:
+            writer.buffer.append(0)
+        else:
+            writer.buffer.append(1)
+            writer.dump(self._codec, value)
+
+    def decode(self, reader: Reader) -> Any:
+        return reader.load(self._codec) if reader.raw(1)[0] else None
+
+    def signature(self, seen: Set[ModelCodec]) -> str:
+        return f'?{self._codec.signature(seen)}'
+
+
+class EnumCodec(BinaryCodec):
+    """Integer enums (including flags) are encoded by value, other enums by member index."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._by_value = issubclass(self.type.cls, int)
+        self._members: List[Enum] = list(self.type.cls)
+        self._indexes: Dict[Enum, int] = {member: i for i, member in enumerate(self._members)}
+
+    def encode(self, value: Enum, writer: Writer) -> None:
+        if self._by_value:
+            writer.zigzag(value.value)
+        else:
+            writer.varint(self._indexes[value])
+
+    def decode(self, reader: Reader) -> Enum:
+        if self._by_value:
+            return self.type.cls(reader.zigzag())
+        index = reader.varint()
+        if index >= len(self._members):
+            raise ValueError(f'Unknown {class_path(self.type.cls)} member index {index}')
+        return self._members[index]
+
+    def signature(self, seen: Set[ModelCodec]) -> str:
+        names = ','.join(member.name for member in self._members)
+        return f'enum:{class_path(self.type.cls)}({names})'
+
+
+class DictCodec(BinaryCodec):
+    """Item count followed by key strings and values."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._codec = self.registry.find_codec(self.type.parameters[1])
+
+    def encode(self, value: Dict[str, Any], writer: Writer) -> None:
+        writer.varint(len(value))
+        items = sorted(value.items()) if isinstance(value, PersistentDict) else value.items()  # As DictSerializer.
+        for key, item in items:
+            writer.string(key)
+            writer.dump(self._codec, item)
+
+    def decode(self, reader: Reader) -> Dict[str, Any]:
+        codec = self._codec
+        intern = self.registry.model.intern
+        items = {}
+        for _ in range(reader.varint()):
+            key = reader.string()
+            items[key if intern is None else intern(key)] = reader.load(codec)
+        return self.type.cls(items)
+
+    def signature(self, seen: Set[ModelCodec]) -> str:
+        return f'{class_path(self.type.cls)}[str,{self._codec.signature(seen)}]'
+
+
+class CollectionCodec(BinaryCodec):
+    """Item count followed by the items."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._codec = self.registry.find_codec(self.type.parameters[0])
+
+    def encode(self, value: Any, writer: Writer) -> None:
+        codec = self._codec
+        writer.varint(len(value))
+        for item in value:
+            writer.dump(codec, item)
+
+    def decode(self, reader: Reader) -> Any:
+        codec = self._codec
+        return self.type.cls([reader.load(codec) for _ in range(reader.varint())])
+
+    def signature(self, seen: Set[ModelCodec]) -> str:
+        return f'{class_path(self.type.cls)}[{self._codec.signature(seen)}]'
+
+
+class TupleCodec(BinaryCodec):
+    """Items of a fixed size tuple one after another."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._codecs = [self.registry.find_codec(self.type.parameters[i]) for i in self.type.parameters]
+
+    def encode(self, value: tuple, writer: Writer) -> None:
+        if len(value) != len(self._codecs):
+            raise ValueError(f'Expecting a tuple of {len(self._codecs)} values')
+        for codec, item in zip(self._codecs, value):
+            writer.dump(codec, item)
+
+    def decode(self, reader: Reader) -> tuple:
+        return self.type.cls([reader.load(codec) for codec in self._codecs])
+
+    def signature(self, seen: Set[ModelCodec]) -> str:
+        items = ','.join(codec.signature(seen) for codec in self._codecs)
+        return f'{class_path(self.type.cls)}[{items}]'
+
+
+class StringCodec(BinaryCodec):
+    """UTF-8 bytes prefixed by their length."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._intern = self.registry.model.intern if self.type.cls is str else None
+
+    def encode(self, value: str, writer: Writer) -> None:
+        writer.string(value)
+
+    def decode(self, reader: Reader) -> str:
+        if self._intern is not None:
+            return self._intern(reader.string())
+        return self.type.cls(reader.string())
+
+
+class BooleanCodec(BinaryCodec):
+    """A single byte."""
+
+    def encode(self, value: bool, writer: Writer) -> None:
+        writer.buffer.append(1 if value else 0)
+
+    def decode(self, reader: Reader) -> bool:
+        return self.type.cls(reader.raw(1)[0])
+
+
+class IntegerCodec(BinaryCodec):
+    """A zigzag varint. Small numbers of either sign take a single byte."""
+
+    def encode(self, value: int, writer: Writer) -> None:
+        writer.zigzag(value)
+
+    def decode(self, reader: Reader) -> int:
+        return self.type.cls(reader.zigzag())
+
+
+class FloatCodec(BinaryCodec):
+    """An 8-byte IEEE 754 double."""
+
+    def encode(self, value: float, writer: Writer) -> None:
+        writer.double(value)
+
+    def decode(self, reader: Reader) -> float:
+        return self.type.cls(reader.double())
+
+
+class DataclassCodec(BinaryCodec):
+    """Fields of a nested dataclass, encoded by the codec shared among all fields of the same dataclass type."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._codec = self.registry.model_codec(self.type)
+
+    def encode(self, value: Any, writer: Writer) -> None:
+        self._codec.encode(value, writer)
+
+    def decode(self, reader: Reader) -> Any:
+        return self._codec.decode(reader)
+
+    def signature(self, seen: Set[ModelCodec]) -> str:
+        return self._codec.signature(seen)
+
+
+class TimestampCodec(BinaryCodec):
+    """An 8-byte double of seconds since UNIX epoch."""
+
+    def encode(self, value: Timestamp, writer: Writer) -> None:
+        writer.double(value.value)
+
+    def decode(self, reader: Reader) -> Timestamp:
+        return Timestamp(reader.double())
+
+
+_epoch = datetime(1970, 1, 1)
+_microsecond = timedelta(microseconds=1)
+
+
+def _encode_offset(value: Optional[timedelta], writer: Writer) -> None:
+    """Zero for naive values, otherwise a zigzag of UTC offset seconds increased by one."""
+    if value is None:
+        writer.varint(0)
+        return
+    seconds = value // timedelta(seconds=1)
+    writer.varint((seconds << 1 if seconds >= 0 else (-seconds << 1) - 1) + 1)
+
+
+def _decode_offset(reader: Reader) -> Optional[timezone]:
+    encoded = reader.varint()
+    if encoded == 0:
+        return None
+    value = encoded - 1
+    seconds = value >> 1 if not value & 1 else -((value + 1) >> 1)
+    return timezone.utc if seconds == 0 else timezone(timedelta(seconds=seconds))
+
+
+class DateTimeCodec(BinaryCodec):
+    """An 8-byte count of local microseconds since UNIX epoch followed by the UTC offset."""
+
+    def encode(self, value: datetime, writer: Writer) -> None:
+        local = (value.replace(tzinfo=None) - _epoch) // _microsecond
+        writer.raw(local.to_bytes(8, 'little', signed=True))
+        _encode_offset(value.utcoffset(), writer)
+
+    def decode(self, reader: Reader) -> datetime:
+        local = int.from_bytes(reader.raw(8), 'little', signed=True)  # type: ignore # any buffer is accepted
+        value = _epoch + timedelta(microseconds=local)
+        return value.replace(tzinfo=_decode_offset(reader))
+
+
+class DateCodec(BinaryCodec):
+    """A varint of the proleptic Gregorian ordinal."""
+
+    def encode(self, value: date, writer: Writer) -> None:
+        writer.varint(value.toordinal())
+
+    def decode(self, reader: Reader) -> date:
+        return date.fromordinal(reader.varint())
+
+
+class TimeCodec(BinaryCodec):
+    """A varint of microseconds since midnight followed by the UTC offset."""
+
+    def encode(self, value: time, writer: Writer) -> None:
+        writer.varint(((value.hour * 60 + value.minute) * 60 + value.second) * 1_000_000 + value.microsecond)
+        _encode_offset(value.utcoffset(), writer)
+
+    def decode(self, reader: Reader) -> time:
+        seconds, microsecond = divmod(reader.varint(), 1_000_000)
+        minutes, second = divmod(seconds, 60)
+        hour, minute = divmod(minutes, 60)
+        return time(hour, minute, second, microsecond, tzinfo=_decode_offset(reader))
+
+
+class UuidCodec(BinaryCodec):
+    """16 raw bytes."""
+
+    def encode(self, value: UUID, writer: Writer) -> None:
+        writer.raw(value.bytes)
+
+    def decode(self, reader: Reader) -> UUID:
+        return UUID(bytes=bytes(reader.raw(16)))
+
+
+class DecimalCodec(BinaryCodec):
+    """The exact decimal string. Keeps precision and exponent of the original value."""
+
+    def encode(self, value: Decimal, writer: Writer) -> None:
+        writer.string(str(value))
+
+    def decode(self, reader: Reader) -> Decimal:
+        return Decimal(reader.string())
+
+
+class SerializedCodec(BinaryCodec):
+    """Fallback for custom serializers and `Any` values: a JSON text of the value dumped by the field serializer."""
+
+    def encode(self, value: Any, writer: Writer) -> None:
+        dumped = self.serializer.dump(value, Dumping(validating=writer.validating))
+        writer.string(json.dumps(dumped, ensure_ascii=False, allow_nan=False, separators=(',', ':')))
+
+    def decode(self, reader: Reader) -> Any:
+        return self.serializer.load(json.loads(reader.string()), Loading(validating=reader.validating))
+
+    def signature(self, seen: Set[ModelCodec]) -> str:
+        return f'json:{class_path(type(self.serializer))}:{class_path(self.type.cls)}'
+
+
+class ModelCodec:
+    """Encodes a dataclass as a bitmap of present optional fields followed by field values in definition order."""
+
+    def __init__(self, model: SeriousModel):
+        self.model = model
+        self.cls = model.cls
+        self._fields: List[Tuple[str, BinaryCodec, bool]] = []
+        self._optional_count = 0
+        self._bitmap_size = 0
+
+    def build(self, registry: CodecRegistry) -> None:
+        """Resolves codecs of the dataclass fields. Separated from `__init__` to allow recursive dataclasses."""
+        for name, serializer in self.model.serializers_by_field.items():
+            is_optional = type(serializer) is OptionalSerializer
+            if is_optional:
+                codec = registry.find_codec(replace(serializer.type, is_optional=False))
+            else:
+                codec = registry.codec_for(serializer)
+            self._fields.append((name, codec, is_optional))
+        self._optional_count = sum(1 for _, _, is_optional in self._fields if is_optional)
+        self._bitmap_size = (self._optional_count + 7) // 8
+
+    def encode(self, value: Any, writer: Writer) -> None:
+        values = [(getattr(value, name), codec, is_optional) for name, codec, is_optional in self._fields]
+        if self._bitmap_size:
+            bitmap = 0
+            bit = 1
+            for item, _, is_optional in values:
+                if is_optional:
+                    if item is not None:
+                        bitmap |= bit
+                    bit <<= 1
+            writer.raw(bitmap.to_bytes(self._bitmap_size, 'little'))
+        for item, codec, is_optional in values:
+            if is_optional and item is None:
+                continue
+            writer.dump(codec, item)
+
+    def decode(self, reader: Reader) -> Any:
+        bitmap = int.from_bytes(bytes(reader.raw(self._bitmap_size)), 'little') if self._bitmap_size else 0
+        bit = 1
+        kwargs: Dict[str, Any] = {}
+        for name, codec, is_optional in self._fields:
+            if is_optional:
+                present = bitmap & bit
+                bit <<= 1
+                if not present:
+                    kwargs[name] = None
+                    continue
+            kwargs[name] = reader.load(codec)
+        canonical = self.model.canonical
+        if canonical is not None:
+            return canonical(self.cls(**kwargs))
+        return self.cls(**kwargs)
+
+    def signature(self, seen: Set[ModelCodec]) -> str:
+        name = class_path(self.cls)
+        if self in seen:
+            return name
+        seen.add(self)
+        fields = ','.join(f'{field}:{"?" if is_optional else ""}{codec.signature(seen)}'
+                          for field, codec, is_optional in self._fields)
+        return f'{name}({fields})'
+
+
+_codecs: Dict[Type[FieldSerializer], Type[BinaryCodec]] = {
+    OptionalSerializer: OptionalCodec,
+    AnySerializer: SerializedCodec,
+    EnumSerializer: EnumCodec,
+    DictSerializer: DictCodec,
+    CollectionSerializer: CollectionCodec,
+    TupleSerializer: TupleCodec,
+    StringSerializer: StringCodec,
+    BooleanSerializer: BooleanCodec,
+    IntegerSerializer: IntegerCodec,
+    FloatSerializer: FloatCodec,
+    DataclassSerializer: DataclassCodec,
+    UtcTimestampSerializer: TimestampCodec,
+    DateTimeIsoSerializer: DateTimeCodec,
+    DateIsoSerializer: DateCodec,
+    TimeIsoSerializer: TimeCodec,
+    UuidSerializer: UuidCodec,
+    DecimalSerializer: DecimalCodec,
+}
+
+
+class CodecRegistry:
+    """Creates codecs for descriptors of a `SeriousModel` tree, sharing a single codec per dataclass type."""
+
+    def __init__(self, model: SeriousModel):
+        self.model = model
+        self._model_codecs: Dict[TypeDescriptor, ModelCodec] = {}
+
+    def model_codec(self, descriptor: TypeDescriptor) -> ModelCodec:
+        if descriptor in self._model_codecs:
+            return self._model_codecs[descriptor]
+        codec = ModelCodec(self.model.child_model(descriptor))
+        self._model_codecs[descriptor] = codec
+        codec.build(self)
+        return codec
+
+    def find_codec(self, descriptor: TypeDescriptor) -> BinaryCodec:
+        return self.codec_for(self.model.find_serializer(descriptor))
+
+    def codec_for(self, serializer: FieldSerializer) -> BinaryCodec:
+        codec_cls = _codecs.get(type(serializer), SerializedCodec)
+        return codec_cls(serializer, self)
@@ -0,0 +1,132 @@
+"""Primitive encodings of the binary model: varints, zigzag integers, length-prefixed strings, and fixed-size values.
+
+`Writer` and `Reader` play the role of `Dumping` and `Loading` contexts for binary codecs:
+they are passed through the whole codec tree and run validation of the values when requested.
+"""
+from __future__ import annotations
+
+__all__ = ['Writer', 'Reader']
+
+from struct import Struct
+from typing import Any, TYPE_CHECKING, Union
+
+from serious.validation import validate
+
+if TYPE_CHECKING:
+    from .codecs import BinaryCodec, ModelCodec
+
+    Codec = Union[BinaryCodec, ModelCodec]
+
+_double = Struct('<d')
+
+
+class Writer:
+    """Accumulates encoded values in a `bytearray`."""
+
+    def __init__(self, *, validating: bool):
+        self.buffer = bytearray()
+        self.validating = validating
+
+    def dump(self, codec: Codec, value: Any) -> None:
+        """Encode a value with a codec, validating it first if required."""
+        if self.validating:
+            validate(value)
+        codec.encode(value, self)
+
+    def varint(self, value: int) -> None:
+        """Unsigned integer in 7-bit groups, least significant first."""
+        buffer = self.buffer
+        if 0 <= value < 0x80:
+            buffer.append(value)
+            return
+        if value < 0:
+            raise ValueError(f'Cannot encode negative {value} as varint')
+        while value > 0x7f:
+            buffer.append((value & 0x7f) | 0x80)
+            value >>= 7
+        buffer.append(value)
+
+    def zigzag(self, value: int) -> None:
+        """Signed integer mapped to unsigned (0, -1, 1, -2 -> 0, 1, 2, 3) and encoded as a varint."""
+        self.varint(value << 1 if value >= 0 else (-value << 1) - 1)
+
+    def double(self, value: float) -> None:
+        self.buffer += _double.pack(value)
+
+    def string(self, value: str) -> None:
+        encoded = value.encode('utf-8')
+        self.varint(len(encoded))
+        self.buffer += encoded
+
+    def blob(self, value: bytes) -> None:
+        """Length-prefixed bytes."""
+        self.varint(len(value))
+        self.buffer += value
+
+    def raw(self, value: bytes) -> None:
+        """Bytes of a size known to the reader."""
+        self.buffer += value
+
+
+class Reader:
+    """Decodes values from any object supporting the buffer protocol without copying it."""
+
+    def __init__(self, data: Any, *, validating: bool, position: int = 0):
+        self.view = memoryview(data)
+        self.position = position
+        self.validating = validating
+
+    def load(self, codec: Codec) -> Any:
+        """Decode a value with a codec, validating the result if required."""
+        value = codec.decode(self)
+        if self.validating:
+            validate(value)
+        return value
+
+    @property
+    def exhausted(self) -> bool:
+        return self.position >= len(self.view)
+
+    def varint(self) -> int:
+        view = self.view
+        position = self.position
+        if position < len(view) and view[position] < 0x80:
+            self.position = position + 1
+            return view[position]
+        result = 0
+        shift = 0
+        try:
+            while True:
+                byte = view[position]
+                position += 1
+                result |= (byte & 0x7f) << shift
+                if byte < 0x80:
+                    break
+                shift += 7
+        except IndexError:
+            raise ValueError('Unexpected end of binary data') from None
+        self.position = position
+        return result
+
+    def zigzag(self) -> int:
+        value = self.varint()
+        return value >> 1 if not value & 1 else -((value + 1) >> 1)
+
+    def double(self) -> float:
+        return _double.unpack(self.raw(8))[0]
+
+    def string(self) -> str:
+        return str(self.raw(self.varint()), 'utf-8')  # type: ignore # decodes the buffer without a copy
+
+    def blob(self) -> memoryview:
+        """Length-prefixed bytes."""
+        return self.raw(self.varint())
+
+    def raw(self, size: int) -> memoryview:
+        """Bytes of a size known in advance."""
+        start = self.position
+        end = start + size
+        if end > len(self.view):
+            raise ValueError('Unexpected end of binary data')
+        self.position = end
+        return self.view[start:end]
@@ -0,0 +1,11 @@
+"""Errors specific to binary model."""
+
+
+class SchemaMismatch(Exception):
+    """Binary data was encoded by a model with a different schema."""
+
+    def __init__(self, expected: bytes, actual: bytes):
+        super().__init__(f'Unexpected binary schema. Expecting fingerprint {expected.hex()}, got {actual.hex()}. '
+                         f'The data was encoded by a model of a different dataclass or a different version of it.')
+        self.expected = expected
+        self.actual = actual
@@ -0,0 +1,182 @@
+"""A module with `BinaryModel` -- Serious model to transform between dataclasses and compact schema-driven bytes."""
+from __future__ import annotations
+
+__all__ = ['BinaryModel']
+
+from hashlib import blake2b
+from typing import TypeVar, Type, Generic, List, Collection, Iterable, Union, Any
+
+from serious.checks import check_is_instance
+from serious.descriptors import describe
+from serious.errors import ValidationError, LoadError, DumpError
+from serious.serialization import FieldSerializer, SeriousModel, field_serializers
+from serious.utils import class_path
+from serious.validation import validate
+from .codecs import CodecRegistry
+from .encoding import Writer, Reader
+from .errors import SchemaMismatch
+
+T = TypeVar('T')
+
+FINGERPRINT_SIZE = 8
+
+
+class BinaryModel(Generic[T]):
+    """A model converting dataclasses to compact bytes and back.
+
+    Field names are not written. Instead the values are written in the order of dataclass fields,
+    using the types known from the model schema:
+
+    - integers as zigzag varints, floats as 8-byte doubles, booleans as a single byte;
+    - strings and decimals as length-prefixed UTF-8;
+    - UUIDs as 16 bytes, timestamps as 8-byte doubles, datetimes as 8-byte microseconds with an offset;
+    - optional dataclass fields as a presence bitmap preceding the dataclass values;
+    - collections and dictionaries prefixed with their size.
+
+    Every output starts with a fingerprint of the schema, so data encoded by a different model is rejected.
+
+        :Example:
+
+        from uuid import UUID
+        from dataclasses import dataclass
+        from serious import BinaryModel
+
+        @dataclass
+        class Robot:
+            serial: UUID
+            name: str
+
+        >>> model = BinaryModel(Robot)
+        >>> data = model.dump(Robot(UUID('00000000-0000-4000-0000-000002716057'), 'Bender'))
+        >>> model.load(data)
+        Robot(serial=UUID('00000000-0000-4000-0000-000002716057'), name='Bender')
+
+    Check `__init__` parameters for a list of configuration options.
+
+    `More on models in docs <https://serious.readthedocs.io/en/latest/models/>`_.
+    """
+
+    def __init__(
+            self,
+            cls: Type[T],
+            serializers: Iterable[Type[FieldSerializer]] = field_serializers(),
+            *,
+            allow_any: bool = False,
+            validate_on_load: bool = True,
+            validate_on_dump: bool = False,
+            ensure_frozen: Union[bool, Iterable[Type]] = False,
+            intern_strings: Union[bool, int] = False,
+            canonicalize: Union[bool, Iterable[Type]] = False,
+    ):
+        """Initialize a binary model.
+
+        :param cls: the dataclass type to load/dump.
+        :param serializers: field serializer classes in an order they will be tested for fitness for each field;
+                fields fitting custom serializers are encoded as JSON text of the serializer output.
+        :param allow_any: `False` to raise if the model contains fields annotated with `Any`
+                (this includes generics like `List[Any]`, or simply `list`).
+        :param validate_on_load: to call dataclass `__validate__` method after object construction.
+        :param validate_on_dump: to call object `__validate__` before dumping.
+        :param ensure_frozen: `False` to skip check of model immutability; `True` will perform the check
+                against built-in immutable types; a list of custom immutable types is added to built-ins.
+        :param intern_strings: `True` to share repeated loaded strings via `sys.intern`; a number to share them
+                via a table of this many strings kept by the model; `False` to keep each loaded string separate.
+        :param canonicalize: `True` to share a single instance between equal loaded objects of frozen dataclasses;
+                a list of frozen dataclasses to share only their instances.
+        """
+        self.cls = cls
+        self.descriptor = describe(cls)
+        self.serious_model: SeriousModel = SeriousModel(
+            self.descriptor,
+            serializers,
+            allow_any=allow_any,
+            allow_missing=False,
+            allow_unexpected=False,
+            validate_on_load=validate_on_load,
+            validate_on_dump=validate_on_dump,
+            ensure_frozen=ensure_frozen,
+            intern_strings=intern_strings,
+            canonicalize=canonicalize,
+        )
+        self._codec = CodecRegistry(self.serious_model).model_codec(self.descriptor)
+        self.fingerprint = blake2b(self.schema.encode('utf-8'), digest_size=FINGERPRINT_SIZE).digest()
+        self._validate_on_load = validate_on_load
+        self._validate_on_dump = validate_on_dump
+
+    @property
+    def schema(self) -> str:
+        """A textual description of the binary layout. The fingerprint is a hash of it."""
+        return self._codec.signature(set())
+
+    def load(self, data: bytes) -> T:
+        """Load a dataclass from bytes."""
+        reader = self._reader(data)
+        try:
+            result = reader.load(self._codec)
+            self._check_exhausted(reader)
+            return result
+        except ValidationError:
+            raise
+        except Exception as e:
+            raise LoadError(self.cls, [], data) from e
+
+    def load_many(self, data: bytes) -> List[T]:
+        """Load a list of dataclasses from bytes."""
+        reader = self._reader(data)
+        try:
+            result = [reader.load(self._codec) for _ in range(reader.varint())]
+            self._check_exhausted(reader)
+            return result
+        except ValidationError:
+            raise
+        except Exception as e:
+            raise LoadError(self.cls, [], data) from e
+
+    def dump(self, o: T) -> bytes:
+        """Dump a single dataclass to bytes."""
+        writer = self._writer()
+        self._dump(o, writer)
+        return bytes(writer.buffer)
+
+    def dump_many(self, items: Collection[T]) -> bytes:
+        """Dump a list of dataclasses to bytes."""
+        writer = self._writer()
+        writer.varint(len(items))
+        for o in items:
+            self._dump(o, writer)
+        return bytes(writer.buffer)
+
+    def _dump(self, o: T, writer: Writer) -> None:
+        check_is_instance(o, self.cls)
+        try:
+            if self._validate_on_dump:
+                validate(o)
+            writer.dump(self._codec, o)
+        except ValidationError:
+            raise
+        except Exception as e:
+            raise DumpError(o, []) from e
+
+    def _writer(self) -> Writer:
+        writer = Writer(validating=False)
+        writer.raw(self.fingerprint)
+        return writer
+
+    def _reader(self, data: Any) -> Reader:
+        reader = Reader(data, validating=self._validate_on_load)
+        fingerprint = bytes(reader.view[:FINGERPRINT_SIZE])
+        if fingerprint != self.fingerprint:
+            raise SchemaMismatch(self.fingerprint, fingerprint)
+        reader.position = FINGERPRINT_SIZE
+        return reader
+
+    @staticmethod
+    def _check_exhausted(reader: Reader) -> None:
+        if not reader.exhausted:
+            raise ValueError(f'Unexpected {len(reader.view) - reader.position} trailing bytes')
+
+    def __repr__(self):
+        path = class_path(type(self))
+        if path == 'serious.binary.model.BinaryModel':
+            path = 'serious.BinaryModel'
+        return f'<{path}[{class_path(self.cls)}] at {hex(id(self))}>'
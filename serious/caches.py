@@ -0,0 +1,223 @@
+"""Bounded caches used by models to skip repeated work: dumps of frozen objects, loads of repeated inputs, etc.
+
+Caches are enabled by model options accepting `True` (default options), a number (cache size),
+or `CacheOptions`. Each cache counts its hits, misses and evictions in `CacheStats`.
+"""
+from __future__ import annotations
+
+__all__ = ['CacheOptions', 'CacheStats', 'LruCache', 'DumpCache', 'cache_options', 'content_key', 'strict_key']
+
+import hashlib
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass, fields, is_dataclass
+from datetime import datetime, time
+from decimal import Decimal
+from threading import Lock
+from time import monotonic
+from typing import Any, Generic, Hashable, Iterable, NamedTuple, Optional, Tuple, TypeVar, Union
+
+from .types import FrozenDict, PersistentDict, PersistentList, Timestamp
+
+V = TypeVar('V')
+
+MISSING = object()  # returned by cache lookups which found nothing
+
+
+class CacheOptions(NamedTuple):
+    """Configuration of a model cache.
+
+    :param size: maximum number of entries.
+    :param key: `'identity'` to find objects by `id` (entries are dropped when objects are garbage collected),
+            or `'hash'` to find equal objects (serialized the same way) by their hash.
+    :param eviction: `'lru'` to evict the least recently used entry, `'fifo'` to evict the oldest one.
+    :param ttl: seconds an entry is valid for; `None` for no expiration.
+    """
+    size: int = 1024
+    key: str = 'identity'
+    eviction: str = 'lru'
+    ttl: Optional[float] = None
+
+
+def cache_options(option: Union[bool, int, CacheOptions]) -> Optional[CacheOptions]:
+    """Resolves a model cache option: `False` for no cache, `True` for defaults, a number for the cache size."""
+    if option is False:
+        return None
+    if option is True:
+        return CacheOptions()
+    if isinstance(option, CacheOptions):
+        return option
+    return CacheOptions(size=option)
+
+
+def content_key(data: Union[str, bytes]) -> bytes:
+    """A digest of serialized data, identifying it in caches without keeping the data itself."""
+    if isinstance(data, str):
+        data = data.encode('utf-8', 'surrogatepass')
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+def strict_key(value: Any) -> Hashable:
+    """A key of a value which matches only the keys of values serialized the same way.
+
+    Equality is looser than serialization: `Decimal('1.0') == Decimal('1.00')`, `0.0 == -0.0`, `1 == 1.0 == True`,
+    and the same moment is equal in any time zone. Keys of scalars include their type, floats, decimals and timestamps
+    are keyed by their representation, datetimes and times by their ISO format (including the UTC offset),
+    and immutable containers and frozen dataclasses are keyed by the keys of their items in order.
+    Mutable values are returned as they are, so a key containing them is unhashable.
+    """
+    cls = type(value)
+    if cls is str or value is None:
+        return value
+    if cls is float or cls is Decimal:
+        return cls, repr(value)
+    if isinstance(value, (datetime, time)):
+        return cls, value.isoformat()
+    if cls is Timestamp:
+        return cls, repr(value.value)
+    if isinstance(value, tuple) or cls is PersistentList:
+        return cls, tuple(strict_key(item) for item in value)
+    if cls is frozenset:
+        return cls, frozenset(strict_key(item) for item in value)
+    if cls is FrozenDict or cls is PersistentDict:
+        return cls, tuple((strict_key(k), strict_key(v)) for k, v in value.items())
+    if is_dataclass(value) and cls.__dataclass_params__.frozen:  # type: ignore # checked to be a dataclass
+        return cls, tuple(strict_key(getattr(value, field.name)) for field in fields(value))
+    if isinstance(value, (list, dict, set)) or is_dataclass(value):
+        return value
+    return cls, value
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Part of lookups which found an entry, from 0 to 1."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def __add__(self, other: CacheStats) -> CacheStats:
+        return CacheStats(self.hits + other.hits, self.misses + other.misses, self.evictions + other.evictions)
+
+    @classmethod
+    def total(cls, stats: Iterable[CacheStats]) -> CacheStats:
+        return sum(stats, cls())
+
+
+class LruCache(Generic[V]):
+    """A thread-safe mapping of a limited size, evicting least recently used (or oldest) entries.
+
+    A pickled cache is restored empty.
+    """
+
+    def __init__(self, options: CacheOptions):
+        if options.size < 1:
+            raise ValueError('Cache size must be positive')
+        if options.eviction not in ('lru', 'fifo'):
+            raise ValueError(f'Unknown cache eviction "{options.eviction}"; expecting "lru" or "fifo"')
+        self.options = options
+        self.stats = CacheStats()
+        self._entries: OrderedDict[Hashable, Tuple[V, Optional[float]]] = OrderedDict()
+        self._lock = Lock()
+        self._recency = options.eviction == 'lru'
+
+    def get(self, key: Hashable) -> Any:
+        """Returns the cached value or `MISSING`."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, expires = entry
+                if expires is None or expires > monotonic():
+                    if self._recency:
+                        self._entries.move_to_end(key)
+                    self.stats.hits += 1
+                    return value
+                del self._entries[key]
+            self.stats.misses += 1
+            return MISSING
+
+    def put(self, key: Hashable, value: V) -> None:
+        ttl = self.options.ttl
+        with self._lock:
+            self._entries[key] = (value, None if ttl is None else monotonic() + ttl)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.options.size:
+                self._entries.popitem(last=False)
+                self.stats.evictions += 1
+
+    def discard(self, key: Hashable) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __getstate__(self):
+        # Locks cannot be pickled; a cache is restored empty, e.g. in a worker process.
+        return {'options': self.options}
+
+    def __setstate__(self, state):
+        self.__init__(state['options'])
+
+
+class DumpCache:
+    """Dumped values of immutable objects, found either by object identity or by equality.
+
+    Identity entries hold a weak reference to the object and are removed when it is garbage collected,
+    so an `id` of a collected object is never mistaken for a new one.
+    Equal objects are found by their `strict_key`, so objects which are equal but dumped differently
+    (like ones with `Decimal('1.0')` and `Decimal('1.00')`) do not share an entry.
+    Objects which are unhashable (or cannot be weakly referenced) are not cached. A pickled cache is restored empty.
+    """
+
+    def __init__(self, options: CacheOptions):
+        if options.key not in ('identity', 'hash'):
+            raise ValueError(f'Unknown cache key "{options.key}"; expecting "identity" or "hash"')
+        self._cache: LruCache[Tuple[Any, Any]] = LruCache(options)
+        self._by_identity = options.key == 'identity'
+
+    @property
+    def stats(self) -> CacheStats:
+        return self._cache.stats
+
+    def get(self, o: Any) -> Any:
+        """Returns the dumped value or `MISSING`."""
+        try:
+            entry = self._cache.get(id(o) if self._by_identity else strict_key(o))
+        except TypeError:  # An unhashable key.
+            self._cache.stats.misses += 1
+            return MISSING
+        return entry if entry is MISSING else entry[1]
+
+    def put(self, o: Any, dumped: Any) -> None:
+        try:
+            if self._by_identity:
+                key = id(o)
+                # The reference is dropped together with an evicted entry, so the callback only removes live entries.
+                reference = weakref.ref(o, lambda _: self._cache.discard(key))
+                self._cache.put(key, (reference, dumped))
+            else:
+                self._cache.put(strict_key(o), (None, dumped))
+        except TypeError:
+            pass
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def __getstate__(self):
+        # Identity entries hold weak references, which cannot be pickled (nor can the lock of the cache).
+        return {'options': self._cache.options}
+
+    def __setstate__(self, state):
+        self.__init__(state['options'])
@@ -5,7 +5,6 @@ T = TypeVar('T')
 
 
 def check_is_instance(value: T, type_: Type[T], message: str = None) -> T:
-    message = message or f'Got "{value}" when expecting a "{type_}" instance.'
     if not isinstance(value, type_):
-        raise TypeError(message)
+        raise TypeError(message or f'Got "{value}" when expecting a "{type_}" instance.')
     return value
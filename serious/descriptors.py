@@ -14,9 +14,12 @@ __all__ = ['TypeDescriptor', 'describe', 'DescTypes', 'scan_types']
 
 from collections import ChainMap
 from dataclasses import dataclass, fields, is_dataclass
-from typing import Type, Any, TypeVar, get_type_hints, Dict, Mapping, List, Union, Iterable
+from functools import lru_cache
+from itertools import chain
+from typing import Type, Any, TypeVar, get_type_hints, Dict, Mapping, Union, Iterable, Tuple
 
-from .types import FrozenDict, FrozenList
+from .caches import MISSING, CacheOptions, LruCache
+from .types import FrozenDict, FrozenList, PersistentDict, PersistentList
 
 T = TypeVar('T')
 
@@ -31,12 +34,37 @@ class TypeDescriptor:
     Type descriptors are mostly used for mapping serializers to particular objects.
 
     A proper way of creating a `TypeDescriptor` is using the `serious.descriptors.describe(cls)` factory.
+    It returns the same instance for equal descriptors, so they are mostly compared by identity.
+    The hash is computed once and kept with the descriptor.
     """
     _cls: Type
     parameters: FrozenDict[Any, TypeDescriptor]
     is_optional: bool = False
     is_dataclass: bool = False
 
+    def __hash__(self):
+        try:
+            return self.__dict__['_hash']
+        except KeyError:
+            hash_ = hash((self._cls, self.parameters, self.is_optional, self.is_dataclass))
+            object.__setattr__(self, '_hash', hash_)
+            return hash_
+
+    def __eq__(self, other):
+        if self is other:
+            return True
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (hash(self) == hash(other)
+                and self._cls == other._cls
+                and self.is_optional == other.is_optional
+                and self.is_dataclass == other.is_dataclass
+                and self.parameters == other.parameters)
+
+    def __getstate__(self):
+        # Hashes of classes differ between processes, so the kept hash is not pickled (nor the fields keyed by it).
+        return {key: value for key, value in self.__dict__.items() if key not in ('_hash', '_fields')}
+
     @property
     def cls(self):  # Python fails when providing cls as a keyword parameter to dataclasses
         return self._cls
@@ -45,12 +73,19 @@ class TypeDescriptor:
     def fields(self) -> Mapping[str, TypeDescriptor]:
         """A mapping of all dataclass field names to their corresponding Type Descriptors.
 
-        An empty mapping is returned if the object is not a dataclass."""
+        An empty mapping is returned if the object is not a dataclass.
+        The mapping is resolved once per descriptor."""
+        try:
+            return self.__dict__['_fields']
+        except KeyError:
+            pass
         if not is_dataclass(self.cls):
-            return {}
+            return FrozenDict()
         types = get_type_hints(self.cls)  # type: Dict[str, Type]
         descriptors = {name: self.describe(type_) for name, type_ in types.items()}
-        return {f.name: descriptors[f.name] for f in fields(self.cls)}
+        fields_: FrozenDict[str, TypeDescriptor] = FrozenDict((f.name, descriptors[f.name]) for f in fields(self.cls))
+        object.__setattr__(self, '_fields', fields_)
+        return fields_
 
     def describe(self, type_: Type) -> TypeDescriptor:
         return describe(type_, self.parameters)
@@ -60,12 +95,35 @@ def describe(type_: Type, generic_params: GenericParams = None) -> TypeDescripto
     """Creates a TypeDescriptor for the provided type.
 
     Optionally generic params can be designated as a mapping of TypeVar to parameter Type or indexes in Dict/List/etc.
+    Descriptors of hashable types with frozen params (like `TypeDescriptor.parameters`) are cached,
+    so the recently described types are not described again.
+    The caches are bounded by `CACHE_SIZE`, so classes created at runtime are not kept alive by them.
     """
-    generic_params = generic_params if generic_params is not None else {}
+    generic_params = generic_params if generic_params is not None else _no_params
     param = generic_params.get(type_, None)
     if param is not None:
         return param
-    return _describe_generic(type_, generic_params)
+    if type(generic_params) is not FrozenDict:
+        return _intern(_describe_generic(type_, generic_params))
+    try:
+        return _describe_cached(type_, generic_params)
+    except TypeError:  # Unhashable annotations.
+        return _intern(_describe_generic(type_, generic_params))
+
+
+CACHE_SIZE = 4096
+_no_params: FrozenDict = FrozenDict()
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _describe_cached(type_: Type, generic_params: FrozenDict) -> TypeDescriptor:
+    return _intern(_describe_generic(type_, generic_params))
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _intern(desc: TypeDescriptor) -> TypeDescriptor:
+    """Returns the first created descriptor equal to the provided one, while it is kept in the cache."""
+    return desc
 
 
 _any_type_desc = TypeDescriptor(Any, FrozenDict())  # type: ignore
@@ -75,6 +133,8 @@ _generic_params: Dict[Type, Dict[int, TypeDescriptor]] = {
     frozenset: {0: _any_type_desc},
     tuple: {0: _any_type_desc, 1: TypeDescriptor(Ellipsis, FrozenDict())},  # type: ignore
     dict: {0: _any_type_desc, 1: _any_type_desc},
+    PersistentList: {0: _any_type_desc},
+    PersistentDict: {0: _any_type_desc, 1: _any_type_desc},
 }
 
 
@@ -145,20 +205,6 @@ class DescTypes:
     def __init__(self, types: Iterable[Type]):
         super().__setattr__('types', FrozenList(types))
 
-    @classmethod
-    def scan(cls, desc: TypeDescriptor, *, known: List[TypeDescriptor]) -> 'DescTypes':
-        if desc in known:
-            return _empty_desc_types
-        known.append(desc)
-        dts = []  # type: List[DescTypes]
-        for param in desc.parameters.values():
-            dts.append(cls.scan(param, known=known))
-        for child_desc in desc.fields.values():
-            dts.append(cls.scan(child_desc, known=known))
-        types = [type_ for dt in dts for type_ in dt.types]
-        types.append(desc.cls)
-        return cls(types)
-
     def __setattr__(self, key, value):
         raise AttributeError('Attempt to modify an immutable object')
 
@@ -172,8 +218,50 @@ _empty_desc_types = DescTypes({})
 def scan_types(desc: TypeDescriptor) -> DescTypes:
     """Create a `DescTypes` object for the provided descriptor.
 
-    `DescTypes` allow checks of the descriptor tree."""
-    return DescTypes.scan(desc, known=[])
+    `DescTypes` allow checks of the descriptor tree.
+    The trees of the last `CACHE_SIZE` scanned descriptors are cached, including the subtrees scanned along,
+    so models of nested dataclasses do not scan their trees again."""
+    types = _scanned.get(desc)
+    if types is MISSING:
+        types, _ = _scan(desc, path={}, incomplete={})
+        _scanned.put(desc, types)
+    return types
+
+
+_scanned: LruCache[DescTypes] = LruCache(CacheOptions(size=CACHE_SIZE))
+
+
+def _scan(
+        desc: TypeDescriptor,
+        path: Dict[TypeDescriptor, int],
+        incomplete: Dict[TypeDescriptor, DescTypes],
+) -> Tuple[DescTypes, int]:
+    """Scans the tree of a descriptor, with the descriptors being scanned mapped to their depth in `path`.
+
+    Returns the types with the depth of the highest descriptor in `path` the tree leads back to.
+    Trees not leading above their root have all of their types, so they are cached. Types of the others
+    are completed by their ancestors; they are kept in `incomplete` to be scanned once per tree."""
+    types = _scanned.get(desc)
+    if types is not MISSING:
+        return types, len(path)
+    if desc in path:
+        return _empty_desc_types, path[desc]
+    if desc in incomplete:
+        return incomplete[desc], 0
+    depth = path[desc] = len(path)
+    reached = depth
+    children = []
+    for child in chain(desc.parameters.values(), desc.fields.values()):
+        child_types, child_reached = _scan(child, path, incomplete)
+        children.append(child_types.types)
+        reached = min(reached, child_reached)
+    del path[desc]
+    types = DescTypes(dict.fromkeys(chain(chain.from_iterable(children), (desc.cls,))))
+    if reached < depth:
+        incomplete[desc] = types
+    else:
+        _scanned.put(desc, types)
+    return types, reached
 
 
 def _is_optional(cls: Type) -> bool:
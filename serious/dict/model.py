@@ -3,12 +3,17 @@ from __future__ import annotations
 
 __all__ = ['DictModel']
 
-from typing import TypeVar, Type, Generic, List, Collection, Dict, Iterable, Any, Union
+from typing import TypeVar, Type, Generic, List, Collection, Dict, Iterable, Any, Union, Optional, TYPE_CHECKING
 
+from serious.caches import CacheOptions, CacheStats
 from serious.descriptors import describe, TypeDescriptor
-from serious.serialization import FieldSerializer, SeriousModel, field_serializers
+from serious.serialization import FieldSerializer, SeriousModel, field_serializers, LazyProxy
+from serious.slicing import load_sliced, DEFAULT_TIME_BUDGET
 from serious.utils import class_path
 
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
 T = TypeVar('T')
 
 
@@ -51,6 +56,10 @@ class DictModel(Generic[T]):
             validate_on_load: bool = True,
             validate_on_dump: bool = False,
             ensure_frozen: Union[bool, Iterable[Type]] = False,
+            intern_strings: Union[bool, int] = False,
+            canonicalize: Union[bool, Iterable[Type]] = False,
+            dump_cache: Union[bool, int, CacheOptions] = False,
+            scalar_cache: Union[bool, int, CacheOptions] = False,
     ):
         """Initialize a dictionary model.
 
@@ -64,6 +73,15 @@ class DictModel(Generic[T]):
         :param validate_on_dump: to call object `__validate__` before dumping.
         :param ensure_frozen: `False` to skip check of model immutability; `True` will perform the check
                 against built-in immutable types; a list of custom immutable types is added to built-ins.
+        :param intern_strings: `True` to share repeated loaded strings via `sys.intern`; a number to share them
+                via a table of this many strings kept by the model; `False` to keep each loaded string separate.
+        :param canonicalize: `True` to share a single instance between equal loaded objects of frozen dataclasses;
+                a list of frozen dataclasses to share only their instances.
+        :param dump_cache: `True` to reuse dumps of frozen dataclasses containing only immutable values
+                when the same objects are dumped again; a number to set the cache size (per dataclass);
+                `CacheOptions` to also configure keys and eviction.
+        :param scalar_cache: `True` to reuse UUID, decimal, date/time and enum values when the same raw values
+                are loaded again; a number to set the cache size (per field); `CacheOptions` to also set eviction and TTL.
         """
         self.cls = cls
         self.descriptor = describe(cls)
@@ -76,24 +94,97 @@ class DictModel(Generic[T]):
             validate_on_load=validate_on_load,
             validate_on_dump=validate_on_dump,
             ensure_frozen=ensure_frozen,
+            intern_strings=intern_strings,
+            canonicalize=canonicalize,
+            dump_cache=dump_cache,
+            scalar_cache=scalar_cache,
         )
 
-    def load(self, data: Dict[str, Any]) -> T:
-        """Load dataclass from a dictionary."""
+    def load(self, data: Dict[str, Any], *, only: Optional[Iterable[str]] = None) -> T:
+        """Load dataclass from a dictionary.
+
+        :param only: dotted paths of fields to load (like `{'id', 'owner.name'}`), skipping all other fields.
+                The result is then an instance of a frozen dataclass generated for the selected fields.
+        """
+        if only is not None:
+            return self.serious_model.projection(only).load(data)
         return self.serious_model.load(data)
 
-    def load_many(self, items: Iterable[Dict[str, Any]]) -> List[T]:
-        """Load a list of dataclasses from a dictionary."""
+    def load_lazy(self, data: Dict[str, Any]) -> LazyProxy[T]:
+        """Check the keys of the dictionary and return a proxy loading dataclass fields on first access.
+
+        Call `materialize()` on the proxy to get the dataclass instance.
+        """
+        return self.serious_model.load_lazy(data)
+
+    def load_many(self, items: Iterable[Dict[str, Any]], *, only: Optional[Iterable[str]] = None) -> List[T]:
+        """Load a list of dataclasses from a dictionary.
+
+        :param only: dotted paths of fields to load, as in `load`.
+        """
+        if only is not None:
+            return list(map(self.serious_model.projection(only).load, items))
         return [self.load(each) for each in items]
 
-    def dump(self, o: T) -> Dict[str, Any]:
-        """Dump a dataclasses to a dictionary."""
-        return self.serious_model.dump(o)
+    async def aload_many(
+            self,
+            items: Iterable[Dict[str, Any]],
+            *,
+            time_budget: Optional[float] = DEFAULT_TIME_BUDGET,
+            item_budget: Optional[int] = None,
+            executor: Optional[Executor] = None,
+    ) -> List[T]:
+        """Load a list of dataclasses in slices, letting other tasks of the event loop run between the slices.
+
+        :param items: dictionaries to load.
+        :param time_budget: seconds a slice may block the loop for; `None` to bound slices only by item count.
+        :param item_budget: maximum number of items in a slice; `None` to bound slices only by time.
+        :param executor: a thread pool to run the slices in, instead of the event loop thread.
+        """
+        return await load_sliced(self.load, items,
+                                 time_budget=time_budget, item_budget=item_budget, executor=executor)
+
+    def dump(self, o: T, *, include: Optional[Iterable[str]] = None, exclude: Optional[Iterable[str]] = None) \
+            -> Dict[str, Any]:
+        """Dump a dataclasses to a dictionary.
+
+        :param include: dotted paths of fields to dump (like `{'id', 'owner.name'}`); `None` to dump all fields.
+        :param exclude: dotted paths of fields to leave out; serializers of left out fields are not called.
+        """
+        return self.serious_model.dump(o, include=include, exclude=exclude)
+
+    def dump_many(
+            self,
+            items: Collection[T],
+            *,
+            include: Optional[Iterable[str]] = None,
+            exclude: Optional[Iterable[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Dump a list dataclasses to a dictionary.
 
-    def dump_many(self, items: Collection[T]) -> List[Dict[str, Any]]:
-        """Dump a list dataclasses to a dictionary."""
+        :param include: dotted paths of fields to dump, as in `dump`.
+        :param exclude: dotted paths of fields to leave out, as in `dump`.
+        """
+        if include is not None or exclude is not None:
+            return list(map(self.serious_model.mask(include, exclude).dump, items))
         return [self.dump(o) for o in items]
 
+    def scalar_cache_stats(self) -> CacheStats:
+        """Hits, misses and evictions of the caches of loaded scalar values."""
+        return self.serious_model.scalar_cache_stats()
+
+    def dump_cache_stats(self) -> CacheStats:
+        """Hits, misses and evictions of the dump caches of the model dataclasses."""
+        return self.serious_model.dump_cache_stats()
+
+    def dump_diff(self, old: T, new: T) -> Dict[str, Any]:
+        """Dump fields of `new` which differ from `old` to a dictionary keyed by dotted paths (like `"owner.name"`)."""
+        return self.serious_model.dump_diff(old, new)
+
+    def apply_diff(self, o: T, diff: Dict[str, Any]) -> T:
+        """Return a copy of the dataclass with the changes from `dump_diff` applied."""
+        return self.serious_model.apply_diff(o, diff)
+
     def __repr__(self):
         path = class_path(type(self))
         if path == 'serious.dict.model.DictModel':
@@ -23,10 +23,12 @@ __all__ = [
     'ModelContainsAny',
     'ModelContainsUnion',
     'MutableTypesInModel',
+    'InvalidFieldPath',
+    'ReservedFieldName',
     'ValidationError',
 ]
 
-from typing import Type, Mapping, Collection, TYPE_CHECKING, Iterable
+from typing import Any, Type, Collection, TYPE_CHECKING, Iterable
 
 from .utils import class_path, Dataclass
 
@@ -65,7 +67,7 @@ class LoadError(SerializationError):
     Either invalid data is supplied, or the serializers are handling data incorrectly.
     """
 
-    def __init__(self, cls: Type, serializer_stack: Collection[SerializationStep], data: Mapping):
+    def __init__(self, cls: Type, serializer_stack: Collection[SerializationStep], data: Any):
         super().__init__(cls, serializer_stack)
         self._data = data
 
@@ -181,6 +183,33 @@ class MutableTypesInModel(ModelError):
                 f'Alternatively, allow mutable fields by passing `ensure_frozen=False` to model. ')
 
 
+class InvalidFieldPath(ModelError):
+    """A dotted field path (like `"owner.name"`) does not match the dataclass fields."""
+
+    def __init__(self, cls: Type, path: str, reason: str):
+        super().__init__(cls)
+        self.path = path
+        self.reason = reason
+
+    @property
+    def message(self):
+        return f'Invalid field path "{self.path}" of {class_path(self.cls)}: {self.reason}'
+
+
+class ReservedFieldName(ModelError):
+    """A dataclass field name is taken by an attribute of objects standing in for the dataclass (proxies, views)."""
+
+    def __init__(self, cls: Type, field: str, reserved_by: str):
+        super().__init__(cls)
+        self.field = field
+        self.reserved_by = reserved_by
+
+    @property
+    def message(self):
+        return (f'{class_path(self.cls)} field "{self.field}" clashes with an attribute of {self.reserved_by}. '
+                f'Rename the field.')
+
+
 class ValidationError(Exception):
     """An error manifesting an invalid object state.
 
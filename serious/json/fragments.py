@@ -0,0 +1,175 @@
+"""Encoding dataclasses to JSON while reusing encoded text of frozen nested dataclasses.
+
+A dataclass is encoded as a JSON object spliced from parts: runs of plain fields are dumped and encoded together,
+while nested dataclasses are encoded separately. Encoded text of a frozen dataclass containing only immutable values
+is kept in a cache, so dumping the same object again skips both its serializers and the JSON encoder.
+"""
+from __future__ import annotations
+
+__all__ = ['JsonFragments']
+
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Union
+
+from serious.caches import CacheOptions, CacheStats, DumpCache, MISSING
+from serious.checks import check_is_instance
+from serious.descriptors import TypeDescriptor, scan_types
+from serious.errors import ValidationError, DumpError
+from serious.serialization import SeriousModel, Dumping, DataclassSerializer, OptionalSerializer, \
+    CollectionSerializer
+from serious.serialization.check_immutable import is_frozen_dc
+from serious.serialization.serializer import Serializer, Dumper
+from serious.validation import validate
+
+
+class _Field(NamedTuple):
+    name: str
+    key: str
+    step: str
+    serializer: Serializer
+
+
+class _FieldRun(NamedTuple):
+    """Consecutive fields dumped to a dictionary and encoded at once."""
+    fields: List[_Field]
+
+
+class _NestedField(NamedTuple):
+    """A dataclass field encoded to a separate fragment."""
+    name: str
+    prefix: str
+    step: str
+    serializer: Dumper
+
+
+class JsonFragments:
+    """Encodes dataclasses of a model, caching the text of deeply frozen dataclasses.
+
+    :param model: the model of the root dataclass.
+    :param options: options of the cache created for every deeply frozen dataclass.
+    :param encode: a function encoding dumped values to JSON; objects are spliced with `", "` and `": "` separators.
+    """
+
+    def __init__(self, model: SeriousModel, options: CacheOptions, encode: Callable[[Any], str]):
+        self.options = options
+        self.encode = encode
+        self._encoders: Dict[TypeDescriptor, _ObjectEncoder] = {}
+        self._root = self.encoder(model)
+
+    def dump(self, o: Any) -> str:
+        """Dumps a dataclass object to a JSON string."""
+        check_is_instance(o, self._root.model.cls)
+        dumping = Dumping(validating=False)
+        try:
+            return self._root.encode(o, dumping)
+        except ValidationError:
+            raise
+        except Exception as e:
+            raise DumpError(o, dumping.stack) from e
+
+    def encoder(self, model: SeriousModel) -> _ObjectEncoder:
+        encoder = self._encoders.get(model.descriptor)
+        if encoder is None:
+            encoder = _ObjectEncoder(self, model)
+            self._encoders[model.descriptor] = encoder
+        return encoder
+
+    def stats(self) -> CacheStats:
+        """Hits, misses and evictions of the caches of all frozen dataclasses."""
+        return CacheStats.total(encoder.cache.stats for encoder in self._encoders.values() if encoder.cache is not None)
+
+
+class _ObjectEncoder:
+    """Encodes objects of a single dataclass; the plan is compiled on first use to allow recursive dataclasses."""
+
+    def __init__(self, fragments: JsonFragments, model: SeriousModel):
+        self.fragments = fragments
+        self.model = model
+        self.cache = DumpCache(fragments.options) if model.deeply_frozen else None
+        self._plan: Optional[List[Union[_FieldRun, _NestedField]]] = None
+
+    def encode(self, o: Any, ctx: Dumping) -> str:
+        cache = self.cache
+        if cache is not None:
+            cached = cache.get(o)
+            if cached is not MISSING:
+                return cached
+        if self.model.validate_on_dump:
+            validate(o)
+        encode = self.fragments.encode
+        parts = []
+        for part in self._plan or self._compile():
+            if isinstance(part, _NestedField):
+                parts.append(part.prefix + ctx.run(part.step, part.serializer, getattr(o, part.name)))
+            else:
+                dumped = {key: ctx.run(step, serializer, getattr(o, name))
+                          for name, key, step, serializer in part.fields}
+                parts.append(encode(dumped)[1:-1])
+        text = '{' + ', '.join(parts) + '}'
+        if cache is not None:
+            cache.put(o, text)
+        return text
+
+    def _compile(self) -> List[Union[_FieldRun, _NestedField]]:
+        plan: List[Union[_FieldRun, _NestedField]] = []
+        for name, serializer in self.model.serializers_by_field.items():
+            key = self.model.keys.to_serialized(name)
+            fragment = _fragment(self.fragments, serializer)
+            if fragment is not None:
+                plan.append(_NestedField(name, self.fragments.encode(key) + ': ', f'.{key}', fragment))
+            else:
+                if not plan or type(plan[-1]) is not _FieldRun:
+                    plan.append(_FieldRun([]))
+                plan[-1].fields.append(_Field(name, key, f'.{key}', serializer))  # type: ignore # checked above
+        self._plan = plan
+        return plan
+
+
+class _Fragment(Dumper):
+    """Encodes a nested dataclass field to JSON text."""
+
+    def __init__(self, fragments: JsonFragments, model: SeriousModel):
+        self.fragments = fragments
+        self.model = model
+
+    def dump(self, value: Any, ctx: Dumping) -> str:
+        return self.fragments.encoder(self.model).encode(value, ctx)
+
+
+class _OptionalFragment(Dumper):
+    """Encodes an optional field value with a fragment serializer."""
+
+    def __init__(self, serializer: Dumper):
+        self.serializer = serializer
+
+    def dump(self, value: Any, ctx: Dumping) -> str:
+        if value is None:
+            return 'null'
+        return self.serializer.dump(value, ctx)
+
+
+class _FragmentList(Dumper):
+    """Encodes a collection of dataclasses to a JSON array of fragments."""
+
+    def __init__(self, item: Dumper):
+        self.item = item
+
+    def dump(self, value: Any, ctx: Dumping) -> str:
+        item = self.item
+        return '[' + ', '.join([ctx.run(f'[{i}]', item, each) for i, each in enumerate(value)]) + ']'
+
+
+def _fragment(fragments: JsonFragments, serializer: Serializer) -> Optional[Dumper]:
+    """A serializer encoding a field to a fragment, for (optional) dataclasses and their collections
+    containing frozen dataclasses; `None` for fields dumped and encoded as usual.
+    """
+    if type(serializer) is OptionalSerializer:
+        inner = _fragment(fragments, serializer._serializer)  # type: ignore # checked above
+        return _OptionalFragment(inner) if inner is not None else None
+    if type(serializer) is CollectionSerializer:
+        inner = _fragment(fragments, serializer._serializer)  # type: ignore # checked above
+        return _FragmentList(inner) if inner is not None else None
+    if type(serializer) is DataclassSerializer:
+        model: SeriousModel = serializer._serializer  # type: ignore # checked above
+        if any(is_frozen_dc(type_) for type_ in scan_types(model.descriptor).types):
+            return _Fragment(fragments, model)
+    return None
@@ -4,13 +4,21 @@ from __future__ import annotations
 __all__ = ['JsonModel']
 
 import json
-from typing import Optional, TypeVar, Type, Generic, List, MutableMapping, Collection, Iterable, Any, Union
+from typing import Optional, TypeVar, Type, Generic, List, MutableMapping, Collection, Iterable, Any, Union, \
+    AsyncIterator, AsyncIterable, TYPE_CHECKING
 
+from serious.caches import CacheOptions, CacheStats, LruCache, cache_options, content_key, MISSING
 from serious.descriptors import describe
-from serious.serialization import FieldSerializer, SeriousModel, field_serializers, KeyMapper
+from serious.serialization import FieldSerializer, SeriousModel, field_serializers, KeyMapper, LazyProxy
+from serious.slicing import load_sliced, DEFAULT_TIME_BUDGET
 from serious.utils import class_path
 from serious.json.utils import camel_to_snake, snake_to_camel
+from .fragments import JsonFragments
 from .checks import check_that_loading_an_object, check_that_loading_a_list
+from .streams import iter_values, write_values
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
 
 T = TypeVar('T')
 
@@ -52,6 +60,12 @@ class JsonModel(Generic[T]):
             validate_on_load: bool = True,
             validate_on_dump: bool = False,
             ensure_frozen: Union[bool, Iterable[Type]] = False,
+            intern_strings: Union[bool, int] = False,
+            canonicalize: Union[bool, Iterable[Type]] = False,
+            dump_cache: Union[bool, int, CacheOptions] = False,
+            scalar_cache: Union[bool, int, CacheOptions] = False,
+            fragment_cache: Union[bool, int, CacheOptions] = False,
+            load_cache: Union[bool, int, CacheOptions] = False,
             camel_case: bool = True,
             indent: Optional[int] = None,
     ):
@@ -67,6 +81,21 @@ class JsonModel(Generic[T]):
         :param validate_on_load: to call object `__validate__` before dumping.
         :param ensure_frozen: `False` to skip check of model immutability; `True` will perform the check
                 against built-in immutable types; a list of custom immutable types is added to built-ins.
+        :param intern_strings: `True` to share repeated loaded strings via `sys.intern`; a number to share them
+                via a table of this many strings kept by the model; `False` to keep each loaded string separate.
+        :param canonicalize: `True` to share a single instance between equal loaded objects of frozen dataclasses;
+                a list of frozen dataclasses to share only their instances.
+        :param dump_cache: `True` to reuse dumps of frozen dataclasses containing only immutable values
+                when the same objects are dumped again; a number to set the cache size (per dataclass);
+                `CacheOptions` to also configure keys and eviction.
+        :param scalar_cache: `True` to reuse UUID, decimal, date/time and enum values when the same raw values
+                are loaded again; a number to set the cache size (per field); `CacheOptions` to also set eviction and TTL.
+        :param fragment_cache: `True` to reuse encoded JSON of frozen dataclasses containing only immutable values
+                when the same objects are dumped again; a number or `CacheOptions` as in `dump_cache`.
+                Cannot be combined with `indent`.
+        :param load_cache: `True` to return the previously loaded object when `load` gets the same JSON again;
+                a number to set the cache size; `CacheOptions` to also set a TTL and eviction.
+                Only for frozen dataclasses containing only immutable values.
         :param camel_case: `True` to transform dataclass "snake_case" to JSON "camelCase".
         :param indent: number of spaces JSON output will be indented by; `None` for most compact representation.
         """
@@ -81,32 +110,186 @@ class JsonModel(Generic[T]):
             validate_on_load=validate_on_load,
             validate_on_dump=validate_on_dump,
             ensure_frozen=ensure_frozen,
+            intern_strings=intern_strings,
+            canonicalize=canonicalize,
+            dump_cache=dump_cache,
+            scalar_cache=scalar_cache,
             key_mapper=JsonKeyMapper() if camel_case else None,
         )
         self._dump_indentation = indent
+        self._fragments: Optional[JsonFragments] = None
+        fragment_options = cache_options(fragment_cache)
+        if fragment_options is not None:
+            if indent is not None:
+                raise ValueError('Cached JSON fragments cannot be indented; use `fragment_cache` without `indent`')
+            self._fragments = JsonFragments(self.serious_model, fragment_options, self._dump_to_str)
+        self._load_cache: Optional[LruCache[T]] = None
+        load_options = cache_options(load_cache)
+        if load_options is not None:
+            if not self.serious_model.deeply_frozen:
+                raise ValueError(f'Only frozen dataclasses with immutable fields can be cached on load, got {cls}')
+            self._load_cache = LruCache(load_options)
+
+    def load(self, json_: str, *, only: Optional[Iterable[str]] = None) -> T:
+        """Load a dataclass from a JSON string.
 
-    def load(self, json_: str) -> T:
-        """Load a dataclass from a JSON string."""
+        :param only: dotted paths of fields to load (like `{'id', 'owner.name'}`), skipping all other fields.
+                The result is then an instance of a frozen dataclass generated for the selected fields.
+        """
+        cache = self._load_cache if only is None else None
+        if cache is not None:
+            key = content_key(json_)
+            cached = cache.get(key)
+            if cached is not MISSING:
+                return cached
         data: MutableMapping = self._load_from_str(json_)
         check_that_loading_an_object(data, self.cls)
-        return self.serious_model.load(data)
+        if only is not None:
+            return self.serious_model.projection(only).load(data)
+        result = self.serious_model.load(data)
+        if cache is not None:
+            cache.put(key, result)
+        return result
 
-    def load_many(self, json_: str) -> List[T]:
-        """Load a list of dataclasses from a JSON string."""
+    def load_lazy(self, json_: str) -> LazyProxy[T]:
+        """Decode a JSON object and return a proxy loading dataclass fields on first access.
+
+        Call `materialize()` on the proxy to get the dataclass instance.
+        """
+        data: MutableMapping = self._load_from_str(json_)
+        check_that_loading_an_object(data, self.cls)
+        return self.serious_model.load_lazy(data)
+
+    def load_many(self, json_: str, *, only: Optional[Iterable[str]] = None) -> List[T]:
+        """Load a list of dataclasses from a JSON string.
+
+        :param only: dotted paths of fields to load, as in `load`.
+        """
         data: Collection = self._load_from_str(json_)
         check_that_loading_a_list(data, self.cls)
+        if only is not None:
+            return list(map(self.serious_model.projection(only).load, data))
         return [self.serious_model.load(each) for each in data]
 
-    def dump(self, o: T) -> str:
-        """Dump a single dataclass to a JSON string."""
-        as_dict = self.serious_model.dump(o)
+    async def aload_many(
+            self,
+            json_: str,
+            *,
+            time_budget: Optional[float] = DEFAULT_TIME_BUDGET,
+            item_budget: Optional[int] = None,
+            executor: Optional[Executor] = None,
+    ) -> List[T]:
+        """Load a list of dataclasses from a JSON string in slices,
+        letting other tasks of the event loop run between the slices.
+
+        The JSON string is decoded at once; slicing applies to constructing the dataclasses.
+
+        :param json_: a JSON array of objects.
+        :param time_budget: seconds a slice may block the loop for; `None` to bound slices only by item count.
+        :param item_budget: maximum number of items in a slice; `None` to bound slices only by time.
+        :param executor: a thread pool to run the slices in, instead of the event loop thread.
+        """
+        data: Collection = self._load_from_str(json_)
+        check_that_loading_a_list(data, self.cls)
+        return await load_sliced(self.serious_model.load, data,
+                                 time_budget=time_budget, item_budget=item_budget, executor=executor)
+
+    def dump(self, o: T, *, include: Optional[Iterable[str]] = None, exclude: Optional[Iterable[str]] = None) -> str:
+        """Dump a single dataclass to a JSON string.
+
+        :param include: dotted paths of fields to dump (like `{'id', 'owner.name'}`); `None` to dump all fields.
+        :param exclude: dotted paths of fields to leave out; serializers of left out fields are not called.
+        """
+        if self._fragments is not None and include is None and exclude is None:
+            return self._fragments.dump(o)
+        as_dict = self.serious_model.dump(o, include=include, exclude=exclude)
         return self._dump_to_str(as_dict)
 
-    def dump_many(self, items: Collection[T]) -> str:
-        """Dump a list of dataclasses to a JSON string."""
-        as_dicts = [self.serious_model.dump(o) for o in items]
+    def dump_many(
+            self,
+            items: Collection[T],
+            *,
+            include: Optional[Iterable[str]] = None,
+            exclude: Optional[Iterable[str]] = None,
+    ) -> str:
+        """Dump a list of dataclasses to a JSON string.
+
+        :param include: dotted paths of fields to dump, as in `dump`.
+        :param exclude: dotted paths of fields to leave out, as in `dump`.
+        """
+        if include is not None or exclude is not None:
+            as_dicts = list(map(self.serious_model.mask(include, exclude).dump, items))
+        elif self._fragments is not None:
+            return '[' + ', '.join(map(self._fragments.dump, items)) + ']'
+        else:
+            as_dicts = [self.serious_model.dump(o) for o in items]
         return self._dump_to_str(as_dicts)
 
+    def scalar_cache_stats(self) -> CacheStats:
+        """Hits, misses and evictions of the caches of loaded scalar values."""
+        return self.serious_model.scalar_cache_stats()
+
+    def dump_cache_stats(self) -> CacheStats:
+        """Hits, misses and evictions of the dump caches of the model dataclasses."""
+        return self.serious_model.dump_cache_stats()
+
+    def load_cache_stats(self) -> CacheStats:
+        """Hits, misses and evictions of the cache of loaded objects."""
+        return self._load_cache.stats if self._load_cache is not None else CacheStats()
+
+    def fragment_cache_stats(self) -> CacheStats:
+        """Hits, misses and evictions of the caches of encoded JSON fragments."""
+        return self._fragments.stats() if self._fragments is not None else CacheStats()
+
+    def dump_diff(self, old: T, new: T) -> str:
+        """Dump fields of `new` which differ from `old` to a JSON object keyed by dotted paths (like `"owner.name"`)."""
+        return self._dump_to_str(self.serious_model.dump_diff(old, new))
+
+    def apply_diff(self, o: T, diff: str) -> T:
+        """Return a copy of the dataclass with the changes from a `dump_diff` JSON string applied."""
+        data: MutableMapping = self._load_from_str(diff)
+        check_that_loading_an_object(data, self.cls)
+        return self.serious_model.apply_diff(o, data)
+
+    async def aiter_load(self, reader: Any, *, chunk_size: int = 2 ** 16) -> AsyncIterator[T]:
+        """Asynchronously load dataclasses from a stream, yielding each as soon as it is read.
+
+        The stream may contain either a JSON array of objects or newline-delimited JSON (one object per line).
+
+        :param reader: an `asyncio.StreamReader` or any object with an async `read(n)` method returning bytes.
+        :param chunk_size: number of bytes read from the stream at once.
+        """
+        async for data in iter_values(reader, chunk_size):
+            check_that_loading_an_object(data, self.cls)
+            yield self.serious_model.load(data)
+
+    async def adump_to(
+            self,
+            writer: Any,
+            items: Union[Iterable[T], AsyncIterable[T]],
+            *,
+            array: bool = False,
+            chunk_size: int = 2 ** 16,
+    ) -> None:
+        """Asynchronously dump dataclasses to a stream, awaiting `drain()` after each written chunk.
+
+        :param writer: an `asyncio.StreamWriter` or any object with `write(data)` and async `drain()` methods.
+        :param items: dataclasses to dump; an async iterable is consumed as items arrive.
+        :param array: `True` to write a JSON array; `False` to write newline-delimited JSON.
+        :param chunk_size: number of bytes accumulated before writing them to the stream.
+        """
+        if not array and self._dump_indentation is not None:
+            raise ValueError('Newline-delimited JSON cannot be indented; use `array=True` or a model without indent')
+        await write_values(writer, self._aiter_dump(items), array=array, chunk_size=chunk_size)
+
+    async def _aiter_dump(self, items: Union[Iterable[T], AsyncIterable[T]]) -> AsyncIterator[str]:
+        if isinstance(items, AsyncIterable):
+            async for o in items:
+                yield self.dump(o)
+        else:
+            for o in items:
+                yield self.dump(o)
+
     def _load_from_str(self, json_: str) -> Any:
         """Override to customize JSON loading behaviour."""
         return json.loads(json_)
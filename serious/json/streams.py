@@ -0,0 +1,196 @@
+"""Incremental reading and writing of JSON documents over asyncio streams.
+
+Two layouts are supported: a JSON array of values and newline-delimited JSON (one value per line).
+Readers only need an async `read(n)` method (like `asyncio.StreamReader`), writers need
+`write(data)` and an async `drain()` (like `asyncio.StreamWriter`).
+"""
+from __future__ import annotations
+
+__all__ = ['iter_values', 'write_values']
+
+import codecs
+import json
+from typing import Any, AsyncIterator, AsyncIterable
+
+from .errors import UnexpectedJson
+
+_decoder = json.JSONDecoder()
+_WHITESPACE = ' \t\n\r'
+_LONGEST_TOKEN = len('-Infinity')  # Errors closer to the end of text may be caused by a token cut by a chunk.
+
+
+class _Buffer:
+    """Text decoded from a stream which is not consumed yet."""
+
+    def __init__(self, reader: Any, chunk_size: int):
+        self.reader = reader
+        self.chunk_size = chunk_size
+        self.text = ''
+        self.position = 0
+        self.eof = False
+        self._utf8 = codecs.getincrementaldecoder('utf-8')()
+
+    async def fill(self, at_least: int = 0) -> bool:
+        """Read the next chunks of the stream, at least `at_least` bytes if the stream has them.
+
+        Callers waiting for the end of a long value pass the length of the pending text,
+        so the text is at least doubled on each call, and the value is decoded a logarithmic number of times.
+        Returns `False` if the stream is exhausted.
+        """
+        if self.eof:
+            return False
+        chunks = []
+        read = 0
+        while True:
+            chunk = await self.reader.read(self.chunk_size)
+            if not chunk:
+                self.eof = True
+                break
+            chunks.append(chunk)
+            read += len(chunk)
+            if read >= at_least:
+                break
+        self.text = self.text[self.position:] + self._utf8.decode(b''.join(chunks), final=self.eof)
+        self.position = 0
+        return read > 0
+
+    @property
+    def pending(self) -> int:
+        """Length of the text not consumed yet."""
+        return len(self.text) - self.position
+
+    async def skip_whitespace(self) -> str:
+        """Move to the next non-whitespace character and return it, or an empty string at the end of stream."""
+        while True:
+            text = self.text
+            position = self.position
+            while position < len(text) and text[position] in _WHITESPACE:
+                position += 1
+            self.position = position
+            if position < len(text):
+                return text[position]
+            if not await self.fill():
+                return ''
+
+
+async def iter_values(reader: Any, chunk_size: int = 2 ** 16) -> AsyncIterator[Any]:
+    """Decode JSON values from a stream as soon as each of them is read completely.
+
+    The layout is detected by the first character: a stream starting with `[` is read as a JSON array,
+    otherwise as newline-delimited JSON.
+
+    :raises UnexpectedJson: if the stream contains invalid JSON.
+    """
+    buffer = _Buffer(reader, chunk_size)
+    first = await buffer.skip_whitespace()
+    if first == '[':
+        buffer.position += 1
+        values = _iter_array(buffer)
+    else:
+        values = _iter_lines(buffer)
+    async for value in values:
+        yield value
+
+
+async def _iter_lines(buffer: _Buffer) -> AsyncIterator[Any]:
+    while True:
+        text = buffer.text
+        end = text.rfind('\n', buffer.position)
+        if end != -1:
+            lines = text[buffer.position:end]
+            buffer.position = end + 1
+            for line in lines.split('\n'):
+                if line and not line.isspace():
+                    yield _decode(line)
+        if not await buffer.fill(buffer.pending):
+            last = buffer.text[buffer.position:]
+            if last and not last.isspace():
+                yield _decode(last)
+            return
+
+
+async def _iter_array(buffer: _Buffer) -> AsyncIterator[Any]:
+    expecting = 'value or end'
+    while True:
+        next_character = await buffer.skip_whitespace()
+        if not next_character:
+            raise UnexpectedJson('Unexpected end of JSON array.')
+        if next_character == ']' and expecting != 'value':
+            buffer.position += 1
+            if await buffer.skip_whitespace():
+                raise UnexpectedJson('Extra data after the end of JSON array.')
+            return
+        if expecting == 'separator':
+            if next_character != ',':
+                raise UnexpectedJson(f'Expecting "," between array values, got {next_character!r}.')
+            buffer.position += 1
+            expecting = 'value'
+            continue
+        yield await _decode_next(buffer)
+        expecting = 'separator'
+
+
+async def _decode_next(buffer: _Buffer) -> Any:
+    while True:
+        try:
+            value, end = _decoder.raw_decode(buffer.text, buffer.position)
+        except json.JSONDecodeError as e:
+            if _incomplete(e) and await buffer.fill(buffer.pending):
+                continue
+            raise UnexpectedJson(str(e)) from e
+        # A number at the end of the buffer may continue in the next chunk.
+        if end < len(buffer.text) or buffer.eof:
+            buffer.position = end
+            return value
+        await buffer.fill(buffer.pending)
+
+
+def _incomplete(error: json.JSONDecodeError) -> bool:
+    """The error may be caused by the value continuing past the end of text, rather than by invalid JSON."""
+    return error.pos >= len(error.doc) - _LONGEST_TOKEN or error.msg.startswith('Unterminated string')
+
+
+def _decode(line: str) -> Any:
+    try:
+        return json.loads(line)
+    except json.JSONDecodeError as e:
+        raise UnexpectedJson(str(e)) from e
+
+
+async def write_values(
+        writer: Any,
+        encoded: AsyncIterable[str],
+        *,
+        array: bool,
+        chunk_size: int = 2 ** 16,
+) -> None:
+    """Write JSON-encoded values to a stream, waiting for the stream to drain each time a chunk is written.
+
+    :param writer: a stream with `write(data)` and async `drain()`.
+    :param encoded: JSON strings of the values.
+    :param array: `True` to write a JSON array; `False` to write each value on a separate line.
+    :param chunk_size: number of bytes accumulated before writing them to the stream.
+    """
+    separator = b',' if array else b'\n'
+    pending = [b'['] if array else []
+    pending_size = 0
+    first = True
+    async for value in encoded:
+        data = value.encode('utf-8')
+        if array and not first:
+            pending.append(separator)
+        first = False
+        pending.append(data)
+        if not array:
+            pending.append(separator)
+        pending_size += len(data) + 1
+        if pending_size >= chunk_size:
+            writer.write(b''.join(pending))
+            await writer.drain()
+            pending.clear()
+            pending_size = 0
+    if array:
+        pending.append(b']')
+    if pending:
+        writer.write(b''.join(pending))
+        await writer.drain()
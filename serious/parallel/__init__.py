@@ -0,0 +1,6 @@
+"""A module with `ParallelModel` -- a wrapper of Serious models loading and dumping large batches in processes,
+and `NdjsonReader` decoding newline-delimited JSON files in shards on a pool of processes."""
+__all__ = ['ParallelModel', 'NdjsonReader']
+
+from .model import ParallelModel
+from .ndjson import NdjsonReader
@@ -0,0 +1,54 @@
+"""Errors specific to parallel model."""
+from __future__ import annotations
+
+from typing import Type, Mapping
+
+from serious.errors import LoadError, SerializationError
+from serious.utils import class_path
+
+
+def _describe_failures(failures: Mapping[int, str], position: str = 'items at indexes') -> str:
+    indexes = sorted(failures)
+    shown = ', '.join(map(str, indexes[:10])) + (', …' if len(indexes) > 10 else '')
+    return f'{len(indexes)} {position} [{shown}]. First error: {failures[indexes[0]]}'
+
+
+class BatchLoadError(LoadError):
+    """Some of the items failed to load in worker processes.
+
+    Contains the failure messages of each of the failed items by their index in the batch.
+    """
+
+    def __init__(self, cls: Type, failures: Mapping[int, str]):
+        super().__init__(cls, [], failures)
+        self.failures = failures
+
+    @property
+    def message(self):
+        return f'Failed to load {class_path(self.cls)} {_describe_failures(self.failures)}'
+
+
+class ShardLoadError(BatchLoadError):
+    """Some of the lines of an NDJSON file shard failed to load.
+
+    Failure messages are keyed by byte offsets of the failed lines in the file.
+    """
+
+    @property
+    def message(self):
+        return f'Failed to load {class_path(self.cls)} {_describe_failures(self.failures, "lines at byte offsets")}'
+
+
+class BatchDumpError(SerializationError):
+    """Some of the items failed to dump in worker processes.
+
+    Contains the failure messages of each of the failed items by their index in the batch.
+    """
+
+    def __init__(self, cls: Type, failures: Mapping[int, str]):
+        super().__init__(cls, [])
+        self.failures = failures
+
+    @property
+    def message(self):
+        return f'Failed to dump {class_path(self.cls)} {_describe_failures(self.failures)}'
@@ -0,0 +1,193 @@
+"""A module with `ParallelModel` -- a wrapper of Serious models loading and dumping large batches in processes."""
+from __future__ import annotations
+
+__all__ = ['ParallelModel']
+
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, Future
+from itertools import islice
+from typing import Any, Callable, Deque, Dict, Generic, Iterable, Iterator, List, Optional, Tuple, TypeVar
+
+from serious.utils import class_path
+from .errors import BatchLoadError, BatchDumpError
+
+T = TypeVar('T')
+
+Chunk = Tuple[int, List[Any]]  # index of the first item in batch and the items
+ChunkResult = Tuple[List[Any], Dict[int, str]]  # processed items and failure messages by item index
+
+_worker_model: Any = None
+
+
+class ParallelModel(Generic[T]):
+    """A wrapper of a model (`DictModel`, `JsonModel`, etc) splitting large batches into chunks
+    which are loaded or dumped on a pool of worker processes.
+
+    The wrapped model is sent to each worker once, when the worker starts.
+    Results keep the order of the input. Failures of separate items do not stop the batch;
+    instead the indexes and messages of all failed items are reported in a `BatchLoadError`/`BatchDumpError`.
+
+        :Example:
+
+        from serious import JsonModel
+        from serious.parallel import ParallelModel
+
+        with ParallelModel(JsonModel(Event), workers=8, chunk_size=5000) as model:
+            events = model.load_many(json_lines)
+
+    Since items are passed between processes, the dataclasses and model serializers must be picklable
+    (i.e. defined at module level).
+    """
+
+    def __init__(
+            self,
+            model: Any,
+            *,
+            workers: Optional[int] = None,
+            chunk_size: int = 1000,
+            mp_context: Any = None,
+    ):
+        """Initialize a parallel model.
+
+        :param model: a model to load/dump single items by.
+        :param workers: number of worker processes; defaults to the number of processors.
+        :param chunk_size: number of items processed by a worker at once.
+                Batches no larger than a single chunk are processed in the current process.
+        :param mp_context: a multiprocessing context used to start workers.
+        """
+        if chunk_size < 1:
+            raise ValueError('Chunk size must be positive')
+        self.model = model
+        self.cls = model.cls
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self._mp_context = mp_context
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def load(self, data: Any) -> T:
+        """Load a single dataclass in the current process."""
+        return self.model.load(data)
+
+    def dump(self, o: T) -> Any:
+        """Dump a single dataclass in the current process."""
+        return self.model.dump(o)
+
+    def load_many(self, items: Iterable[Any]) -> List[T]:
+        """Load a list of dataclasses from items encoded by the wrapped model (dicts for `DictModel`,
+        JSON object strings for `JsonModel`, etc).
+
+        :raises BatchLoadError: if any of the items failed to load.
+        """
+        results, failures = self._run(_load_chunk, items)
+        if failures:
+            raise BatchLoadError(self.cls, failures)
+        return results
+
+    def dump_many(self, items: Iterable[T]) -> List[Any]:
+        """Dump dataclasses to a list of items encoded by the wrapped model.
+
+        :raises BatchDumpError: if any of the items failed to dump.
+        """
+        results, failures = self._run(_dump_chunk, items)
+        if failures:
+            raise BatchDumpError(self.cls, failures)
+        return results
+
+    def _run(self, process: Callable[[Any, Chunk], ChunkResult], items: Iterable[Any]) -> ChunkResult:
+        chunks = self._chunks(items)
+        first = next(chunks, None)
+        if first is None:
+            return [], {}
+        second = next(chunks, None)
+        if second is None:
+            return process(self.model, first)
+        results: List[Any] = []
+        failures: Dict[int, str] = {}
+        executor = self._pool()
+        pending: Deque[Future] = deque()
+        max_pending = 2 * (self.workers or os.cpu_count() or 1)  # bounded to avoid queueing the whole input
+        for chunk in _prepend(chunks, first, second):
+            pending.append(executor.submit(_in_worker, process, chunk))
+            if len(pending) >= max_pending:
+                _collect(pending.popleft(), results, failures)
+        while pending:
+            _collect(pending.popleft(), results, failures)
+        return results, failures
+
+    def _chunks(self, items: Iterable[Any]) -> Iterator[Chunk]:
+        iterator = iter(items)
+        start = 0
+        while True:
+            chunk = list(islice(iterator, self.chunk_size))
+            if not chunk:
+                return
+            yield start, chunk
+            start += len(chunk)
+
+    def _pool(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=self._mp_context,
+                initializer=_initialize,
+                initargs=(self.model,),
+            )
+        return self._executor
+
+    def close(self) -> None:
+        """Shut down the worker processes. They are started again if the model is used after closing."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def __enter__(self) -> ParallelModel[T]:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __repr__(self):
+        return f'<{class_path(type(self))}[{self.model!r}] at {hex(id(self))}>'
+
+
+def _prepend(chunks: Iterator[Chunk], *first: Chunk) -> Iterator[Chunk]:
+    yield from first
+    yield from chunks
+
+
+def _collect(future: Future, results: List[Any], failures: Dict[int, str]) -> None:
+    chunk_results, chunk_failures = future.result()
+    results.extend(chunk_results)
+    failures.update(chunk_failures)
+
+
+def _initialize(model: Any) -> None:
+    global _worker_model
+    _worker_model = model
+
+
+def _in_worker(process: Callable[[Any, Chunk], ChunkResult], chunk: Chunk) -> ChunkResult:
+    return process(_worker_model, chunk)
+
+
+def _load_chunk(model: Any, chunk: Chunk) -> ChunkResult:
+    return _process_chunk(model.load, chunk)
+
+
+def _dump_chunk(model: Any, chunk: Chunk) -> ChunkResult:
+    return _process_chunk(model.dump, chunk)
+
+
+def _process_chunk(process: Callable[[Any], Any], chunk: Chunk) -> ChunkResult:
+    start, items = chunk
+    results = []
+    failures = {}
+    for index, item in enumerate(items, start):
+        try:
+            results.append(process(item))
+        except Exception as e:
+            # Serious errors are not picklable, so only the message is passed back.
+            failures[index] = f'{type(e).__name__}: {getattr(e, "message", e)}'
+            results.append(None)
+    return results, failures
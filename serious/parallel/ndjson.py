@@ -0,0 +1,238 @@
+"""A module with `NdjsonReader` -- decoding newline-delimited JSON files in shards on a pool of processes."""
+from __future__ import annotations
+
+__all__ = ['NdjsonReader', 'Progress', 'Shard']
+
+import mmap
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, Future, wait, FIRST_COMPLETED
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, Generic, Iterator, List, NamedTuple, Optional, Set, Tuple, TypeVar, Union
+
+from serious.utils import class_path
+from .errors import ShardLoadError
+
+T = TypeVar('T')
+
+ShardResult = Tuple[List[Any], Dict[int, str]]  # loaded items and failure messages by line offset
+
+
+class Shard(NamedTuple):
+    """A byte range of the file starting at a line beginning and ending after a line break (or at the end of file)."""
+    number: int  # Position of the shard in the file, from 0.
+    start: int
+    end: int
+
+
+@dataclass
+class Progress:
+    """Counters of an `NdjsonReader`, updated as shards are merged into the output."""
+    shards_total: int = 0
+    shards_done: int = 0
+    bytes_total: int = 0
+    bytes_done: int = 0
+    items_done: int = 0
+
+    @property
+    def fraction(self) -> float:
+        """Part of file bytes decoded, from 0 to 1."""
+        return self.bytes_done / self.bytes_total if self.bytes_total else 1.0
+
+
+_worker_model: Any = None
+_worker_path: str = ''
+
+
+class NdjsonReader(Generic[T]):
+    """Loads dataclasses from a newline-delimited JSON file (one JSON object per line) using a `JsonModel`.
+
+    The file is split into shards of about `shard_size` bytes, aligned to line boundaries.
+    Workers map the file into memory themselves for every shard, so only the shard offsets are sent to them,
+    and only the loaded dataclasses are sent back. Empty lines are skipped.
+
+        :Example:
+
+        from serious import JsonModel
+        from serious.parallel import NdjsonReader
+
+        with NdjsonReader(JsonModel(Event), 'events.ndjson', workers=8) as reader:
+            for event in reader:
+                ...
+                print(f'{reader.progress.fraction:.0%}')
+
+    Iterating over the reader yields dataclasses in the order of lines in the file when `ordered` is `True`,
+    otherwise shards are yielded as soon as they are decoded.
+    Files of a single shard are decoded in the current process.
+    """
+
+    def __init__(
+            self,
+            model: Any,
+            path: Union[str, os.PathLike],
+            *,
+            workers: Optional[int] = None,
+            shard_size: int = 2 ** 24,
+            ordered: bool = True,
+            mp_context: Any = None,
+    ):
+        """Initialize a reader of a file.
+
+        :param model: a `JsonModel` (or any model loading a dataclass from a JSON object string).
+        :param path: path to a newline-delimited JSON file.
+        :param workers: number of worker processes; defaults to the number of processors.
+        :param shard_size: approximate number of bytes decoded by a worker at once.
+        :param ordered: `True` to yield items in the order of the file; `False` to yield shards as they complete.
+        :param mp_context: a multiprocessing context used to start workers.
+        """
+        if shard_size < 1:
+            raise ValueError('Shard size must be positive')
+        self.model = model
+        self.cls = model.cls
+        self.path = os.fspath(path)
+        self.workers = workers
+        self.shard_size = shard_size
+        self.ordered = ordered
+        self.progress = Progress()
+        self._mp_context = mp_context
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def shards(self) -> List[Shard]:
+        """Split the file into byte ranges aligned to line boundaries."""
+        with open(self.path, 'rb') as file:
+            size = os.fstat(file.fileno()).st_size
+            if size == 0:
+                return []
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as view:
+                return list(_split(view, size, self.shard_size))
+
+    def __iter__(self) -> Iterator[T]:
+        shards = self.shards()
+        self.progress = Progress(shards_total=len(shards), bytes_total=shards[-1].end if shards else 0)
+        if len(shards) == 1:
+            yield from self._merge(shards[0], _load_file_shard(self.model, self.path, shards[0]))
+            return
+        results = self._ordered(shards) if self.ordered else self._unordered(shards)
+        for shard, result in results:
+            yield from self._merge(shard, result)
+
+    def load_all(self) -> List[T]:
+        """Load all items of the file to a list."""
+        return list(self)
+
+    def _merge(self, shard: Shard, result: ShardResult) -> List[T]:
+        items, failures = result
+        if failures:
+            raise ShardLoadError(self.cls, failures)
+        progress = self.progress
+        progress.shards_done += 1
+        progress.bytes_done += shard.end - shard.start
+        progress.items_done += len(items)
+        return items
+
+    def _ordered(self, shards: List[Shard]) -> Iterator[Tuple[Shard, ShardResult]]:
+        executor = self._pool()
+        pending: Deque[Tuple[Shard, Future]] = deque()
+        remaining = iter(shards)
+        for shard in remaining:
+            pending.append((shard, executor.submit(_load_shard, shard)))
+            if len(pending) >= self._max_pending:
+                break
+        while pending:
+            shard, future = pending.popleft()
+            result = future.result()
+            next_shard = next(remaining, None)
+            if next_shard is not None:
+                pending.append((next_shard, executor.submit(_load_shard, next_shard)))
+            yield shard, result
+
+    def _unordered(self, shards: List[Shard]) -> Iterator[Tuple[Shard, ShardResult]]:
+        executor = self._pool()
+        remaining = iter(shards)
+        pending: Dict[Future, Shard] = {}
+        for shard in remaining:
+            pending[executor.submit(_load_shard, shard)] = shard
+            if len(pending) >= self._max_pending:
+                break
+        while pending:
+            done: Set[Future]
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                shard = pending.pop(future)
+                next_shard = next(remaining, None)
+                if next_shard is not None:
+                    pending[executor.submit(_load_shard, next_shard)] = next_shard
+                yield shard, future.result()
+
+    @property
+    def _max_pending(self) -> int:
+        # Bounded to keep memory proportional to the number of workers rather than the file size.
+        return 2 * (self.workers or os.cpu_count() or 1)
+
+    def _pool(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=self._mp_context,
+                initializer=_initialize,
+                initargs=(self.model, self.path),
+            )
+        return self._executor
+
+    def close(self) -> None:
+        """Shut down the worker processes. They are started again if the reader is iterated after closing."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def __enter__(self) -> NdjsonReader[T]:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __repr__(self):
+        return f'<{class_path(type(self))}[{self.model!r}] of {self.path!r} at {hex(id(self))}>'
+
+
+def _split(view: mmap.mmap, size: int, shard_size: int) -> Iterator[Shard]:
+    start = 0
+    number = 0
+    while start < size:
+        line_break = view.find(b'\n', min(start + shard_size, size) - 1)
+        end = size if line_break == -1 else line_break + 1
+        yield Shard(number, start, end)
+        start = end
+        number += 1
+
+
+def _initialize(model: Any, path: str) -> None:
+    global _worker_model, _worker_path
+    _worker_model = model
+    _worker_path = path
+
+
+def _load_shard(shard: Shard) -> ShardResult:
+    # The file is mapped per shard: a pool outlives a single iteration, and the file may have grown since.
+    return _load_file_shard(_worker_model, _worker_path, shard)
+
+
+def _load_file_shard(model: Any, path: str, shard: Shard) -> ShardResult:
+    with open(path, 'rb') as file:
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as view:
+            return _load_lines(model, view, shard)
+
+
+def _load_lines(model: Any, view: mmap.mmap, shard: Shard) -> ShardResult:
+    items = []
+    failures = {}
+    offset = shard.start
+    for line in view[shard.start:shard.end].split(b'\n'):
+        if line and not line.isspace():
+            try:
+                items.append(model.load(str(line, 'utf-8')))
+            except Exception as e:
+                # Serious errors are not picklable, so only the message is passed back.
+                failures[offset] = f'{type(e).__name__}: {getattr(e, "message", e)}'
+        offset += len(line) + 1
+    return items, failures
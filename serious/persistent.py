@@ -0,0 +1,472 @@
+"""Persistent immutable collections sharing structure between versions.
+
+`PersistentDict` is a hash array mapped trie (HAMT) and `PersistentList` is a 32-way trie with a tail
+(a la Clojure vectors). "Changing" them returns a new version in O(log n) time, copying only the path
+to the changed item, while the rest of the structure is shared with the previous version.
+Hashes are computed once and kept with the collections.
+
+Both types are serialized like `dict` and `list` and pass `ensure_frozen` checks:
+
+    :Example:
+
+    @dataclass(frozen=True)
+    class Inventory:
+        stock: PersistentDict[str, int]
+        log: PersistentList[str]
+
+    updated = replace(inventory, stock=inventory.stock.set('tea', 10), log=inventory.log.append('tea'))
+"""
+from __future__ import annotations
+
+__all__ = ['PersistentDict', 'PersistentList', 'mapping_hash']
+
+from collections.abc import Mapping, Sequence
+from itertools import chain
+from typing import Any, Generic, Iterable, Iterator, Optional, Tuple, TypeVar, Union
+
+KT = TypeVar('KT')  # Key type.
+VT = TypeVar('VT')  # Value type.
+
+_BITS = 5
+_WIDTH = 1 << _BITS
+_MASK = _WIDTH - 1
+_HASH_MASK = (1 << 64) - 1
+
+_NODE: Any = object()  # Marks a sub-node in place of a key.
+_NOT_FOUND: Any = object()
+
+
+def _popcount(value: int) -> int:
+    return bin(value).count('1')
+
+
+def _hash(key: Any) -> int:
+    return hash(key) & _HASH_MASK
+
+
+def _hashes_differ(a: Any, b: Any) -> bool:
+    """Compares the hashes kept by persistent collections, if both are known.
+
+    Hashes are not computed for comparison: values may be unhashable, like lists in a dict."""
+    return a._hash is not None and b._hash is not None and a._hash != b._hash
+
+
+def mapping_hash(items: Iterable[Tuple[Any, Any]]) -> int:
+    """The hash of immutable mappings, shared by `PersistentDict` and `FrozenDict` which compare equal.
+
+    Combined with XOR, so the hash does not depend on the order of items.
+    """
+    hash_ = 0
+    for item in items:
+        hash_ ^= hash(item)
+    return hash_
+
+
+class _BitmapNode:
+    """A trie node of up to 32 entries; `array` holds `key, value` pairs for set `bitmap` bits,
+    with `_NODE, node` pairs for sub-nodes."""
+    __slots__ = ('bitmap', 'array')
+
+    def __init__(self, bitmap: int, array: Tuple[Any, ...]):
+        self.bitmap = bitmap
+        self.array = array
+
+    def find(self, shift: int, hash_: int, key: Any) -> Any:
+        bit = 1 << ((hash_ >> shift) & _MASK)
+        if not self.bitmap & bit:
+            return _NOT_FOUND
+        index = 2 * _popcount(self.bitmap & (bit - 1))
+        found, value = self.array[index], self.array[index + 1]
+        if found is _NODE:
+            return value.find(shift + _BITS, hash_, key)
+        if found is key or found == key:
+            return value
+        return _NOT_FOUND
+
+    def assoc(self, shift: int, hash_: int, key: Any, value: Any) -> Tuple[_BitmapNode, bool]:
+        """A node with the key set to the value, and whether the key was added."""
+        bit = 1 << ((hash_ >> shift) & _MASK)
+        index = 2 * _popcount(self.bitmap & (bit - 1))
+        array = self.array
+        if not self.bitmap & bit:
+            return _BitmapNode(self.bitmap | bit, array[:index] + (key, value) + array[index:]), True
+        found, current = array[index], array[index + 1]
+        if found is _NODE:
+            node, added = current.assoc(shift + _BITS, hash_, key, value)
+            if node is current:
+                return self, False
+            return self._replace(index, _NODE, node), added
+        if found is key or found == key:
+            if current is value:
+                return self, False
+            return self._replace(index, found, value), False
+        node = _merge(shift + _BITS, found, _hash(found), current, hash_, key, value)
+        return self._replace(index, _NODE, node), True
+
+    def without(self, shift: int, hash_: int, key: Any) -> Optional[Union[_BitmapNode, _CollisionNode]]:
+        """A node without the key (the same node if missing), `None` if no entries are left."""
+        bit = 1 << ((hash_ >> shift) & _MASK)
+        if not self.bitmap & bit:
+            return self
+        index = 2 * _popcount(self.bitmap & (bit - 1))
+        found, current = self.array[index], self.array[index + 1]
+        if found is _NODE:
+            node = current.without(shift + _BITS, hash_, key)
+            if node is current:
+                return self
+            if node is None:
+                return self._remove(index, bit)
+            if type(node) is _BitmapNode and len(node.array) == 2 and node.array[0] is not _NODE:
+                return self._replace(index, node.array[0], node.array[1])
+            return self._replace(index, _NODE, node)
+        if found is key or found == key:
+            return self._remove(index, bit)
+        return self
+
+    def __iter__(self) -> Iterator[Tuple[Any, Any]]:
+        array = self.array
+        for index in range(0, len(array), 2):
+            if array[index] is _NODE:
+                yield from array[index + 1]
+            else:
+                yield array[index], array[index + 1]
+
+    def _replace(self, index: int, key: Any, value: Any) -> _BitmapNode:
+        return _BitmapNode(self.bitmap, self.array[:index] + (key, value) + self.array[index + 2:])
+
+    def _remove(self, index: int, bit: int) -> Optional[_BitmapNode]:
+        if self.bitmap == bit:
+            return None
+        return _BitmapNode(self.bitmap ^ bit, self.array[:index] + self.array[index + 2:])
+
+
+class _CollisionNode:
+    """Entries of keys with equal hashes."""
+    __slots__ = ('hash', 'array')
+
+    def __init__(self, hash_: int, array: Tuple[Any, ...]):
+        self.hash = hash_
+        self.array = array
+
+    def find(self, shift: int, hash_: int, key: Any) -> Any:
+        index = self._index(key) if hash_ == self.hash else -1
+        return self.array[index + 1] if index >= 0 else _NOT_FOUND
+
+    def assoc(self, shift: int, hash_: int, key: Any, value: Any) -> Tuple[Union[_BitmapNode, _CollisionNode], bool]:
+        if hash_ != self.hash:
+            return _BitmapNode(1 << ((self.hash >> shift) & _MASK), (_NODE, self)).assoc(shift, hash_, key, value)
+        index = self._index(key)
+        if index < 0:
+            return _CollisionNode(self.hash, self.array + (key, value)), True
+        if self.array[index + 1] is value:
+            return self, False
+        return _CollisionNode(self.hash, self.array[:index + 1] + (value,) + self.array[index + 2:]), False
+
+    def without(self, shift: int, hash_: int, key: Any) -> Union[_BitmapNode, _CollisionNode]:
+        index = self._index(key) if hash_ == self.hash else -1
+        if index < 0:
+            return self
+        array = self.array[:index] + self.array[index + 2:]
+        if len(array) == 2:
+            return _BitmapNode(1 << ((self.hash >> shift) & _MASK), array)
+        return _CollisionNode(self.hash, array)
+
+    def __iter__(self) -> Iterator[Tuple[Any, Any]]:
+        array = self.array
+        for index in range(0, len(array), 2):
+            yield array[index], array[index + 1]
+
+    def _index(self, key: Any) -> int:
+        array = self.array
+        for index in range(0, len(array), 2):
+            if array[index] is key or array[index] == key:
+                return index
+        return -1
+
+
+def _merge(shift: int, key1: Any, hash1: int, value1: Any, hash2: int, key2: Any, value2: Any) \
+        -> Union[_BitmapNode, _CollisionNode]:
+    """A node holding two entries of different keys."""
+    if hash1 == hash2:
+        return _CollisionNode(hash1, (key1, value1, key2, value2))
+    index1 = (hash1 >> shift) & _MASK
+    index2 = (hash2 >> shift) & _MASK
+    if index1 == index2:
+        return _BitmapNode(1 << index1, (_NODE, _merge(shift + _BITS, key1, hash1, value1, hash2, key2, value2)))
+    if index1 < index2:
+        return _BitmapNode((1 << index1) | (1 << index2), (key1, value1, key2, value2))
+    return _BitmapNode((1 << index1) | (1 << index2), (key2, value2, key1, value1))
+
+
+_EMPTY_NODE = _BitmapNode(0, ())
+
+
+class PersistentDict(Mapping, Generic[KT, VT]):
+    """An immutable mapping backed by a hash array mapped trie.
+
+    `set`, `delete` and `update` return new dictionaries sharing the unchanged entries with the original one.
+    Equal to any mapping with the same items; hashed like a `FrozenDict`, once, on first use.
+
+    The order of iteration is unspecified: it follows the hashes of keys, so it is not the order of insertion,
+    and string keys come in a different order in every process (unless `PYTHONHASHSEED` is set).
+    Dictionaries are serialized with keys sorted, so dumps do not depend on the process.
+    """
+    __slots__ = ('_root', '_size', '_hash')
+
+    def __init__(self, items: Union[Mapping[KT, VT], Iterable[Tuple[KT, VT]]] = ()):
+        root, size = _EMPTY_NODE, 0
+        pairs = items.items() if isinstance(items, Mapping) else items
+        for key, value in pairs:
+            root, added = root.assoc(0, _hash(key), key, value)
+            size += added
+        self._root = root
+        self._size = size
+        self._hash: Optional[int] = None
+
+    @classmethod
+    def _create(cls, root: _BitmapNode, size: int) -> PersistentDict:
+        instance = cls.__new__(cls)
+        instance._root = root
+        instance._size = size
+        instance._hash = None
+        return instance
+
+    def set(self, key: KT, value: VT) -> PersistentDict[KT, VT]:
+        """A dictionary with the key set to the value."""
+        root, added = self._root.assoc(0, _hash(key), key, value)
+        if root is self._root:
+            return self
+        return self._create(root, self._size + added)
+
+    def delete(self, key: KT) -> PersistentDict[KT, VT]:
+        """A dictionary without the key.
+
+        :raises KeyError: if the key is missing.
+        """
+        root = self._root.without(0, _hash(key), key)
+        if root is self._root:
+            raise KeyError(key)
+        return self._create(root or _EMPTY_NODE, self._size - 1)  # type: ignore # the root is never a collision
+
+    def update(self, items: Union[Mapping[KT, VT], Iterable[Tuple[KT, VT]]]) -> PersistentDict[KT, VT]:
+        """A dictionary with the keys set to the values of the provided mapping or pairs."""
+        root, size = self._root, self._size
+        pairs = items.items() if isinstance(items, Mapping) else items
+        for key, value in pairs:
+            root, added = root.assoc(0, _hash(key), key, value)
+            size += added
+        return self if root is self._root else self._create(root, size)
+
+    def __getitem__(self, key: KT) -> VT:
+        value = self._root.find(0, _hash(key), key)
+        if value is _NOT_FOUND:
+            raise KeyError(key)
+        return value
+
+    def get(self, key: KT, default: Any = None) -> Any:
+        value = self._root.find(0, _hash(key), key)
+        return default if value is _NOT_FOUND else value
+
+    def __contains__(self, key: object) -> bool:
+        return self._root.find(0, _hash(key), key) is not _NOT_FOUND
+
+    def __iter__(self) -> Iterator[KT]:
+        return (key for key, _ in self._root)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def items(self):
+        return dict(self._root).items()
+
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        if not isinstance(other, Mapping) or len(self) != len(other):
+            return False
+        if isinstance(other, PersistentDict) and _hashes_differ(self, other):
+            return False
+        return dict(self._root) == dict(other.items())
+
+    def __hash__(self) -> int:
+        if self._hash is None:
+            self._hash = mapping_hash(self._root)
+        return self._hash
+
+    def __reduce__(self):
+        return type(self), (dict(self._root),)
+
+    def __repr__(self):
+        return f'{type(self).__name__}({dict(self._root)!r})'
+
+
+class PersistentList(Sequence, Generic[VT]):
+    """An immutable sequence backed by a 32-way trie with the last items kept in a tail.
+
+    `append`, `set` and `pop` return new lists sharing the unchanged items with the original one;
+    reading an item by index takes at most a few steps down the trie.
+    Equal to other persistent lists with the same items; the hash is computed once, on first use.
+    """
+    __slots__ = ('_count', '_shift', '_root', '_tail', '_hash')
+
+    def __init__(self, items: Iterable[VT] = ()):
+        values = items if isinstance(items, (list, tuple)) else list(items)
+        tail_size = (len(values) - 1) % _WIDTH + 1 if values else 0
+        tail_offset = len(values) - tail_size
+        nodes = [tuple(values[i:i + _WIDTH]) for i in range(0, tail_offset, _WIDTH)]
+        shift = _BITS
+        while len(nodes) > _WIDTH:
+            nodes = [tuple(nodes[i:i + _WIDTH]) for i in range(0, len(nodes), _WIDTH)]
+            shift += _BITS
+        self._count = len(values)
+        self._shift = shift
+        self._root: Tuple[Any, ...] = tuple(nodes)
+        self._tail: Tuple[Any, ...] = tuple(values[tail_offset:])
+        self._hash: Optional[int] = None
+
+    @classmethod
+    def _create(cls, count: int, shift: int, root: Tuple[Any, ...], tail: Tuple[Any, ...]) -> PersistentList:
+        instance = cls.__new__(cls)
+        instance._count = count
+        instance._shift = shift
+        instance._root = root
+        instance._tail = tail
+        instance._hash = None
+        return instance
+
+    def append(self, value: VT) -> PersistentList[VT]:
+        """A list with the value added at the end."""
+        count, shift, root = self._count, self._shift, self._root
+        if len(self._tail) < _WIDTH:
+            return self._create(count + 1, shift, root, self._tail + (value,))
+        if (count >> _BITS) > (1 << shift):
+            root, shift = (root, _new_path(shift, self._tail)), shift + _BITS
+        else:
+            root = _push_tail(count, shift, root, self._tail)
+        return self._create(count + 1, shift, root, (value,))
+
+    def extend(self, values: Iterable[VT]) -> PersistentList[VT]:
+        """A list with the values added at the end."""
+        extended = self
+        for value in values:
+            extended = extended.append(value)
+        return extended
+
+    def set(self, index: int, value: VT) -> PersistentList[VT]:
+        """A list with the item at the index replaced by the value.
+
+        :raises IndexError: if the index is out of range.
+        """
+        index = self._index(index)
+        tail_offset = self._count - len(self._tail)
+        if index >= tail_offset:
+            position = index - tail_offset
+            tail = self._tail[:position] + (value,) + self._tail[position + 1:]
+            return self._create(self._count, self._shift, self._root, tail)
+        return self._create(self._count, self._shift, _assoc(self._shift, self._root, index, value), self._tail)
+
+    def pop(self) -> PersistentList[VT]:
+        """A list without the last item.
+
+        :raises IndexError: if the list is empty.
+        """
+        count = self._count
+        if count == 0:
+            raise IndexError('pop from empty list')
+        if len(self._tail) > 1 or count == 1:
+            return self._create(count - 1, self._shift, self._root, self._tail[:-1])
+        tail = self._leaf(count - 2)
+        shift = self._shift
+        root = _pop_tail(count, shift, self._root) or ()
+        if shift > _BITS and len(root) == 1:
+            root, shift = root[0], shift - _BITS
+        return self._create(count - 1, shift, root, tail)
+
+    def __getitem__(self, index):  # type: ignore # Sequence overloads
+        if isinstance(index, slice):
+            return type(self)(list(self)[index])
+        index = self._index(index)
+        tail_offset = self._count - len(self._tail)
+        if index >= tail_offset:
+            return self._tail[index - tail_offset]
+        return self._leaf(index)[index & _MASK]
+
+    def __iter__(self) -> Iterator[VT]:
+        return chain.from_iterable(chain(_leaves(self._root, self._shift), (self._tail,)))
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        if not isinstance(other, PersistentList) or len(self) != len(other):
+            return False
+        if _hashes_differ(self, other):
+            return False
+        return all(a is b or a == b for a, b in zip(self, other))
+
+    def __hash__(self) -> int:
+        if self._hash is None:
+            self._hash = hash(tuple(self))
+        return self._hash
+
+    def __reduce__(self):
+        return type(self), (list(self),)
+
+    def __repr__(self):
+        return f'{type(self).__name__}({list(self)!r})'
+
+    def _index(self, index: int) -> int:
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError('list index out of range')
+        return index
+
+    def _leaf(self, index: int) -> Tuple[Any, ...]:
+        """The trie leaf holding the index; the index is expected to be before the tail."""
+        node = self._root
+        for level in range(self._shift, 0, -_BITS):
+            node = node[(index >> level) & _MASK]
+        return node
+
+
+def _leaves(node: Tuple[Any, ...], level: int) -> Iterable[Tuple[Any, ...]]:
+    if level == _BITS:
+        return node
+    return chain.from_iterable(_leaves(child, level - _BITS) for child in node)
+
+
+def _new_path(level: int, node: Tuple[Any, ...]) -> Tuple[Any, ...]:
+    for _ in range(level // _BITS):
+        node = (node,)
+    return node
+
+
+def _push_tail(count: int, level: int, parent: Tuple[Any, ...], tail: Tuple[Any, ...]) -> Tuple[Any, ...]:
+    """A copy of the parent with the full tail added as the last leaf; the count includes the tail."""
+    index = ((count - 1) >> level) & _MASK
+    if level == _BITS:
+        child = tail
+    elif index < len(parent):
+        child = _push_tail(count, level - _BITS, parent[index], tail)
+    else:
+        child = _new_path(level - _BITS, tail)
+    return parent[:index] + (child,)
+
+
+def _pop_tail(count: int, level: int, node: Tuple[Any, ...]) -> Optional[Tuple[Any, ...]]:
+    """A copy of the node without the last leaf; `None` if the node is left empty."""
+    index = ((count - 2) >> level) & _MASK
+    if level > _BITS:
+        child = _pop_tail(count, level - _BITS, node[index])
+        if child is not None:
+            return node[:index] + (child,)
+    return node[:index] or None
+
+
+def _assoc(level: int, node: Tuple[Any, ...], index: int, value: Any) -> Tuple[Any, ...]:
+    position = (index >> level) & _MASK
+    child = value if level == 0 else _assoc(level - _BITS, node[position], index, value)
+    return node[:position] + (child,) + node[position + 1:]
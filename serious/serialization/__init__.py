@@ -13,6 +13,7 @@ __all__ = [
     'Loading',
     'Dumping',
     'KeyMapper',
+    'LazyProxy',
     'OptionalSerializer',
     'AnySerializer',
     'EnumSerializer',
@@ -38,5 +39,6 @@ from .field_serializers import field_serializers, OptionalSerializer, AnySeriali
     DataclassSerializer, UtcTimestampSerializer, DateTimeIsoSerializer, DateIsoSerializer, TimeIsoSerializer, \
     UuidSerializer, DecimalSerializer
 from .model import SeriousModel
+from .lazy import LazyProxy
 from .key_mapper import KeyMapper
-from .serializer import Serializer, FieldSerializer
+from .serializer import Serializer, FieldSerializer, Loader, Dumper
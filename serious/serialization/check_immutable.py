@@ -1,19 +1,26 @@
-"""Check that whole dataclass structure is immutable, i.e. it’s objects cannot be changed. """
+"""Check that whole dataclass structure is immutable, i.e. it’s objects cannot be changed.
+
+Verdicts are kept process-wide: weakly per type, and per scanned types with a set of custom immutable types
+in a cache bounded like the descriptor caches. Many models sharing nested dataclasses are therefore checked once
+per type, while classes created at runtime are not kept alive by the verdicts.
+"""
 __all__ = ['check_immutable']
 
 from dataclasses import is_dataclass
 from datetime import datetime, date, time
 from decimal import Decimal
-from typing import Iterable, Type, List, Any, Union
+from functools import lru_cache
+from typing import Iterable, Type, List, Any, Union, Tuple, FrozenSet
 from uuid import UUID
+from weakref import WeakKeyDictionary
 
-from serious.descriptors import DescTypes, TypeDescriptor
+from serious.descriptors import CACHE_SIZE, DescTypes, TypeDescriptor
 from serious.errors import MutableTypesInModel
-from serious.types import FrozenList, Email, Timestamp
+from serious.types import FrozenList, Email, Timestamp, PersistentList, PersistentDict
 
 _IMMUTABLE_TYPES = {
     str, int, float, bool,
-    bytes, tuple, frozenset, FrozenList,
+    bytes, tuple, frozenset, FrozenList, PersistentList, PersistentDict,
     Decimal, UUID, datetime, date, time,
     Email, Timestamp,
     Ellipsis,
@@ -28,11 +35,23 @@ def check_immutable(desc: TypeDescriptor, all_types: DescTypes, ensure_frozen: U
 
 
 def extract_mutable(desc: DescTypes, also_immutable: Iterable[Type]) -> List[Type]:
-    allowed_types = _IMMUTABLE_TYPES | set(also_immutable)
-    maybe_dc = set(desc.types) - allowed_types
-    restricted = [type_ for type_ in maybe_dc if not is_frozen_dc(type_)]
-    return restricted
+    return list(_mutable_types(desc, frozenset(also_immutable)))
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _mutable_types(desc: DescTypes, also_immutable: FrozenSet[Type]) -> Tuple[Type, ...]:
+    maybe_dc = set(desc.types) - _IMMUTABLE_TYPES - also_immutable
+    return tuple(type_ for type_ in maybe_dc if not is_frozen_dc(type_))
 
 
 def is_frozen_dc(type_: Any) -> bool:
-    return is_dataclass(type_) and type_.__dataclass_params__.frozen
+    try:
+        return _frozen_dc[type_]
+    except KeyError:
+        frozen = _frozen_dc[type_] = is_dataclass(type_) and type_.__dataclass_params__.frozen
+        return frozen
+    except TypeError:  # Unhashable objects and objects without weak references are not dataclasses.
+        return False
+
+
+_frozen_dc: WeakKeyDictionary = WeakKeyDictionary()
@@ -5,9 +5,9 @@ __all__ = ['Context', 'Loading', 'Dumping']
 
 from abc import ABC, abstractmethod
 from contextlib import contextmanager
-from typing import List, Any, NamedTuple, TypeVar
+from typing import List, Any, NamedTuple, TypeVar, Union
 
-from serious.serialization.serializer import Serializer
+from serious.serialization.serializer import Loader, Dumper
 from serious.types import FrozenList
 from serious.validation import validate
 
@@ -29,7 +29,7 @@ class Context(ABC):
         self._steps: List[SerializationStep] = list()
 
     @contextmanager
-    def _entering(self, step: str, serializer: Serializer):
+    def _entering(self, step: str, serializer: Union[Loader, Dumper]):
         self._steps.append(SerializationStep(step, serializer))
         yield
         self._steps.pop()
@@ -40,7 +40,7 @@ class Context(ABC):
         return FrozenList(self._steps)
 
     @abstractmethod
-    def run(self, step: str, serializer: Serializer, value: Any) -> Any:
+    def run(self, step: str, serializer: Any, value: Any) -> Any:
         """Execute serializer in context.
 
         Implementations:
@@ -62,7 +62,7 @@ class Loading(Context):
         super().__init__()
         self.validating = validating
 
-    def run(self, step: str, serializer: Serializer[M, S], value: S) -> M:
+    def run(self, step: str, serializer: Loader[M, S], value: S) -> M:
         with self._entering(step, serializer):
             result = serializer.load(value, self)
             if self.validating:
@@ -76,7 +76,7 @@ class Dumping(Context):
         super().__init__()
         self.validating = validating
 
-    def run(self, step: str, serializer: Serializer[M, S], o: M) -> S:
+    def run(self, step: str, serializer: Dumper[M, S], o: M) -> S:
         with self._entering(step, serializer):
             if self.validating:
                 validate(o)
@@ -85,4 +85,4 @@ class Dumping(Context):
 
 class SerializationStep(NamedTuple):
     name: str
-    serializer: Serializer
+    serializer: Union[Loader, Dumper]
@@ -0,0 +1,132 @@
+"""Diffs of two instances of a dataclass, containing dumped values of changed fields only.
+
+A diff is a flat mapping of dotted paths of serialized keys (like `"profile.name"`) to dumped field values.
+Nested dataclasses present in both instances are compared field by field, so only the changed leaves are dumped.
+A path pointing to a nested dataclass means the whole nested value was replaced (or set to `None`).
+"""
+from __future__ import annotations
+
+__all__ = ['dump_diff', 'apply_diff']
+
+from collections import defaultdict
+from dataclasses import replace, is_dataclass
+from datetime import date
+from enum import Enum
+from typing import Any, Dict, Mapping, Optional, TYPE_CHECKING
+from uuid import UUID
+
+from serious.checks import check_is_instance
+from serious.descriptors import TypeDescriptor, scan_types
+from serious.errors import ValidationError, LoadError, DumpError, UnexpectedItem
+from serious.types import FrozenList, FrozenDict, PersistentList, PersistentDict, Email
+from serious.validation import validate
+from .context import Loading, Dumping
+from .field_serializers import DataclassSerializer, OptionalSerializer
+from .serializer import FieldSerializer
+
+if TYPE_CHECKING:
+    from .model import SeriousModel
+
+
+def dump_diff(model: SeriousModel, old: Any, new: Any) -> Dict[str, Any]:
+    """Dump the fields of `new` which differ from `old`."""
+    check_is_instance(old, model.cls)
+    check_is_instance(new, model.cls)
+    dumping = Dumping(validating=False)
+    diff: Dict[str, Any] = {}
+    try:
+        if model.validate_on_dump:
+            validate(new)
+        _diff_fields(model, old, new, '', dumping, diff)
+    except ValidationError:
+        raise
+    except Exception as e:
+        raise DumpError(new, dumping.stack) from e
+    return diff
+
+
+def _diff_fields(model: SeriousModel, old: Any, new: Any, prefix: str, dumping: Dumping, diff: Dict[str, Any]):
+    for name, serializer in model.serializers_by_field.items():
+        old_value = getattr(old, name)
+        new_value = getattr(new, name)
+        if old_value is new_value:
+            continue
+        key = model.keys.to_serialized(name)
+        child = _nested_model(serializer)
+        if child is not None and old_value is not None and new_value is not None:
+            _diff_fields(child, old_value, new_value, f'{prefix}{key}.', dumping, diff)
+        elif old_value != new_value:
+            diff[prefix + key] = dumping.run(f'.{prefix}{key}', serializer, new_value)
+        elif _loosely_equal(model.descriptor.fields[name]):
+            # Equal values may still dump differently, like Decimal('1.0') and Decimal('1.00'), 0.0 and -0.0,
+            # or the same moment in different time zones.
+            dumped = dumping.run(f'.{prefix}{key}', serializer, new_value)
+            if repr(dumped) != repr(dumping.run(f'.{prefix}{key}', serializer, old_value)):
+                diff[prefix + key] = dumped
+
+
+def _loosely_equal(descriptor: TypeDescriptor) -> bool:
+    """The field may hold values which are equal but dumped differently.
+
+    Only values of types known to be equal exactly when they dump the same are compared by `==` alone."""
+    return not all(_strictly_equal(type_) for type_ in scan_types(descriptor).types)
+
+
+def _strictly_equal(type_: Any) -> bool:
+    return type_ in _STRICTLY_EQUAL or isinstance(type_, type) and (issubclass(type_, Enum) or is_dataclass(type_))
+
+
+# Dataclasses and enums are strict as well; the types of dataclass fields are scanned with the rest.
+_STRICTLY_EQUAL = frozenset({
+    str, int, bool, bytes, UUID, date, Email, Ellipsis,
+    list, tuple, dict, set, frozenset, FrozenList, FrozenDict, PersistentList, PersistentDict,
+})
+
+
+def apply_diff(model: SeriousModel, o: Any, diff: Mapping[str, Any]) -> Any:
+    """Create a copy of the object with the changes from a diff loaded and applied."""
+    check_is_instance(o, model.cls)
+    check_is_instance(diff, Mapping, f'Invalid diff for {model.cls}')  # type: ignore
+    loading = Loading(validating=model.validate_on_load)
+    try:
+        return _apply(model, o, diff, '', loading)
+    except (ValidationError, UnexpectedItem):
+        raise
+    except Exception as e:
+        raise LoadError(model.cls, loading.stack, diff) from e
+
+
+def _apply(model: SeriousModel, o: Any, diff: Mapping[str, Any], prefix: str, loading: Loading) -> Any:
+    nested: Dict[str, Dict[str, Any]] = defaultdict(dict)
+    changes: Dict[str, Any] = {}
+    for path, value in diff.items():
+        key, _, rest = path.partition('.')
+        name = model.keys.to_model(key)
+        if name not in model.serializers_by_field:
+            raise UnexpectedItem(model.cls, diff, {prefix + key})
+        if rest:
+            nested[name][rest] = value
+        else:
+            changes[name] = loading.run(f'.{prefix}{key}', model.serializers_by_field[name], value)
+    for name, nested_diff in nested.items():
+        key = model.keys.to_serialized(name)
+        child = _nested_model(model.serializers_by_field[name])
+        value = changes[name] if name in changes else getattr(o, name)
+        if child is None or value is None:
+            raise ValueError(f'Cannot apply changes of "{prefix}{key}" fields to {value!r}')
+        changes[name] = _apply(child, value, nested_diff, f'{prefix}{key}.', loading)
+    if not changes:
+        return o
+    result = replace(o, **changes)
+    if model.validate_on_load:
+        validate(result)
+    return result
+
+
+def _nested_model(serializer: FieldSerializer) -> Optional[SeriousModel]:
+    """The model of a field compared field by field, i.e. a (possibly optional) dataclass."""
+    if type(serializer) is OptionalSerializer:
+        serializer = serializer._serializer  # type: ignore # checked to be an OptionalSerializer
+    if type(serializer) is DataclassSerializer:
+        return serializer._serializer  # type: ignore # checked to be a DataclassSerializer
+    return None
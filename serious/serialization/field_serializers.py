@@ -13,13 +13,15 @@ from dataclasses import replace
 from datetime import datetime, date, time
 from decimal import Decimal
 from enum import Enum
-from typing import Any, Optional, Dict, List, Union, Pattern, Iterable, Type, Tuple
+from typing import Any, Optional, Dict, List, Union, Pattern, Iterable, Type, Tuple, Callable
 from uuid import UUID
 
+from serious.caches import LruCache, MISSING
 from serious.descriptors import TypeDescriptor
 from serious.errors import ValidationError
-from serious.types import Timestamp
+from serious.types import Timestamp, FrozenList, PersistentList, PersistentDict
 from .context import Context, Loading, Dumping
+from .iso8601 import parse_datetime, parse_date, parse_time
 from .serializer import FieldSerializer, Serializer
 
 
@@ -111,6 +113,7 @@ class EnumSerializer(FieldSerializer[Any, Any]):
         super().__init__(*args, **kwargs)
         self._serializer = self._value_serializer()
         self._enum_values = {e.value for e in list(self.type.cls)}
+        self._cache = _scalar_cache(self.root)
 
     def _value_serializer(self) -> Optional[FieldSerializer]:
         cls = self.type.cls
@@ -124,6 +127,12 @@ class EnumSerializer(FieldSerializer[Any, Any]):
         return self.root.find_serializer(item_descriptor)
 
     def load(self, value: Any, ctx: Loading) -> Any:
+        if self._cache is None or type(value) not in (str, int):
+            return self._convert(value, ctx)
+        # Keyed by type too, as `True == 1` but a boolean may be rejected by the value serializer.
+        return _cached(self._cache, (type(value), value), self._convert, value, ctx)
+
+    def _convert(self, value: Any, ctx: Loading) -> Any:
         if self._serializer is None and value not in self._enum_values:
             raise ValidationError(f'"{value}" is not part of the {self.type.cls} enum')
         enum_cls = self.type.cls
@@ -161,7 +170,7 @@ class AnySerializer(FieldSerializer[Any, Any]):
 
 
 class DictSerializer(FieldSerializer[Dict[str, Any], Dict[str, Any]]):
-    """Serializer for `dict` fields with `str` keys (`Dict[str, Any]`)."""
+    """Serializer for `dict` and `PersistentDict` fields with `str` keys (`Dict[str, Any]`)."""
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -171,15 +180,20 @@ class DictSerializer(FieldSerializer[Dict[str, Any], Dict[str, Any]]):
 
     @classmethod
     def fits(cls, desc: TypeDescriptor) -> bool:
-        return issubclass(desc.cls, dict)
+        return issubclass(desc.cls, (dict, PersistentDict))
 
     def load(self, data: Dict[str, Any], ctx: Loading) -> Dict[str, Any]:
         if not isinstance(data, dict):
             raise ValidationError('Expecting a dictionary')
         items = self._serialize_dict(data, ctx)
+        intern = getattr(self.root, 'intern', None)
+        if intern is not None:
+            items = {intern(key) if type(key) is str else key: value for key, value in items.items()}
         return self.type.cls(items)
 
     def dump(self, data: Dict[str, Any], ctx: Dumping) -> Dict[str, Any]:
+        if isinstance(data, PersistentDict):
+            data = dict(sorted(data.items()))  # Iterated in the order of key hashes, which differs between processes.
         return self._serialize_dict(data, ctx)
 
     def _serialize_dict(self, data: Dict[str, Any], ctx: Context) -> Dict[str, Any]:
@@ -187,11 +201,11 @@ class DictSerializer(FieldSerializer[Dict[str, Any], Dict[str, Any]]):
         return {key: ctx.run(f'[{key}]', serializer(key), value) for key, value in data.items()}
 
 
-Collection = Union[list, set, frozenset]
+Collection = Union[list, set, frozenset, FrozenList, PersistentList]
 
 
 class CollectionSerializer(FieldSerializer[Collection, list]):
-    """Serializer for lists, sets, and frozensets."""
+    """Serializer for lists, sets, frozensets, `FrozenList`, `PersistentList` and `Tuple[T, ...]`."""
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -200,7 +214,7 @@ class CollectionSerializer(FieldSerializer[Collection, list]):
 
     @classmethod
     def fits(cls, desc: TypeDescriptor) -> bool:
-        return (issubclass(desc.cls, (list, set, frozenset))
+        return (issubclass(desc.cls, (list, set, frozenset, FrozenList, PersistentList))
                 or (issubclass(desc.cls, tuple)
                     and len(desc.parameters) == 2
                     and desc.parameters[1].cls is Ellipsis))
@@ -309,6 +323,11 @@ class BooleanSerializer(FieldSerializer[bool, bool]):
 class StringSerializer(FieldSerializer[str, str]):
     """A serializer for string field values."""
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Subclasses of `str` cannot be interned.
+        self._intern = getattr(self.root, 'intern', None) if self.type.cls is str else None
+
     @classmethod
     def fits(cls, desc: TypeDescriptor) -> bool:
         return issubclass(desc.cls, str)
@@ -316,6 +335,8 @@ class StringSerializer(FieldSerializer[str, str]):
     def load(self, value: str, ctx: Loading) -> str:
         if not isinstance(value, str):
             raise ValidationError('Invalid data type. Expecting a string')
+        if self._intern is not None:
+            return self._intern(str(value))
         return self.type.cls(value)
 
     def dump(self, value: str, ctx: Dumping) -> str:
@@ -411,22 +432,6 @@ class UtcTimestampSerializer(FieldSerializer[Timestamp, Union[float, int]]):
         return value.value
 
 
-_iso_date_time_re = re.compile(  # https://stackoverflow.com/a/43931246/8677389
-    r'\A(?:\d{4}-(?:(?:0[1-9]|1[0-2])-(?:0[1-9]|1\d|2[0-8])|(?:0[13-9]|1[0-2])-(?:29|30)|(?:0[13578]|1[02])-31)'
-    r'|(?:[1-9]\d(?:0[48]|[2468][048]|[13579][26])|(?:[2468][048]|[13579][26])00)-02-29)'
-    r'T(?:[01]\d|2[0-3]):[0-5]\d:[0-5]\d(?:\.\d{1,9})?(?:Z|[+-][01]\d:[0-5]\d)?\Z'
-)
-_iso_date_re = re.compile(
-    r'\A(?P<year>[0-9]{4})(?P<hyphen>-?)(?P<month>1[0-2]|0[1-9])(?P=hyphen)(?P<day>3[01]|0[1-9]|[12][0-9])\Z'
-)
-_iso_time_re = re.compile(
-    r'\A(?P<hour>2[0-3]|[01][0-9])'
-    r':?(?P<minute>[0-5][0-9])'
-    r':?(?P<second>[0-5][0-9])'
-    r'(?P<timezone>Z|[+-](?:2[0-3]|[01][0-9])(?::?(?:[0-5][0-9]))?)?\Z'
-)
-
-
 class DateTimeIsoSerializer(FieldSerializer[datetime, str]):
     """A serializer for datetime field values to a timestamp represented by a `ISO formatted string`_.
 
@@ -444,12 +449,23 @@ class DateTimeIsoSerializer(FieldSerializer[datetime, str]):
     .. _ISO formatted string: https://en.wikipedia.org/wiki/ISO_8601
     """
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._cache = _scalar_cache(self.root)
+
     def load(self, value: str, ctx: Loading) -> datetime:
         if not isinstance(value, str):
             raise ValidationError('Invalid data type. Expecting a string')
-        if not _matches(_iso_date_time_re, value):
-            raise ValidationError('Invalid date/time format. Check the ISO 8601 specification')
-        return datetime.fromisoformat(value)  # type: ignore # expecting datetime
+        if self._cache is None:
+            return self._convert(value)
+        return _cached(self._cache, value, self._convert, value)
+
+    @staticmethod
+    def _convert(value: str) -> datetime:
+        try:
+            return parse_datetime(value)
+        except ValueError as e:
+            raise ValidationError('Invalid date/time format. Check the ISO 8601 specification') from e
 
     def dump(self, value: datetime, ctx: Dumping) -> str:
         return datetime.isoformat(value)
@@ -476,12 +492,23 @@ class DateIsoSerializer(FieldSerializer[date, str]):
     .. _ISO formatted string: https://en.wikipedia.org/wiki/ISO_8601
     """
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._cache = _scalar_cache(self.root)
+
     def load(self, value: str, ctx: Loading) -> date:
         if not isinstance(value, str):
             raise ValidationError('Invalid data type. Expecting a string')
-        if not _matches(_iso_date_re, value):
-            raise ValidationError('Invalid date format. Check the ISO 8601 specification')
-        return date.fromisoformat(value)  # type: ignore # expecting datetime
+        if self._cache is None:
+            return self._convert(value)
+        return _cached(self._cache, value, self._convert, value)
+
+    @staticmethod
+    def _convert(value: str) -> date:
+        try:
+            return parse_date(value)
+        except ValueError as e:
+            raise ValidationError('Invalid date format. Check the ISO 8601 specification') from e
 
     def dump(self, value: date, ctx: Dumping) -> str:
         return date.isoformat(value)
@@ -508,12 +535,23 @@ class TimeIsoSerializer(FieldSerializer[time, str]):
     .. _ISO formatted string: https://en.wikipedia.org/wiki/ISO_8601
     """
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._cache = _scalar_cache(self.root)
+
     def load(self, value: str, ctx: Loading) -> time:
         if not isinstance(value, str):
             raise ValidationError('Invalid data type. Expecting a string')
-        if not _matches(_iso_time_re, value):
-            raise ValidationError('Invalid time format. Check the ISO 8601 specification')
-        return time.fromisoformat(value)  # type: ignore # expecting datetime
+        if self._cache is None:
+            return self._convert(value)
+        return _cached(self._cache, value, self._convert, value)
+
+    @staticmethod
+    def _convert(value: str) -> time:
+        try:
+            return parse_time(value)
+        except ValueError as e:
+            raise ValidationError('Invalid time format. Check the ISO 8601 specification') from e
 
     def dump(self, value: time, ctx: Dumping) -> str:
         return time.isoformat(value)
@@ -529,12 +567,22 @@ _uuid4_hex_re = re.compile(r'\A([a-f0-9]{8}-?[a-f0-9]{4}-?4[a-f0-9]{3}-?[89ab][a
 class UuidSerializer(FieldSerializer[UUID, str]):
     """A `UUID` value serializer to `str`."""
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._cache = _scalar_cache(self.root)
+
     def load(self, value: str, ctx: Loading) -> UUID:
         if not isinstance(value, str):
             raise ValidationError('Invalid data type. Expecting a string')
+        if self._cache is None:
+            return self._convert(value)
+        return _cached(self._cache, value, self._convert, value)
+
+    @staticmethod
+    def _convert(value: str) -> UUID:
         if not _matches(_uuid4_hex_re, value):
             raise ValidationError('Invalid UUID4 hex format')
-        return UUID(value)  # type: ignore # expecting str
+        return UUID(value)
 
     def dump(self, value: UUID, ctx: Dumping) -> str:
         return str(value)
@@ -550,12 +598,22 @@ _decimal_re = re.compile(r'\A\d+(\.\d+)?\Z')
 class DecimalSerializer(FieldSerializer[Decimal, str]):
     """`Decimal` value serializer to `str`."""
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._cache = _scalar_cache(self.root)
+
     def load(self, value: str, ctx: Loading) -> Decimal:
         if not isinstance(value, str):
             raise ValidationError('Invalid data type. Expecting a string')
+        if self._cache is None:
+            return self._convert(value)
+        return _cached(self._cache, value, self._convert, value)
+
+    @staticmethod
+    def _convert(value: str) -> Decimal:
         if not _matches(_decimal_re, value):
             raise ValidationError('Invalid decimal format. A number with a "." as a decimal separator is expected')
-        return Decimal(value)  # type: ignore # expecting str
+        return Decimal(value)
 
     def dump(self, value: Decimal, ctx: Dumping) -> str:
         return str(value)
@@ -565,5 +623,23 @@ class DecimalSerializer(FieldSerializer[Decimal, str]):
         return issubclass(desc.cls, Decimal)
 
 
+def _scalar_cache(root: Any) -> Optional[LruCache]:
+    """A cache of converted values for a serializer when the model enables `scalar_cache`.
+
+    Roots of serializers created outside of models may lack the option.
+    """
+    create = getattr(root, 'scalar_cache', None)
+    return create() if create is not None else None
+
+
+def _cached(cache: LruCache, key: Any, convert: Callable[..., Any], *args: Any) -> Any:
+    """Returns a cached conversion of the key, calling `convert(*args)` on a miss; failed conversions are not cached."""
+    result = cache.get(key)
+    if result is MISSING:
+        result = convert(*args)
+        cache.put(key, result)
+    return result
+
+
 def _matches(regex: Pattern, value: str) -> bool:
     return regex.match(value) is not None  # type: ignore # caller ensures str
@@ -0,0 +1,53 @@
+"""Canonical instances of frozen dataclasses, so that equal loaded objects share a single instance."""
+from __future__ import annotations
+
+__all__ = ['FlyweightTable']
+
+from dataclasses import fields
+from typing import Any, Callable, Generic, Tuple, Type, TypeVar
+from weakref import WeakValueDictionary
+
+from serious.caches import strict_key
+from serious.utils import attributes_getter
+
+T = TypeVar('T')
+
+
+class FlyweightTable(Generic[T]):
+    """Returns a previously loaded equal instance of a frozen dataclass instead of a new one.
+
+    Instances are keyed by the `strict_key` of their field values, so equal instances which are dumped differently
+    (like ones with `Decimal('1.0')` and `Decimal('1.00')`) are not shared. Instances are held by weak references,
+    so an instance is dropped from the table as soon as nothing else refers to it.
+    Instances with unhashable field values (or without weak reference support) are returned as they are.
+    A pickled table is restored empty.
+    """
+
+    def __init__(self, cls: Type[T]):
+        self.cls = cls
+        self._key: Callable[[T], Tuple] = attributes_getter([field.name for field in fields(cls)])
+        self._instances: WeakValueDictionary = WeakValueDictionary()
+
+    def __call__(self, o: T) -> T:
+        try:
+            key = tuple(strict_key(value) for value in self._key(o))
+            canonical = self._instances.get(key)
+            if canonical is not None:
+                return canonical
+            self._instances[key] = o
+        except TypeError:
+            pass
+        return o
+
+    def __len__(self) -> int:
+        return len(self._instances)
+
+    def __getstate__(self):
+        # Weak dictionaries cannot be pickled; a table is restored empty, e.g. in a worker process.
+        return {'cls': self.cls}
+
+    def __setstate__(self, state):
+        self.__init__(state['cls'])
+
+    def __repr__(self):
+        return f'<FlyweightTable of {self.cls.__qualname__} with {len(self)} instances>'
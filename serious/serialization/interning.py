@@ -0,0 +1,45 @@
+"""Interning of loaded strings, so that repeated values share a single `str` object."""
+from __future__ import annotations
+
+__all__ = ['InternTable', 'string_interning']
+
+import sys
+from typing import Callable, Dict, Optional, Union
+
+
+class InternTable:
+    """A bounded table of strings returning the first loaded object for every repeated value.
+
+    Once `size` distinct strings are stored, new values are returned as they are,
+    while values already in the table keep being shared. Unlike `sys.intern` the strings are released
+    together with the model.
+    """
+
+    def __init__(self, size: int):
+        self.size = size
+        self._strings: Dict[str, str] = {}
+
+    def __call__(self, value: str) -> str:
+        strings = self._strings
+        interned = strings.get(value)
+        if interned is not None:
+            return interned
+        if len(strings) < self.size:
+            strings[value] = value
+        return value
+
+    def __len__(self) -> int:
+        return len(self._strings)
+
+
+def string_interning(option: Union[bool, int]) -> Optional[Callable[[str], str]]:
+    """A function interning strings according to the `intern_strings` model option:
+    `True` for `sys.intern`, a positive number for a bounded `InternTable`, `False` for none.
+    """
+    if option is True:
+        return sys.intern
+    if option is False or option == 0:
+        return None
+    if option < 0:
+        raise ValueError('Intern table size must be positive')
+    return InternTable(option)
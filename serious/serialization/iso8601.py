@@ -0,0 +1,103 @@
+"""Parsing of ISO 8601 date/time strings in the formats accepted by the date/time field serializers.
+
+Strings in the shape written by `isoformat()` (`YYYY-MM-DDTHH:MM:SS[.ffffff][±HH:MM]` and its date and time parts)
+are parsed in a single pass by the C-implemented `fromisoformat`, which checks the digits, their ranges
+and the calendar (e.g. February 29th) while constructing the value. Only the positions of separators and
+the length are checked beforehand, which `fromisoformat` of some Python versions is lenient about.
+
+Other accepted forms ("Z" offsets, fractions of other than 6 digits, offsets without minutes, basic formats
+without separators) are checked by a linear pattern and rewritten to the shape above, then parsed the same way.
+"""
+__all__ = ['parse_datetime', 'parse_date', 'parse_time']
+
+import re
+from datetime import datetime, date, time
+
+_FRACTION = r'(?:\.(\d{1,9}))?'
+_OFFSET = r'(Z|[+-](?:[01]\d|2[0-3]):[0-5]\d)?'
+_TIME_OFFSET = r'(Z|[+-](?:[01]\d|2[0-3])(?::?[0-5]\d)?)?'
+
+_date_time_re = re.compile(
+    r'(\d{4}-\d\d-\d\dT(?:[01]\d|2[0-3]):[0-5]\d:[0-5]\d)' + _FRACTION + _OFFSET + r'\Z',
+    re.ASCII,
+)
+_date_re = re.compile(r'(\d{4})(-?)(\d\d)\2(\d\d)\Z', re.ASCII)
+_time_re = re.compile(r'([01]\d|2[0-3])(:?)([0-5]\d)\2([0-5]\d)' + _FRACTION + _TIME_OFFSET + r'\Z', re.ASCII)
+
+
+def parse_datetime(value: str) -> datetime:
+    """Parses `YYYY-MM-DDTHH:MM:SS[.fffffffff][Z|±HH:MM]`, truncating fractions to microseconds.
+
+    :raises ValueError: if the string does not match the format or is not a valid date/time.
+    """
+    text = value[:-1] + '+00:00' if value[-1:] == 'Z' else value
+    if text[4:17:3] == '--T::' and _has_isoformat_suffix(text, 19):
+        try:
+            return datetime.fromisoformat(text)
+        except ValueError:
+            pass  # Not digits or out of range; rejected or explained below.
+    match = _date_time_re.match(value)
+    if match is None:
+        raise ValueError(f'Invalid ISO 8601 date/time "{value}"')
+    return datetime.fromisoformat(match[1] + _fraction(match[2]) + _offset(match[3]))
+
+
+def parse_date(value: str) -> date:
+    """Parses `YYYY-MM-DD` or `YYYYMMDD`.
+
+    :raises ValueError: if the string does not match the format or is not a valid date.
+    """
+    if len(value) == 10 and value[4:8:3] == '--':
+        try:
+            return date.fromisoformat(value)
+        except ValueError:
+            pass
+    match = _date_re.match(value)
+    if match is None:
+        raise ValueError(f'Invalid ISO 8601 date "{value}"')
+    return date.fromisoformat(f'{match[1]}-{match[3]}-{match[4]}')
+
+
+def parse_time(value: str) -> time:
+    """Parses `HH:MM:SS[.fffffffff][Z|±HH[:MM]]` or the same without colons, truncating fractions to microseconds.
+
+    :raises ValueError: if the string does not match the format.
+    """
+    text = value[:-1] + '+00:00' if value[-1:] == 'Z' else value
+    if text[2:6:3] == '::' and _has_isoformat_suffix(text, 8):
+        try:
+            return time.fromisoformat(text)
+        except ValueError:
+            pass
+    match = _time_re.match(value)
+    if match is None:
+        raise ValueError(f'Invalid ISO 8601 time "{value}"')
+    return time.fromisoformat(f'{match[1]}:{match[3]}:{match[4]}' + _fraction(match[5]) + _offset(match[6]))
+
+
+def _has_isoformat_suffix(text: str, start: int) -> bool:
+    """Checks that the text continues from `start` with an optional `.fff[fff]` and `±HH:MM`.
+
+    Digits are checked by `fromisoformat`, except for a fraction ending the text, which newer versions
+    would also accept with a "Z" or an offset in other formats. Those are left for the pattern to check."""
+    rest = len(text) - start
+    if rest == 0:
+        return True
+    if rest in (6, 10, 13):
+        return text[-6] in '+-' and text[-3] == ':' and (rest == 6 or text[start] == '.')
+    if rest in (4, 7):
+        return text[start] == '.' and text[start + 1:].isdigit()
+    return False
+
+
+def _fraction(digits: str) -> str:
+    return f'.{digits[:6]:0<6}' if digits else ''
+
+
+def _offset(offset: str) -> str:
+    if not offset:
+        return ''
+    if offset == 'Z':
+        return '+00:00'
+    minutes = offset[-2:] if len(offset) > 3 else '00'
+    return f'{offset[:3]}:{minutes}'
@@ -0,0 +1,120 @@
+"""Lazy proxies of dataclasses, loading each field from data on the first access.
+
+A proxy class is generated for each `SeriousModel`. Its attributes are non-data descriptors:
+a loaded value is stored in the instance `__dict__`, so subsequent reads are plain attribute lookups.
+"""
+from __future__ import annotations
+
+__all__ = ['LazyProxy', 'lazy_class']
+
+from dataclasses import fields, MISSING
+from typing import Any, Dict, Generic, Mapping, Optional, Type, TypeVar, TYPE_CHECKING
+
+from serious.errors import ValidationError, LoadError, ReservedFieldName
+from serious.validation import validate
+from .context import Loading
+from .field_serializers import DataclassSerializer
+
+if TYPE_CHECKING:
+    from .model import SeriousModel
+
+T = TypeVar('T')
+
+# Attributes of proxies which would be shadowed by lazy fields of the same names.
+RESERVED_NAMES = frozenset({'materialize', '_lazy_data', '_serious_model'})
+
+
+class LazyProxy(Generic[T]):
+    """A read-only stand-in for a dataclass, loading fields from the data on first access.
+
+    Fields are loaded by the same serializers and validated the same way as by `SeriousModel.load`,
+    except for the dataclass `__validate__`, which runs on `materialize()`.
+    Nested dataclasses are loaded as lazy proxies too.
+    """
+    _serious_model: SeriousModel[T]
+    _lazy_data: Mapping[str, Any]
+
+    def __init__(self, data: Mapping[str, Any]):
+        object.__setattr__(self, '_lazy_data', data)
+
+    def materialize(self) -> T:
+        """Load the remaining fields and construct the actual dataclass."""
+        model = self._serious_model
+        values = vars(self)
+        data = self._lazy_data
+        init_kwargs = {}
+        for name in model.serializers_by_field:
+            if name in data or name in values:
+                value = getattr(self, name)
+                init_kwargs[name] = value.materialize() if isinstance(value, LazyProxy) else value
+        try:
+            result = model.cls(**init_kwargs)  # type: ignore # not an object
+            if model.validate_on_load:
+                validate(result)
+            return result
+        except ValidationError:
+            raise
+        except Exception as e:
+            raise LoadError(model.cls, [], data) from e
+
+    def __setattr__(self, key, value):
+        raise AttributeError(f'Cannot assign "{key}" of a lazily loaded {self._serious_model.cls.__name__}')
+
+    def __delattr__(self, key):
+        raise AttributeError(f'Cannot delete "{key}" of a lazily loaded {self._serious_model.cls.__name__}')
+
+    def __repr__(self):
+        loaded = ', '.join(f'{name}={value!r}' for name, value in vars(self).items() if name != '_lazy_data')
+        return f'<lazy {self._serious_model.cls.__qualname__}({loaded})>'
+
+
+class _LazyField:
+    """Loads a field of the proxy when it is first read, then leaves it in the instance dictionary."""
+
+    def __init__(self, model: SeriousModel, name: str):
+        self.model = model
+        self.name = name
+        self.step = f'.{model.keys.to_serialized(name)}'
+        self.serializer = model.serializers_by_field[name]
+        self.field = next(field for field in fields(model.cls) if field.name == name)
+        self.nested: Optional[SeriousModel] = None
+        if type(self.serializer) is DataclassSerializer:
+            self.nested = self.serializer._serializer  # type: ignore # checked to be a DataclassSerializer
+
+    def __get__(self, proxy: LazyProxy, owner: Type[LazyProxy]) -> Any:
+        if proxy is None:
+            return self
+        data = proxy._lazy_data
+        if self.name in data:
+            value = self._load(data)
+        elif self.field.default is not MISSING:
+            value = self.field.default
+        else:
+            value = self.field.default_factory()  # type: ignore # dataclass fields have either
+        proxy.__dict__[self.name] = value
+        return value
+
+    def _load(self, data: Mapping[str, Any]) -> Any:
+        value = data[self.name]
+        loading = Loading(validating=self.model.validate_on_load)
+        try:
+            if self.nested is not None and isinstance(value, dict):
+                return self.nested.load_lazy(value)
+            return loading.run(self.step, self.serializer, value)
+        except ValidationError:
+            raise
+        except Exception as e:
+            raise LoadError(self.model.cls, loading.stack, data) from e
+
+
+def lazy_class(model: SeriousModel[T]) -> Type[LazyProxy[T]]:
+    """Generate a proxy class with a lazily loaded attribute for every field of the model dataclass.
+
+    :raises ReservedFieldName: if a field is named like an attribute of proxies.
+    """
+    for name in model.serializers_by_field:
+        if name in RESERVED_NAMES:
+            raise ReservedFieldName(model.cls, name, 'lazy proxies')
+    namespace: Dict[str, Any] = {name: _LazyField(model, name) for name in model.serializers_by_field}
+    namespace['_serious_model'] = model
+    return type(f'Lazy{model.cls.__name__}', (LazyProxy,), namespace)  # type: ignore
@@ -0,0 +1,85 @@
+"""Field masks dumping only a part of a dataclass, selected by included and excluded dotted paths."""
+from __future__ import annotations
+
+__all__ = ['DumpMask']
+
+from dataclasses import replace
+from typing import Any, Dict, List, NamedTuple, Optional, TYPE_CHECKING
+
+from serious.checks import check_is_instance
+from serious.errors import ValidationError, DumpError
+from serious.validation import validate
+from .context import Dumping
+from .paths import FieldTree
+from .serializer import Dumper
+
+if TYPE_CHECKING:
+    from .model import SeriousModel
+
+
+class _Step(NamedTuple):
+    name: str
+    key: str
+    step: str
+    serializer: Dumper
+
+
+class DumpMask:
+    """Dumps dataclass fields selected by `include` paths (all fields if `None`) except the `exclude` paths.
+
+    Serializers of the fields left out are never called.
+    Masks are created by `SeriousModel.mask(include, exclude)` which caches them per pair of path sets.
+    """
+
+    def __init__(self, model: SeriousModel, include: Optional[FieldTree], exclude: Optional[FieldTree]):
+        self.model = model
+        self.include = include
+        self.exclude = exclude
+        plan: List[_Step] = []
+        serializer: Dumper
+        for name, serializer in model.serializers_by_field.items():
+            if include is not None and name not in include:
+                continue
+            if exclude is not None and name in exclude and exclude[name] is None:
+                continue
+            nested_include = include[name] if include is not None else None
+            nested_exclude = exclude.get(name) if exclude is not None else None
+            if nested_include is not None or nested_exclude is not None:
+                descriptor = model.descriptor.fields[name]
+                child = model.child_model(replace(descriptor, is_optional=False))
+                serializer = _NestedMask(child.mask_of(nested_include, nested_exclude), descriptor.is_optional)
+            key = model.keys.to_serialized(name)
+            plan.append(_Step(name, key, f'.{key}', serializer))
+        self._plan = tuple(plan)
+
+    def dump(self, o: Any, _ctx: Optional[Dumping] = None) -> Dict[str, Any]:
+        """Dumps the selected fields of a dataclass object to a dictionary."""
+        check_is_instance(o, self.model.cls)
+        root = _ctx is None
+        dumping: Dumping = Dumping(validating=False) if root else _ctx  # type: ignore # checked above
+        try:
+            if self.model.validate_on_dump:
+                validate(o)
+            return {key: dumping.run(step, serializer, getattr(o, name)) for name, key, step, serializer in self._plan}
+        except ValidationError:
+            raise
+        except Exception as e:
+            if root:
+                raise DumpError(o, dumping.stack) from e
+            raise
+
+    def __repr__(self):
+        return f'<DumpMask of {self.model.cls.__qualname__} to {", ".join(step.name for step in self._plan)}>'
+
+
+class _NestedMask(Dumper):
+    """Dumps a nested dataclass field with a mask."""
+
+    def __init__(self, mask: DumpMask, optional: bool):
+        self.mask = mask
+        self.optional = optional
+
+    def dump(self, value: Any, ctx: Dumping) -> Any:
+        if value is None and self.optional:
+            return None
+        return self.mask.dump(value, ctx)
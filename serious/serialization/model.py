@@ -7,17 +7,26 @@ from __future__ import annotations
 __all__ = ['SeriousModel']
 
 from dataclasses import fields, MISSING, Field, is_dataclass
-from typing import Generic, Iterable, Type, Dict, Any, Union, Mapping, Optional, Iterator, TypeVar
+from typing import Generic, Iterable, Type, Dict, Any, Union, Mapping, Optional, Iterator, TypeVar, FrozenSet, Tuple, \
+    Callable, List
 
+from serious.caches import CacheOptions, CacheStats, DumpCache, LruCache, cache_options, MISSING as NOT_CACHED
 from serious.checks import check_is_instance
-from serious.descriptors import scan_types, TypeDescriptor
+from serious.descriptors import scan_types, TypeDescriptor, DescTypes
 from serious.errors import ModelContainsAny, ModelContainsUnion, MissingField, UnexpectedItem, ValidationError, \
     LoadError, DumpError, FieldMissingSerializer
-from serious.utils import Dataclass
+from serious.utils import Dataclass, attributes_getter
 from serious.validation import validate
-from .check_immutable import check_immutable
+from .check_immutable import check_immutable, extract_mutable, is_frozen_dc
 from .key_mapper import KeyMapper, NoopKeyMapper
 from .context import Loading, Dumping
+from .diff import dump_diff, apply_diff
+from .flyweight import FlyweightTable
+from .interning import string_interning
+from .lazy import LazyProxy, lazy_class
+from .paths import FieldTree, field_tree
+from .masks import DumpMask
+from .projection import Projection
 from .serializer import FieldSerializer
 
 T = TypeVar('T')
@@ -47,7 +56,13 @@ class SeriousModel(Generic[T]):
             validate_on_dump: bool,
             ensure_frozen: Union[bool, Iterable[Type]],
             key_mapper: Optional[KeyMapper] = None,
-            _registry: Dict[TypeDescriptor, SeriousModel] = None
+            intern_strings: Union[bool, int] = False,
+            canonicalize: Union[bool, Iterable[Type]] = False,
+            dump_cache: Union[bool, int, CacheOptions] = False,
+            scalar_cache: Union[bool, int, CacheOptions] = False,
+            _registry: Dict[TypeDescriptor, SeriousModel] = None,
+            _intern: Optional[Callable[[str], str]] = None,
+            _scalar_caches: Optional[List[LruCache]] = None,
     ):
         """Initialize a Serious Model.
 
@@ -62,8 +77,21 @@ class SeriousModel(Generic[T]):
         :param ensure_frozen: `False` to skip check of model immutability; `True` will perform the check
                 against built-in immutable types; a list of custom immutable types is added to built-ins.
         :param key_mapper: remap field names of between dataclass and serialized objects.
+        :param intern_strings: `True` to pass loaded strings (values and dictionary keys) through `sys.intern`;
+                a number to share repeated strings via a table of this many strings kept by the model;
+                `False` to keep every loaded string a separate object.
+        :param canonicalize: `True` to return a shared instance for equal loaded objects of every frozen dataclass
+                in the model; a list of frozen dataclasses to do so only for them; `False` to construct every object.
+        :param dump_cache: `True` to keep dumped dictionaries of deeply immutable frozen dataclasses
+                and return them when the same objects are dumped again; a number to set the cache size;
+                `CacheOptions` to also configure keys and eviction. Each such dataclass in the model gets its own cache.
+        :param scalar_cache: `True` to keep UUID, decimal, date/time and enum values loaded from strings (or enum values)
+                and return them when the same raw values are loaded again; a number to set the cache size;
+                `CacheOptions` to also set eviction and TTL. Each field serializer gets its own cache.
         :param _registry: a mapping of dataclass type descriptors to corresponding serious serializer;
                 used internally to create child serializers.
+        :param _intern: the interning function shared with child serializers.
+        :param _scalar_caches: the list of scalar caches of all serializers, shared with child serializers.
         """
         assert is_dataclass(descriptor.cls), 'Serious can only operate on dataclasses.'
         all_types = scan_types(descriptor)
@@ -81,9 +109,28 @@ class SeriousModel(Generic[T]):
         self.validate_on_load = validate_on_load
         self.validate_on_dump = validate_on_dump
         self.ensure_frozen = ensure_frozen
+        self.intern_strings = intern_strings
+        self.canonicalize: Union[bool, FrozenSet[Type]] = \
+            canonicalize if isinstance(canonicalize, bool) else frozenset(canonicalize)
+        self.canonical: Optional[FlyweightTable[T]] = _flyweight_table(descriptor.cls, self.canonicalize)
+        self.intern = _intern or string_interning(intern_strings)
+        self.dump_cache_options = dump_cache
+        self.deeply_frozen = _is_deeply_frozen(descriptor, all_types, ensure_frozen)
+        options = cache_options(dump_cache)
+        self.dump_cache = DumpCache(options) if options is not None and self.deeply_frozen else None
+        self.scalar_cache_options = scalar_cache
+        self._scalar_caches: List[LruCache] = [] if _scalar_caches is None else _scalar_caches
         self.serializer_registry = {descriptor: self} if not _registry else _registry
         self.keys = key_mapper or NoopKeyMapper()
         self.serializers_by_field = {name: self.find_serializer(desc) for name, desc in descriptor.fields.items()}
+        self._field_values = attributes_getter(list(self.serializers_by_field))
+        self._dump_plan = tuple((self.keys.to_serialized(name), f'.{self.keys.to_serialized(name)}', serializer)
+                                for name, serializer in self.serializers_by_field.items())
+        self._lazy_class: Optional[Type[LazyProxy[T]]] = None
+        self._projections: Dict[FieldTree, Projection] = {}
+        self._projections_by_paths: Dict[FrozenSet[str], Projection] = {}
+        self._masks: Dict[Tuple[Optional[FieldTree], Optional[FieldTree]], DumpMask] = {}
+        self._masks_by_paths: Dict[Tuple[Optional[FrozenSet[str]], Optional[FrozenSet[str]]], DumpMask] = {}
 
     @property
     def cls(self) -> Type[T]:
@@ -97,14 +144,7 @@ class SeriousModel(Generic[T]):
         root = _ctx is None
         loading: Loading
         loading = Loading(validating=self.validate_on_load) if root else _ctx  # type: ignore # checked above
-        mut_data = {self.keys.to_model(key): value for key, value in data.items()}
-        if self.allow_missing:
-            for field in fields_missing_from(mut_data, self.cls):
-                mut_data[field.name] = None
-        else:
-            check_for_missing(self.cls, mut_data)
-        if not self.allow_unexpected:
-            check_for_unexpected(self.cls, mut_data)
+        mut_data = self._model_keyed(data)
         try:
             init_kwargs = {
                 field: loading.run(f'.{self.keys.to_serialized(field)}', serializer, mut_data[field])
@@ -114,6 +154,8 @@ class SeriousModel(Generic[T]):
             result = self.cls(**init_kwargs)  # type: ignore # not an object
             if self.validate_on_load:
                 validate(result)
+            if self.canonical is not None:
+                return self.canonical(result)
             return result
         except ValidationError:
             raise
@@ -122,20 +164,119 @@ class SeriousModel(Generic[T]):
                 raise LoadError(self.cls, loading.stack, data) from e
             raise
 
-    def dump(self, o: T, _ctx: Optional[Dumping] = None) -> Dict[str, Any]:
-        """Dumps a dataclass object to a dictionary."""
+    def load_lazy(self, data: Mapping) -> LazyProxy[T]:
+        """Checks the keys of data and returns a proxy loading the dataclass fields on first access.
+
+        Call `materialize()` on the proxy to get the dataclass instance.
+        """
+        check_is_instance(data, Mapping, f'Invalid data for {self.cls}')  # type: ignore
+        return self.lazy_class(self._model_keyed(data))
+
+    @property
+    def lazy_class(self) -> Type[LazyProxy[T]]:
+        """A proxy class generated for the model dataclass on first use."""
+        if self._lazy_class is None:
+            self._lazy_class = lazy_class(self)
+        return self._lazy_class
+
+    def projection(self, paths: Union[str, Iterable[str]]) -> Projection:
+        """Returns a projection loading only the fields selected by dotted paths, like `{'id', 'owner.name'}`.
 
+        Projections are compiled once per set of paths.
+
+        :raises InvalidFieldPath: if a path does not match the dataclass fields.
+        """
+        key = frozenset([paths] if isinstance(paths, str) else paths)
+        projection = self._projections_by_paths.get(key)
+        if projection is None:
+            projection = self.projection_of(field_tree(self.descriptor, key))
+            self._projections_by_paths[key] = projection
+        return projection
+
+    def projection_of(self, tree: FieldTree) -> Projection:
+        """Returns a projection of fields selected by a compiled tree."""
+        projection = self._projections.get(tree)
+        if projection is None:
+            projection = Projection(self, tree)
+            self._projections[tree] = projection
+        return projection
+
+    def mask(
+            self,
+            include: Union[str, Iterable[str], None] = None,
+            exclude: Union[str, Iterable[str], None] = None,
+    ) -> DumpMask:
+        """Returns a mask dumping only the fields selected by dotted paths, like `include={'id', 'owner.name'}`.
+
+        Masks are compiled once per pair of path sets.
+
+        :param include: paths of fields to dump; `None` to dump all fields.
+        :param exclude: paths of fields to leave out of the included ones.
+        :raises InvalidFieldPath: if a path does not match the dataclass fields.
+        """
+        key = (_path_set(include), _path_set(exclude))
+        mask = self._masks_by_paths.get(key)
+        if mask is None:
+            include_tree, exclude_tree = (None if paths is None else field_tree(self.descriptor, paths) for paths in key)
+            mask = self.mask_of(include_tree, exclude_tree)
+            self._masks_by_paths[key] = mask
+        return mask
+
+    def mask_of(self, include: Optional[FieldTree], exclude: Optional[FieldTree]) -> DumpMask:
+        """Returns a mask of fields selected by compiled trees."""
+        mask = self._masks.get((include, exclude))
+        if mask is None:
+            mask = DumpMask(self, include, exclude)
+            self._masks[(include, exclude)] = mask
+        return mask
+
+    def _model_keyed(self, data: Mapping) -> Dict[str, Any]:
+        """Maps data keys to field names, checking for missing and unexpected fields."""
+        mut_data = {self.keys.to_model(key): value for key, value in data.items()}
+        if self.allow_missing:
+            for field in fields_missing_from(mut_data, self.cls):
+                mut_data[field.name] = None
+        else:
+            check_for_missing(self.cls, mut_data)
+        if not self.allow_unexpected:
+            check_for_unexpected(self.cls, mut_data)
+        return mut_data
+
+    def dump(
+            self,
+            o: T,
+            _ctx: Optional[Dumping] = None,
+            *,
+            include: Union[str, Iterable[str], None] = None,
+            exclude: Union[str, Iterable[str], None] = None,
+    ) -> Dict[str, Any]:
+        """Dumps a dataclass object to a dictionary.
+
+        :param include: dotted paths of fields to dump (like `{'id', 'owner.name'}`); `None` to dump all fields.
+        :param exclude: dotted paths of fields to leave out.
+
+        With a dump cache, repeated dumps of an object return the same dictionary, which must not be modified.
+        """
+        if include is not None or exclude is not None:
+            return self.mask(include, exclude).dump(o, _ctx)
         check_is_instance(o, self.cls)
+        cache = self.dump_cache
+        if cache is not None:
+            cached = cache.get(o)
+            if cached is not NOT_CACHED:
+                return cached
         root = _ctx is None
         dumping: Dumping = Dumping(validating=False) if root else _ctx  # type: ignore # checked above
         try:
-            _s = self.keys.to_serialized
             if self.validate_on_dump:
                 validate(o)
-            return {
-                _s(field): dumping.run(f'.{_s(field)}', serializer, getattr(o, field))
-                for field, serializer in self.serializers_by_field.items()
+            result = {
+                key: dumping.run(step, serializer, value)
+                for (key, step, serializer), value in zip(self._dump_plan, self._field_values(o))
             }
+            if cache is not None:
+                cache.put(o, result)
+            return result
         except ValidationError:
             raise
         except Exception as e:
@@ -143,6 +284,35 @@ class SeriousModel(Generic[T]):
                 raise DumpError(o, dumping.stack) from e
             raise
 
+    def dump_diff(self, old: T, new: T) -> Dict[str, Any]:
+        """Dumps fields of `new` which differ from `old` to a flat dictionary keyed by dotted paths.
+
+        Nested dataclasses are compared field by field; identical objects are skipped without comparing them.
+        """
+        return dump_diff(self, old, new)
+
+    def apply_diff(self, o: T, diff: Mapping[str, Any]) -> T:
+        """Loads a diff created by `dump_diff` and returns a copy of the object with the changes applied."""
+        return apply_diff(self, o, diff)
+
+    def dump_cache_stats(self) -> CacheStats:
+        """Hits, misses and evictions of the dump caches of this model and its nested dataclasses."""
+        models = {id(model): model for model in self.serializer_registry.values()}
+        return CacheStats.total(model.dump_cache.stats for model in models.values() if model.dump_cache is not None)
+
+    def scalar_cache(self) -> Optional[LruCache]:
+        """Creates a cache of converted scalar values for a field serializer; `None` if `scalar_cache` is disabled."""
+        options = cache_options(self.scalar_cache_options)
+        if options is None:
+            return None
+        cache: LruCache = LruCache(options)
+        self._scalar_caches.append(cache)
+        return cache
+
+    def scalar_cache_stats(self) -> CacheStats:
+        """Hits, misses and evictions of the scalar caches of all serializers of the model."""
+        return CacheStats.total(cache.stats for cache in self._scalar_caches)
+
     def child_model(self, descriptor: TypeDescriptor) -> SeriousModel:
         """
         Creates a `SeriousModel` for dataclass fields nested in the current serializers.
@@ -162,7 +332,13 @@ class SeriousModel(Generic[T]):
             validate_on_dump=self.validate_on_dump,
             ensure_frozen=self.ensure_frozen,
             key_mapper=self.keys,
-            _registry=self.serializer_registry
+            intern_strings=self.intern_strings,
+            canonicalize=self.canonicalize,
+            dump_cache=self.dump_cache_options,
+            scalar_cache=self.scalar_cache_options,
+            _registry=self.serializer_registry,
+            _intern=self.intern,
+            _scalar_caches=self._scalar_caches,
         )
         self.serializer_registry[descriptor] = new_model
         return new_model
@@ -184,6 +360,34 @@ class SeriousModel(Generic[T]):
         return optional_sr
 
 
+def _flyweight_table(cls: Type, canonicalize: Union[bool, FrozenSet[Type]]) -> Optional[FlyweightTable]:
+    if isinstance(canonicalize, bool):
+        return FlyweightTable(cls) if canonicalize and is_frozen_dc(cls) else None
+    for type_ in canonicalize:
+        if not is_frozen_dc(type_):
+            raise ValueError(f'Only frozen dataclasses can be canonicalized, got {type_}')
+    return FlyweightTable(cls) if cls in canonicalize else None
+
+
+def _is_deeply_frozen(
+        descriptor: TypeDescriptor,
+        all_types: DescTypes,
+        ensure_frozen: Union[bool, Iterable[Type]],
+) -> bool:
+    if not is_frozen_dc(descriptor.cls):
+        return False
+    also_immutable: Iterable[Type] = ()
+    if not isinstance(ensure_frozen, bool):
+        also_immutable = ensure_frozen
+    return not extract_mutable(all_types, also_immutable)
+
+
+def _path_set(paths: Union[str, Iterable[str], None]) -> Optional[FrozenSet[str]]:
+    if paths is None:
+        return None
+    return frozenset([paths] if isinstance(paths, str) else paths)
+
+
 def check_for_missing(cls: Type[Dataclass], data: Mapping) -> None:
     """ Checks for missing keys in data that are part of the provided dataclass.
     :raises: MissingField
@@ -0,0 +1,62 @@
+"""Dotted field paths (like `"owner.name"`) selecting parts of a dataclass, used by projections and dump masks.
+
+A set of paths is compiled to a `FieldTree`: a mapping of field names either to `None`,
+meaning the whole field is selected, or to a tree of the nested dataclass fields.
+"""
+from __future__ import annotations
+
+__all__ = ['FieldTree', 'field_tree']
+
+from dataclasses import replace
+from typing import Any, Dict, Iterable, Mapping, Optional, Union
+
+from serious.descriptors import TypeDescriptor
+from serious.errors import InvalidFieldPath
+from serious.types import FrozenDict
+
+FieldTree = Mapping[str, Optional[Mapping[str, Any]]]  # Nested trees are field trees too, mypy lacks recursive types.
+
+
+def field_tree(descriptor: TypeDescriptor, paths: Union[str, Iterable[str]]) -> FieldTree:
+    """Compile dotted paths to a tree of selected fields.
+
+    Paths are field names of the dataclasses (not the serialized keys); the tree follows the order of fields. Selecting a field as a whole
+    takes precedence over selecting its nested fields, e.g. `{'owner', 'owner.name'}` is the same as `{'owner'}`.
+
+    :raises InvalidFieldPath: if a path does not match the dataclass fields
+            or goes through a field which is not a dataclass.
+    """
+    if isinstance(paths, str):
+        paths = [paths]
+    tree: Dict[str, Optional[dict]] = {}
+    for path in paths:
+        _add_path(descriptor, tree, path)
+    return _freeze(descriptor, tree)
+
+
+def _add_path(root: TypeDescriptor, tree: Dict[str, Optional[dict]], path: str) -> None:
+    descriptor = root
+    names = path.split('.')
+    for depth, name in enumerate(names):
+        if not descriptor.is_dataclass:
+            raise InvalidFieldPath(root.cls, path, f'"{".".join(names[:depth])}" is not a dataclass')
+        fields = descriptor.fields
+        if name not in fields:
+            raise InvalidFieldPath(root.cls, path, f'{descriptor.cls.__name__} has no field "{name}"')
+        last = depth == len(names) - 1
+        if last:
+            tree[name] = None
+            return
+        if name in tree and tree[name] is None:
+            return  # the whole field is already selected
+        tree = tree.setdefault(name, {})  # type: ignore # not None after the check
+        descriptor = replace(fields[name], is_optional=False)
+
+
+def _freeze(descriptor: TypeDescriptor, tree: Dict[str, Optional[dict]]) -> FieldTree:
+    """Makes the tree immutable, ordering the names as the dataclass fields."""
+    return FrozenDict({
+        name: None if tree[name] is None else _freeze(replace(field, is_optional=False), tree[name])  # type: ignore
+        for name, field in descriptor.fields.items()
+        if name in tree
+    })
@@ -0,0 +1,115 @@
+"""Projections loading only the selected fields of a dataclass into a generated frozen dataclass."""
+from __future__ import annotations
+
+__all__ = ['Projection']
+
+from dataclasses import fields, make_dataclass, MISSING, replace
+from typing import Any, Callable, List, Mapping, NamedTuple, Optional, Type, TYPE_CHECKING
+
+from serious.checks import check_is_instance
+from serious.errors import ValidationError, LoadError, MissingField
+from .context import Loading
+from .paths import FieldTree
+from .serializer import Loader
+
+if TYPE_CHECKING:
+    from .model import SeriousModel
+
+
+class _Step(NamedTuple):
+    name: str
+    key: str
+    step: str
+    serializer: Loader
+    default: Callable[[], Any]
+
+
+class Projection:
+    """Loads a subset of dataclass fields, skipping the serializers of all other fields.
+
+    The result is an instance of a generated frozen dataclass named after the original one
+    (e.g. `RepoProjection`), containing only the selected fields. Fields selected by nested paths
+    are projections of the nested dataclasses. Keys of the data which are not selected are not checked.
+
+    Field values are validated as in the original model; the `__validate__` of the original dataclass is not called.
+    Projections are created by `SeriousModel.projection(paths)` which caches them per set of paths.
+    """
+
+    def __init__(self, model: SeriousModel, tree: FieldTree):
+        self.model = model
+        self.tree = tree
+        dc_fields = {field.name: field for field in fields(model.cls)}
+        plan: List[_Step] = []
+        annotations = []
+        for name, subtree in tree.items():
+            if subtree is None:
+                serializer: Loader = model.serializers_by_field[name]
+                annotation = dc_fields[name].type
+            else:
+                descriptor = model.descriptor.fields[name]
+                child = model.child_model(replace(descriptor, is_optional=False)).projection_of(subtree)
+                serializer = _NestedProjection(child, descriptor.is_optional)
+                annotation = Optional[child.cls] if descriptor.is_optional else child.cls
+            key = model.keys.to_serialized(name)
+            plan.append(_Step(name, key, f'.{key}', serializer, _default(dc_fields[name])))
+            annotations.append((name, annotation))
+        self._plan = tuple(plan)
+        self.cls: Type = make_dataclass(f'{model.cls.__name__}Projection', annotations, frozen=True)
+        self.cls.__module__ = model.cls.__module__
+
+    def load(self, data: Mapping, _ctx: Optional[Loading] = None) -> Any:
+        """Loads the selected fields from a dictionary or other mapping."""
+        check_is_instance(data, Mapping, f'Invalid data for {self.model.cls}')  # type: ignore
+        root = _ctx is None
+        loading: Loading = Loading(validating=self.model.validate_on_load) if root else _ctx  # type: ignore
+        if not self.model.allow_missing:
+            missing = [name for name, key, *_ in self._plan if key not in data]
+            if missing:
+                raise MissingField(self.model.cls, data, missing)
+        try:
+            init_kwargs = {
+                name: loading.run(step, serializer, data[key]) if key in data else default()
+                for name, key, step, serializer, default in self._plan
+            }
+            return self.cls(**init_kwargs)
+        except ValidationError:
+            raise
+        except Exception as e:
+            if root:
+                raise LoadError(self.model.cls, loading.stack, data) from e
+            raise
+
+    def __repr__(self):
+        return f'<Projection of {self.model.cls.__qualname__} to {", ".join(_paths(self.tree))}>'
+
+
+class _NestedProjection(Loader):
+    """Loads a nested dataclass field as a projection."""
+
+    def __init__(self, projection: Projection, optional: bool):
+        self.projection = projection
+        self.optional = optional
+        self._dc_name = projection.model.cls.__name__
+
+    def load(self, value: Any, ctx: Loading) -> Any:
+        if value is None and self.optional:
+            return None
+        if not isinstance(value, dict):
+            raise ValidationError(f'Invalid data type. Expecting a mapping matching {self._dc_name} model')
+        return self.projection.load(value, ctx)
+
+
+def _default(field: Any) -> Callable[[], Any]:
+    """A factory of a value for a field missing from data when loading with `allow_missing`."""
+    if field.default is not MISSING:
+        return lambda: field.default
+    if field.default_factory is not MISSING:
+        return field.default_factory
+    return lambda: None
+
+
+def _paths(tree: FieldTree, prefix: str = '') -> List[str]:
+    paths = []
+    for name, subtree in tree.items():
+        paths.extend([prefix + name] if subtree is None else _paths(subtree, f'{prefix}{name}.'))
+    return paths
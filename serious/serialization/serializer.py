@@ -13,17 +13,26 @@ if TYPE_CHECKING:
     from .context import Loading, Dumping
 
 
-class Serializer(Generic[M, S], ABC):
+class Loader(Generic[M, S], ABC):
+    """Loads model values from serialized ones. Load-only steps (like projections) implement it alone."""
 
     @abstractmethod
     def load(self, value: S, ctx: Loading) -> M:
         raise NotImplementedError
 
+
+class Dumper(Generic[M, S], ABC):
+    """Dumps model values to serialized ones. Dump-only steps (like masks and JSON fragments) implement it alone."""
+
     @abstractmethod
     def dump(self, value: M, ctx: Dumping) -> S:
         raise NotImplementedError
 
 
+class Serializer(Loader[M, S], Dumper[M, S], ABC):
+    pass
+
+
 class FieldSerializer(Serializer[S, M], ABC):
     """
     A abstract field serializer defining a constructor invoked by serious `dump`, `load` and class `fits` methods.
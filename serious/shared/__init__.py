@@ -0,0 +1,9 @@
+"""Passing dataclasses between processes through `multiprocessing.shared_memory` (Python 3.8+).
+
+Batches of dataclasses are encoded by a binary model and written into a ring buffer,
+instead of pickling the object graph on one side and unpickling it on the other.
+"""
+__all__ = ['SharedMemoryChannel', 'RingBuffer']
+
+from .channel import SharedMemoryChannel
+from .ring import RingBuffer
@@ -0,0 +1,78 @@
+"""A channel passing batches of dataclasses between processes through shared memory."""
+from __future__ import annotations
+
+__all__ = ['SharedMemoryChannel']
+
+from typing import Any, Collection, Generic, List, Optional, TypeVar
+
+from .ring import RingBuffer
+
+T = TypeVar('T')
+
+
+class SharedMemoryChannel(Generic[T]):
+    """Passes batches of dataclasses from one process to another via a shared memory ring buffer.
+
+    Batches are encoded by a binary model (`BinaryModel` or `StructModel`) instead of being pickled,
+    so neither the object graph nor the class references are written, only the field values.
+
+    A channel has a single producer and a single consumer. It can be passed to another process
+    (e.g. as an argument of `multiprocessing.Process` or `ProcessPoolExecutor.submit`),
+    which attaches to the same shared memory block.
+
+        :Example:
+
+        channel = SharedMemoryChannel(BinaryModel(Order), capacity=2 ** 24)
+        process = Process(target=produce, args=(channel,))  # calls channel.send(orders)
+        process.start()
+        orders = channel.receive()
+        ...
+        channel.close()
+    """
+
+    def __init__(self, model: Any, capacity: int = 2 ** 24, *, name: Optional[str] = None):
+        """Create a channel with a new shared memory block, or attach to an existing one by name.
+
+        :param model: a model with `dump_many` returning bytes and `load_many` loading them back.
+        :param capacity: size of the ring buffer in bytes; a single batch must fit it.
+        :param name: name of a shared memory block of an existing channel to attach to.
+        """
+        self.model = model
+        self._ring = RingBuffer(capacity, name=name)
+
+    @property
+    def name(self) -> str:
+        """Name of the shared memory block."""
+        return self._ring.name
+
+    def send(self, items: Collection[T], timeout: Optional[float] = None) -> None:
+        """Encode a batch and write it to shared memory, waiting for free space if needed.
+
+        :raises TimeoutError: if the consumer did not free enough space before timeout.
+        """
+        self._ring.put(self.model.dump_many(items), timeout)
+
+    def receive(self, timeout: Optional[float] = None) -> List[T]:
+        """Wait for the next batch and load it.
+
+        :raises TimeoutError: if no batch arrived before timeout.
+        """
+        return self.model.load_many(self._ring.get(timeout))
+
+    def close(self) -> None:
+        """Detach from shared memory. A channel which created the block also destroys it."""
+        self._ring.close()
+
+    def __enter__(self) -> SharedMemoryChannel[T]:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __reduce__(self):
+        # Other processes attach to the same block instead of copying it.
+        return _attach, (self.model, self.name)
+
+
+def _attach(model: Any, name: str) -> SharedMemoryChannel:
+    return SharedMemoryChannel(model, name=name)
@@ -0,0 +1,143 @@
+"""A single-producer single-consumer ring buffer of byte messages in `multiprocessing.shared_memory`.
+
+Layout of the shared block: a header of three unsigned 64-bit integers (capacity, bytes written, bytes read)
+followed by the ring data. Each message is a 4-byte length followed by the message bytes, wrapping around
+the end of the data area. The producer only moves the written counter and the consumer only moves the read one,
+so no locks are needed as long as there is a single process on each side.
+
+Counters are read and written without any synchronization, so the buffer is strictly single-producer
+single-consumer: several processes (or threads) putting to, or getting from, the same buffer
+must serialize the calls themselves, e.g. with a `multiprocessing.Lock` of their own.
+"""
+from __future__ import annotations
+
+__all__ = ['RingBuffer']
+
+import os
+import time
+from struct import Struct
+from typing import Optional
+
+try:
+    from multiprocessing.shared_memory import SharedMemory  # type: ignore # added in Python 3.8
+except ImportError as e:
+    raise ImportError('serious.shared requires multiprocessing.shared_memory of Python 3.8 or newer') from e
+
+_header = Struct('<QQQ')
+_length = Struct('<I')
+_CAPACITY, _WRITTEN, _READ = 0, 8, 16
+
+
+class RingBuffer:
+    """Byte messages passed through a shared memory block from a single producer to a single consumer process."""
+
+    def __init__(self, capacity: Optional[int] = None, *, name: Optional[str] = None):
+        """Create a new ring buffer, or attach to an existing one by name.
+
+        :param capacity: number of bytes available for messages; required when creating a new buffer.
+        :param name: name of an existing shared memory block created by another `RingBuffer`.
+        """
+        if name is None:
+            if not capacity or capacity < _length.size + 1:
+                raise ValueError('Ring buffer capacity must be provided to create a new buffer')
+            self._memory = SharedMemory(create=True, size=_header.size + capacity)
+            _header.pack_into(self._memory.buf, 0, capacity, 0, 0)
+            self._owner_pid: Optional[int] = os.getpid()
+        else:
+            self._memory = SharedMemory(name=name)
+            self._owner_pid = None
+        self._buffer = self._memory.buf
+        self.capacity: int = _header.unpack_from(self._buffer, 0)[0]
+
+    @property
+    def name(self) -> str:
+        return self._memory.name
+
+    @property
+    def owner(self) -> bool:
+        """The buffer was created by this process. Copies of the owner in forked processes are not owners."""
+        return self._owner_pid == os.getpid()
+
+    @property
+    def used(self) -> int:
+        """Number of bytes written but not read yet."""
+        _, written, read = _header.unpack_from(self._buffer, 0)
+        return written - read
+
+    def put(self, message: bytes, timeout: Optional[float] = None) -> None:
+        """Write a message, waiting for the consumer to free enough space.
+
+        :raises ValueError: if the message can never fit the buffer.
+        :raises TimeoutError: if there was not enough space before timeout.
+        """
+        size = _length.size + len(message)
+        if size > self.capacity:
+            raise ValueError(f'Message of {len(message)} bytes does not fit a ring of {self.capacity} bytes')
+        written = self._counter(_WRITTEN)
+        deadline = _deadline(timeout)
+        delay = _Backoff()
+        while written + size - self._counter(_READ) > self.capacity:
+            delay.wait(deadline, 'Timed out waiting for free space in ring buffer')
+        self._write(written, _length.pack(len(message)))
+        self._write(written + _length.size, message)
+        self._set_counter(_WRITTEN, written + size)
+
+    def get(self, timeout: Optional[float] = None) -> bytes:
+        """Read the next message, waiting for the producer to write one.
+
+        :raises TimeoutError: if no message arrived before timeout.
+        """
+        read = self._counter(_READ)
+        deadline = _deadline(timeout)
+        delay = _Backoff()
+        while self._counter(_WRITTEN) == read:
+            delay.wait(deadline, 'Timed out waiting for a message in ring buffer')
+        length = _length.unpack(self._read(read, _length.size))[0]
+        message = self._read(read + _length.size, length)
+        self._set_counter(_READ, read + _length.size + length)
+        return message
+
+    def _write(self, position: int, data: bytes) -> None:
+        start = _header.size + position % self.capacity
+        first = min(len(data), _header.size + self.capacity - start)
+        self._buffer[start:start + first] = data[:first]
+        if first < len(data):
+            self._buffer[_header.size:_header.size + len(data) - first] = data[first:]
+
+    def _read(self, position: int, size: int) -> bytes:
+        start = _header.size + position % self.capacity
+        first = min(size, _header.size + self.capacity - start)
+        data = bytes(self._buffer[start:start + first])
+        if first < size:
+            data += bytes(self._buffer[_header.size:_header.size + size - first])
+        return data
+
+    def _counter(self, offset: int) -> int:
+        return int.from_bytes(self._buffer[offset:offset + 8], 'little')
+
+    def _set_counter(self, offset: int, value: int) -> None:
+        self._buffer[offset:offset + 8] = value.to_bytes(8, 'little')
+
+    def close(self) -> None:
+        """Detach from the shared memory. The owner also destroys the block, unless closed in a forked child."""
+        self._buffer.release()
+        self._memory.close()
+        if self.owner:
+            self._memory.unlink()
+
+
+def _deadline(timeout: Optional[float]) -> Optional[float]:
+    return None if timeout is None else time.monotonic() + timeout
+
+
+class _Backoff:
+    """Sleeps increasingly longer between polls of the ring counters, up to a millisecond."""
+
+    def __init__(self):
+        self._delay = 0.0
+
+    def wait(self, deadline: Optional[float], message: str) -> None:
+        if deadline is not None and time.monotonic() > deadline:
+            raise TimeoutError(message)
+        time.sleep(self._delay)
+        self._delay = min(self._delay * 2 or 0.00001, 0.001)
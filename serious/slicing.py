@@ -0,0 +1,79 @@
+"""Cooperative loading of large batches inside an asyncio event loop.
+
+Items are processed in slices bounded by time and/or number of items.
+Between slices control is returned to the event loop, so other tasks keep running while a batch is loaded.
+"""
+from __future__ import annotations
+
+__all__ = ['load_sliced', 'DEFAULT_TIME_BUDGET']
+
+from itertools import islice
+from time import perf_counter
+from typing import Any, Callable, Iterable, Iterator, List, Optional, TypeVar, TYPE_CHECKING
+
+if TYPE_CHECKING:  # asyncio and concurrent.futures are imported only when loading, to keep `import serious` fast.
+    from concurrent.futures import Executor
+
+T = TypeVar('T')
+
+DEFAULT_TIME_BUDGET = 0.005  # seconds
+
+
+async def load_sliced(
+        load: Callable[[Any], T],
+        items: Iterable[Any],
+        *,
+        time_budget: Optional[float] = DEFAULT_TIME_BUDGET,
+        item_budget: Optional[int] = None,
+        executor: Optional[Executor] = None,
+) -> List[T]:
+    """Load each of the items, yielding to the event loop after each slice.
+
+    :param load: a function loading a single item.
+    :param items: the items to load.
+    :param time_budget: seconds a slice may run for; `None` to bound slices only by the number of items.
+    :param item_budget: maximum number of items in a slice; `None` to bound slices only by time.
+    :param executor: a thread pool to run slices in instead of the event loop thread.
+            Slices run one at a time, so a single thread is enough.
+    """
+    if time_budget is None and item_budget is None:
+        raise ValueError('Either time or item budget is required to slice the loading')
+    if item_budget is not None and item_budget < 1:
+        raise ValueError('Item budget must be positive')
+    import asyncio
+    iterator = iter(items)
+    results: List[T] = []
+    loop = asyncio.get_running_loop()
+    while True:
+        if executor is None:
+            exhausted = _load_slice(load, iterator, results, time_budget, item_budget)
+            await asyncio.sleep(0)
+        else:
+            exhausted = await loop.run_in_executor(
+                executor, _load_slice, load, iterator, results, time_budget, item_budget)
+        if exhausted:
+            return results
+
+
+def _load_slice(
+        load: Callable[[Any], T],
+        iterator: Iterator[Any],
+        results: List[T],
+        time_budget: Optional[float],
+        item_budget: Optional[int],
+) -> bool:
+    """Load items until the budget is spent. Returns `True` when there are no more items."""
+    if item_budget is not None:
+        iterator = islice(iterator, item_budget)
+    count = len(results)
+    if time_budget is None:
+        results.extend(map(load, iterator))
+    else:
+        deadline = perf_counter() + time_budget
+        for item in iterator:
+            results.append(load(item))
+            if perf_counter() >= deadline:
+                return False
+    loaded = len(results) - count
+    # A slice finishing under the budget has consumed all items, unless it was bounded by an item count.
+    return item_budget is None or loaded < item_budget
@@ -0,0 +1,4 @@
+"""A module with `StructModel` -- Serious model packing flat dataclasses into fixed-size binary records."""
+__all__ = ['StructModel']
+
+from .model import StructModel
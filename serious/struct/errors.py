@@ -0,0 +1,31 @@
+"""Errors specific to struct model."""
+from __future__ import annotations
+
+from typing import Type
+
+from serious.descriptors import TypeDescriptor
+from serious.errors import ModelError
+from serious.utils import class_path
+
+
+class VariableLengthField(ModelError):
+    """A dataclass field cannot be packed into a fixed number of bytes."""
+
+    def __init__(self, cls: Type, field: str, desc: TypeDescriptor):
+        super().__init__(cls)
+        self.field = field
+        self.desc = desc
+
+    @property
+    def message(self):
+        return (f'{class_path(self.cls)} field "{self.field}" ({self.desc}) has no fixed-size binary layout. '
+                f'Struct models support only int, float, bool, Timestamp, UUID, date and enum fields.')
+
+
+class EmptyRecord(ModelError):
+    """A dataclass has no fields, so its records would take no bytes and could not be told apart in a buffer."""
+
+    @property
+    def message(self):
+        return f'{class_path(self.cls)} has no fields to pack into a record.'
+
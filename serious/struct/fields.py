@@ -0,0 +1,105 @@
+"""Fixed-size layouts of dataclass fields, used to compile a dataclass into a `struct.Struct` format.
+
+A layout is picked by the type of field serializer `SeriousModel` resolves for a field.
+Fields with serializers not listed here have no fixed size and are rejected by the struct model.
+"""
+from __future__ import annotations
+
+__all__ = ['StructField', 'struct_field']
+
+from datetime import date
+from enum import Enum
+from typing import Any, Callable, NamedTuple, Optional, Dict, List
+from uuid import UUID
+
+from serious.serialization import FieldSerializer, EnumSerializer, BooleanSerializer, IntegerSerializer, \
+    FloatSerializer, UtcTimestampSerializer, UuidSerializer, DateIsoSerializer
+from serious.types import Timestamp
+
+Converter = Optional[Callable[[Any], Any]]
+
+
+class StructField(NamedTuple):
+    """A dataclass field packed at a fixed offset of a record.
+
+    Converters are `None` when the packed value is the field value itself.
+    """
+    name: str
+    format: str
+    offset: int
+    dump: Converter
+    load: Converter
+
+
+def struct_field(name: str, serializer: FieldSerializer, offset: int) -> Optional[StructField]:
+    """Creates a layout of a field at the provided offset, or returns `None` if it has no fixed size."""
+    layout = _layouts.get(type(serializer))
+    if layout is None:
+        return None
+    format_, dump, load = layout(serializer.type.cls)
+    return StructField(name, format_, offset, dump, load)
+
+
+def _subclass_load(cls: type, base: type) -> Converter:
+    return None if cls is base else cls
+
+
+def _integer(cls: type):
+    return 'q', None, _subclass_load(cls, int)
+
+
+def _float(cls: type):
+    return 'd', None, _subclass_load(cls, float)
+
+
+def _boolean(cls: type):
+    return '?', None, _subclass_load(cls, bool)
+
+
+def _timestamp(cls: type):
+    return 'd', _timestamp_value, Timestamp
+
+
+def _timestamp_value(value: Timestamp) -> float:
+    return value.value
+
+
+def _uuid(cls: type):
+    return '16s', _uuid_bytes, _uuid_from_bytes
+
+
+def _uuid_bytes(value: UUID) -> bytes:
+    return value.bytes
+
+
+def _uuid_from_bytes(value: bytes) -> UUID:
+    return UUID(bytes=value)
+
+
+def _date(cls: type):
+    return 'i', date.toordinal, date.fromordinal
+
+
+def _enum(cls: type):
+    """Integer enums are packed by value, others by member index in the smallest fitting unsigned integer."""
+    if issubclass(cls, int):
+        return 'q', _enum_value, cls
+    members: List[Enum] = list(cls)  # type: ignore # an enum class
+    indexes: Dict[Enum, int] = {member: i for i, member in enumerate(members)}
+    format_ = 'B' if len(members) <= 0xff else 'H' if len(members) <= 0xffff else 'I'
+    return format_, indexes.__getitem__, members.__getitem__
+
+
+def _enum_value(value: Enum) -> Any:
+    return value.value
+
+
+_layouts: Dict[type, Callable[[type], Any]] = {
+    EnumSerializer: _enum,
+    BooleanSerializer: _boolean,
+    IntegerSerializer: _integer,
+    FloatSerializer: _float,
+    UtcTimestampSerializer: _timestamp,
+    UuidSerializer: _uuid,
+    DateIsoSerializer: _date,
+}
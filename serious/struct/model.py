@@ -0,0 +1,292 @@
+"""A module with `StructModel` -- Serious model packing flat dataclasses into fixed-size binary records."""
+from __future__ import annotations
+
+__all__ = ['StructModel']
+
+from dataclasses import fields as dataclass_fields
+from operator import attrgetter
+from struct import Struct, calcsize, error as StructError
+from typing import TypeVar, Type, Generic, List, Collection, Iterable, Union, Any, Iterator, Optional, Tuple, \
+    Sequence, Dict
+
+from serious.checks import check_is_instance
+from serious.descriptors import describe
+from serious.errors import ValidationError, LoadError, DumpError, ReservedFieldName
+from serious.serialization import FieldSerializer, SeriousModel, field_serializers
+from serious.utils import class_path
+from serious.validation import validate
+from .errors import VariableLengthField, EmptyRecord
+from .fields import StructField, struct_field
+from .views import RecordView, RecordViews, view_class, RESERVED_NAMES
+
+T = TypeVar('T')
+
+Buffer = Any  # an object supporting the buffer protocol, e.g. bytes, bytearray, memoryview, mmap
+
+
+class StructModel(Generic[T]):
+    """A model packing flat dataclasses into fixed-size records using a compiled `struct.Struct`.
+
+    Only fields with fixed size are supported: `int` (8 bytes), `float` (8 bytes), `bool` (1 byte),
+    `Timestamp` (8 bytes), `UUID` (16 bytes), `date` (4 bytes) and enums (by value for `int` enums,
+    otherwise by member index). A model of a dataclass with any other field raises `VariableLengthField`.
+
+    Records are little-endian and unpadded. Every record of a model has the same `size`,
+    so a buffer of records can be addressed by index.
+
+        :Example:
+
+        from dataclasses import dataclass
+        from serious import StructModel, Timestamp
+
+        @dataclass(frozen=True)
+        class Point:
+            at: Timestamp
+            value: float
+
+        >>> model = StructModel(Point)
+        >>> buffer = model.pack_many([Point(Timestamp(0), 1.5), Point(Timestamp(1), 2.5)])
+        >>> list(model.iter_unpack(buffer))
+        [Point(at=<Timestamp 1970-01-01T00:00:00+00:00 (0.0)>, value=1.5), ...]
+
+    Check `__init__` parameters for a list of configuration options.
+    """
+
+    def __init__(
+            self,
+            cls: Type[T],
+            serializers: Iterable[Type[FieldSerializer]] = field_serializers(),
+            *,
+            validate_on_load: bool = True,
+            validate_on_dump: bool = False,
+            ensure_frozen: Union[bool, Iterable[Type]] = False,
+    ):
+        """Initialize a struct model.
+
+        :param cls: the dataclass type to pack/unpack.
+        :param serializers: field serializer classes in an order they will be tested for fitness for each field;
+                fields fitting custom serializers cannot be packed.
+        :param validate_on_load: to call dataclass `__validate__` method after object construction.
+        :param validate_on_dump: to call object `__validate__` before packing.
+        :param ensure_frozen: `False` to skip check of model immutability; `True` will perform the check
+                against built-in immutable types; a list of custom immutable types is added to built-ins.
+        """
+        self.cls = cls
+        self.descriptor = describe(cls)
+        self.serious_model: SeriousModel = SeriousModel(
+            self.descriptor,
+            serializers,
+            allow_any=False,
+            allow_missing=False,
+            allow_unexpected=False,
+            validate_on_load=validate_on_load,
+            validate_on_dump=validate_on_dump,
+            ensure_frozen=ensure_frozen,
+        )
+        self.fields = self._compile_fields()
+        if not self.fields:
+            raise EmptyRecord(cls)
+        self.struct = Struct('<' + ''.join(field.format for field in self.fields))
+        self.size = self.struct.size
+        self._validate_on_load = validate_on_load
+        self._validate_on_dump = validate_on_dump
+        self._names = tuple(field.name for field in self.fields)
+        self._get_values = attrgetter(*self._names)
+        init = tuple(f.init for f in dataclass_fields(cls))
+        self._init_indexes = None if all(init) else tuple(i for i, in_init in enumerate(init) if in_init)
+        self._dumps = tuple(field.dump for field in self.fields)
+        self._loads = tuple(field.load for field in self.fields)
+        self._converted_on_dump = any(dump is not None for dump in self._dumps)
+        self._converted_on_load = any(load is not None for load in self._loads)
+        self._validated = tuple(hasattr(desc.cls, '__validate__') for desc in self.descriptor.fields.values())
+        self._validating_fields = validate_on_load and any(self._validated)
+        self._validating_result = validate_on_load and hasattr(cls, '__validate__')
+        self._view_class: Optional[Type[RecordView[T]]] = None
+
+    def _compile_fields(self) -> Tuple[StructField, ...]:
+        fields = []
+        format_ = '<'
+        for name, serializer in self.serious_model.serializers_by_field.items():
+            if name in RESERVED_NAMES:
+                raise ReservedFieldName(self.cls, name, 'record views')
+            field = struct_field(name, serializer, calcsize(format_))
+            if field is None:
+                raise VariableLengthField(self.cls, name, serializer.type)
+            format_ += field.format
+            fields.append(field)
+        return tuple(fields)
+
+    @property
+    def format(self) -> str:
+        """The `struct` module format string of a single record."""
+        return self.struct.format
+
+    def pack(self, o: T) -> bytes:
+        """Pack a single dataclass to bytes."""
+        values = self._dump_values(o)
+        try:
+            return self.struct.pack(*values)
+        except StructError as e:
+            raise DumpError(o, []) from e
+
+    def pack_into(self, buffer: Buffer, offset: int, o: T) -> None:
+        """Pack a single dataclass to a writable buffer starting at offset."""
+        values = self._dump_values(o)
+        try:
+            self.struct.pack_into(buffer, offset, *values)
+        except StructError as e:
+            raise DumpError(o, []) from e
+
+    def pack_many(self, items: Collection[T], buffer: Optional[Buffer] = None, offset: int = 0) -> Buffer:
+        """Pack dataclasses one after another.
+
+        :param items: dataclass instances to pack.
+        :param buffer: a preallocated writable buffer (`bytearray`, `mmap`, shared memory `buf`, etc);
+                a new `bytearray` of the required size is created if `None`.
+        :param offset: position in buffer to write the first record at.
+        :return: the buffer with packed records.
+        """
+        if buffer is None:
+            buffer = bytearray(offset + len(items) * self.size)
+        pack_into = self.pack_into
+        size = self.size
+        for o in items:
+            pack_into(buffer, offset, o)
+            offset += size
+        return buffer
+
+    def unpack(self, buffer: Buffer, offset: int = 0) -> T:
+        """Unpack a single dataclass from a buffer starting at offset."""
+        try:
+            values = self.struct.unpack_from(buffer, offset)
+        except Exception as e:
+            raise LoadError(self.cls, [], self._record(buffer, offset)) from e
+        return self._load_values(values)
+
+    def iter_unpack(self, buffer: Buffer, offset: int = 0, count: Optional[int] = None) -> Iterator[T]:
+        """Lazily unpack consecutive records from a buffer.
+
+        :param buffer: any object supporting the buffer protocol.
+        :param offset: position of the first record in buffer.
+        :param count: number of records to unpack; all of the records till the buffer end if `None`.
+        """
+        view = memoryview(buffer).cast('B')  # type: ignore # missing from stubs
+        if count is None:
+            count = (len(view) - offset) // self.size
+        end = offset + count * self.size
+        if end > len(view):
+            incomplete = offset + (len(view) - offset) // self.size * self.size
+            raise LoadError(self.cls, [], self._record(view, incomplete)) \
+                from ValueError(f'Buffer is too small for {count} records')
+        load = self._load_values
+        for values in self.struct.iter_unpack(view[offset:end]):
+            yield load(values)
+
+    @property
+    def view_class(self) -> Type[RecordView[T]]:
+        """A `RecordView` subclass with properties reading the dataclass fields directly from a buffer."""
+        if self._view_class is None:
+            self._view_class = view_class(self)
+        return self._view_class
+
+    def view(self, buffer: Buffer, offset: int = 0) -> RecordView[T]:
+        """A zero-copy view of a single record in buffer at offset.
+
+        Fields are read from the buffer on each access. Call `materialize()` on a view to get the dataclass.
+        """
+        view = memoryview(buffer).cast('B')  # type: ignore # missing from stubs
+        if offset + self.size > len(view):
+            raise ValueError(f'Buffer is too small for a record at {offset}')
+        return self.view_class(view, offset)
+
+    def views(self, buffer: Buffer, offset: int = 0, count: Optional[int] = None) -> RecordViews[T]:
+        """A sequence of zero-copy views of consecutive records, supporting random access by index.
+
+        :param buffer: any object supporting the buffer protocol.
+        :param offset: position of the first record in buffer.
+        :param count: number of records; all of the records till the buffer end if `None`.
+        """
+        return RecordViews(self, buffer, offset, count)
+
+    def load(self, data: Buffer) -> T:
+        """Load a dataclass from a single record."""
+        if len(data) != self.size:
+            raise LoadError(self.cls, [], data) from ValueError(f'Expecting {self.size} bytes')
+        return self.unpack(data)
+
+    def load_many(self, data: Buffer) -> List[T]:
+        """Load a list of dataclasses from consecutive records."""
+        if len(data) % self.size:
+            incomplete = len(data) - len(data) % self.size
+            raise LoadError(self.cls, [], self._record(data, incomplete)) \
+                from ValueError(f'Expecting a multiple of {self.size} bytes')
+        return list(self.iter_unpack(data))
+
+    def dump(self, o: T) -> bytes:
+        """Dump a single dataclass to a record."""
+        return self.pack(o)
+
+    def dump_many(self, items: Collection[T]) -> bytes:
+        """Dump a list of dataclasses to consecutive records."""
+        return bytes(self.pack_many(items))
+
+    def _dump_values(self, o: T) -> Sequence[Any]:
+        check_is_instance(o, self.cls)
+        try:
+            if self._validate_on_dump:
+                validate(o)
+            values = self._get_values(o)
+            if len(self.fields) == 1:
+                values = (values,)
+            if not self._converted_on_dump:
+                return values
+            return [value if dump is None else dump(value) for value, dump in zip(values, self._dumps)]
+        except ValidationError:
+            raise
+        except Exception as e:
+            raise DumpError(o, []) from e
+
+    def _load_values(self, values: Tuple[Any, ...]) -> T:
+        try:
+            loaded: Sequence[Any] = values
+            if self._converted_on_load:
+                loaded = [value if load is None else load(value) for value, load in zip(values, self._loads)]
+            if self._validating_fields:
+                for value, validated in zip(loaded, self._validated):
+                    if validated:
+                        validate(value)
+            result = self.cls(**self._init_kwargs(loaded))  # type: ignore # not an object
+            if self._validating_result:
+                validate(result)
+            return result
+        except ValidationError:
+            raise
+        except Exception as e:
+            raise LoadError(self.cls, [], dict(zip(self._names, values))) from e
+
+    def _init_kwargs(self, values: Sequence[Any]) -> Dict[str, Any]:
+        # Fields excluded from `__init__` are packed and viewed, but set by the dataclass itself on load.
+        if self._init_indexes is None:
+            return dict(zip(self._names, values))
+        return {self._names[i]: values[i] for i in self._init_indexes}
+
+    def _record(self, buffer: Buffer, offset: int) -> bytes:
+        """Bytes of a (possibly incomplete) record at offset to report in errors instead of the whole buffer."""
+        return bytes(memoryview(buffer).cast('B')[offset:offset + self.size])  # type: ignore # missing from stubs
+
+    def __getstate__(self):
+        # Compiled structs and generated view classes cannot be pickled, so they are recreated after unpickling.
+        state = dict(self.__dict__)
+        state['struct'] = self.struct.format
+        state['_view_class'] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.struct = Struct(state['struct'])
+
+    def __repr__(self):
+        path = class_path(type(self))
+        if path == 'serious.struct.model.StructModel':
+            path = 'serious.StructModel'
+        return f'<{path}[{class_path(self.cls)}] at {hex(id(self))}>'
@@ -0,0 +1,115 @@
+"""Zero-copy views of records packed by a `StructModel`.
+
+A view class is generated for each model: every dataclass field becomes a property reading the value
+directly from the underlying buffer at the precomputed field offset.
+Nothing is decoded until a field is accessed, so views over memory-mapped files cost next to nothing to create.
+"""
+from __future__ import annotations
+
+__all__ = ['RecordView', 'RecordViews', 'view_class', 'RESERVED_NAMES']
+
+from struct import Struct
+from typing import Any, Callable, Dict, Generic, Iterator, Optional, Type, TypeVar, TYPE_CHECKING, Sequence, Union, \
+    overload
+
+from .fields import StructField
+
+if TYPE_CHECKING:
+    from .model import StructModel
+
+T = TypeVar('T')
+
+# Attributes of views which would be shadowed by field properties of the same names.
+RESERVED_NAMES = frozenset({'materialize', '_buffer', '_offset', '_model'})
+
+
+class RecordView(Generic[T]):
+    """A read-only view of a single record. Subclasses with field properties are created by `view_class`."""
+    __slots__ = ('_buffer', '_offset')
+
+    _model: StructModel[T]
+
+    def __init__(self, buffer: memoryview, offset: int):
+        self._buffer = buffer
+        self._offset = offset
+
+    def materialize(self) -> T:
+        """Decodes the whole record to a dataclass instance."""
+        return self._model.unpack(self._buffer, self._offset)
+
+    def __repr__(self):
+        return f'<{type(self).__name__} at offset {self._offset}>'
+
+
+def view_class(model: StructModel[T]) -> Type[RecordView[T]]:
+    """Generates a `RecordView` subclass with a property for each field of the model dataclass."""
+    namespace: Dict[str, Any] = {field.name: _field_property(field) for field in model.fields}
+    namespace['__slots__'] = ()
+    namespace['_model'] = model
+    namespace['__doc__'] = f'A view of {model.cls.__qualname__} record.'
+    return type(f'{model.cls.__name__}View', (RecordView,), namespace)
+
+
+def _field_property(field: StructField) -> property:
+    unpack_from = Struct('<' + field.format).unpack_from
+    offset = field.offset
+    load = field.load
+
+    if load is None:
+        def get(view: RecordView) -> Any:
+            return unpack_from(view._buffer, view._offset + offset)[0]
+    else:
+        convert: Callable[[Any], Any] = load
+
+        def get(view: RecordView) -> Any:
+            return convert(unpack_from(view._buffer, view._offset + offset)[0])
+
+    return property(get, doc=f'"{field.name}" read from the buffer at record offset {offset}.')
+
+
+class RecordViews(Sequence[RecordView[T]]):
+    """A sequence of views of consecutive records in a buffer, supporting random access by index."""
+
+    def __init__(self, model: StructModel[T], buffer: Any, offset: int = 0, count: Optional[int] = None):
+        """
+        :param model: the model which packed the records.
+        :param buffer: any object supporting the buffer protocol: `bytes`, `mmap`, shared memory `buf`, etc.
+        :param offset: position of the first record in buffer.
+        :param count: number of records; all of the records till the buffer end if `None`.
+        """
+        self._view = memoryview(buffer).cast('B')  # type: ignore # missing from stubs
+        self._size = model.size
+        self._offset = offset
+        if count is None:
+            count = (len(self._view) - offset) // self._size
+        if offset + count * self._size > len(self._view):
+            raise ValueError(f'Buffer is too small for {count} records of {model.cls}')
+        self._count = count
+        self._view_cls = model.view_class
+
+    def __len__(self) -> int:
+        return self._count
+
+    @overload
+    def __getitem__(self, index: int) -> RecordView[T]:
+        pass
+
+    @overload
+    def __getitem__(self, index: slice) -> Sequence[RecordView[T]]:
+        pass
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._count))]
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError('Record index out of range')
+        return self._view_cls(self._view, self._offset + index * self._size)
+
+    def __iter__(self) -> Iterator[RecordView[T]]:
+        view_cls = self._view_cls
+        view = self._view
+        size = self._size
+        for offset in range(self._offset, self._offset + self._count * size, size):
+            yield view_cls(view, offset)
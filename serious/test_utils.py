@@ -9,6 +9,7 @@ __all__ = ['assert_symmetric']
 
 from typing import overload
 
+from .binary import BinaryModel
 from .dict import DictModel
 from .json import JsonModel
 from .utils import Dataclass
@@ -24,6 +25,11 @@ def assert_symmetric(serializer: JsonModel, value: Dataclass):
     pass
 
 
+@overload
+def assert_symmetric(serializer: BinaryModel, value: Dataclass):
+    pass
+
+
 def assert_symmetric(serializer, value):
     """Asserts that dumping an instance of dataclass via model and loading it will result in an equal object."""
     assert serializer.load(serializer.dump(value)) == value, f'load/dump are not symmetric in {serializer}.'
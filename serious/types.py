@@ -4,15 +4,17 @@
 - Timestamp — an alternative to datetime, that is serialized to a float ms value
 - Email — a Tiny Type made out of string, which is checked to match the format
 - FrozenList and FrozenDict — immutable alternatives for standard collections
+- PersistentList and PersistentDict — immutable collections with cheap changed copies, from `serious.persistent`
 """
 
-__all__ = ['Timestamp', 'Email', 'FrozenList', 'FrozenDict']
+__all__ = ['Timestamp', 'Email', 'FrozenList', 'FrozenDict', 'PersistentList', 'PersistentDict']
 
 import re
 from datetime import datetime, timezone
 from typing import TypeVar, Generic, overload, Optional
 
 from .errors import ValidationError
+from .persistent import PersistentList, PersistentDict, mapping_hash
 
 KT = TypeVar('KT')  # Key type.
 VT = TypeVar('VT')  # Value type.
@@ -23,19 +25,26 @@ class FrozenDict(dict, Generic[KT, VT]):
     A dictionary which cannot be changed a la frozenset.
 
     Does not check for immutability of its members.
+    The hash is computed on first use and kept with the dictionary.
 
     Implementation from `PEP-351 <https://www.python.org/dev/peps/pep-0351/>`_.
     """
+    __slots__ = ('_hash',)
 
     def __hash__(self):
-        hash_ = 0
-        for key, value in self.items():
-            hash_ ^= hash((key, value))
-        return hash_
+        try:
+            return self._hash
+        except AttributeError:
+            self._hash = mapping_hash(self.items())
+            return self._hash
 
     def _immutable(self, *args, **kws):
         raise TypeError('A FrozenDict instance cannot be changed')
 
+    def __reduce__(self):
+        # Default pickling of dict subclasses restores the items via `__setitem__`, which is disabled.
+        return type(self), (dict(self),)
+
     __setitem__ = _immutable
     __delitem__ = _immutable
     clear = _immutable
@@ -60,7 +69,9 @@ class Timestamp:
     - a Timestamp object to create its copy
 
     Supports comparison with another Timestamp objects.
+    Timestamps are slotted, keeping only the float value per instance.
     """
+    __slots__ = ('value',)
 
     value: float
 
@@ -123,6 +134,10 @@ class Timestamp:
         """Restricts mutation of object value"""
         raise AttributeError('Cannot change timestamp. Timestamp objects are immutable.')
 
+    def __reduce__(self):
+        # Default unpickling of slotted objects restores the value via `__setattr__`, which is disabled.
+        return type(self), (self.value,)
+
     def __eq__(self, other: object):
         """Overrides the default implementation"""
         if not isinstance(other, Timestamp):
@@ -165,6 +180,7 @@ _email_regex = re.compile(r'^\w(\.|\w|-)*\+?(\.|\w|-)*@\w(\.|\w|-)*(\.\w+)$',
 
 class Email(str):
     """A regular email address. Email parts can be accessed via properties: `<username>+<label>@<domain>`."""
+    __slots__ = ()
 
     def __new__(cls, content: str):
         return super().__new__(cls, content.lower())  # type: ignore # __new__ is a staticmethod
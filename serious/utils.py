@@ -1,8 +1,10 @@
 """Minor utilities used throughout the project."""
 
-__all__ = ['class_path', 'Dataclass']
+__all__ = ['class_path', 'Dataclass', 'attributes_getter']
 
-from typing import Type, Any
+from functools import partial
+from operator import attrgetter
+from typing import Type, Any, Callable, Sequence, Tuple
 
 Dataclass = Any  # a dataclass instance
 
@@ -10,3 +12,25 @@ Dataclass = Any  # a dataclass instance
 def class_path(cls: Type) -> str:
     """Returns a fully qualified type name."""
     return f'{cls.__module__}.{cls.__qualname__}'
+
+
+def attributes_getter(names: Sequence[str]) -> Callable[[Any], Tuple]:
+    """Returns a function reading the named attributes of an object to a tuple in a single call.
+
+    Works the same for attributes stored in `__dict__` and in `__slots__`.
+    """
+    if not names:
+        return _no_attributes
+    if len(names) == 1:
+        return partial(_single_attribute, names[0])
+    return attrgetter(*names)
+
+
+# Module-level functions keep the getters picklable along with the models.
+
+def _no_attributes(o: Any) -> Tuple:
+    return ()
+
+
+def _single_attribute(name: str, o: Any) -> Tuple:
+    return getattr(o, name),
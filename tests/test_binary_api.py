@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, date, time, timezone, timedelta
+from decimal import Decimal
+from enum import Enum, IntFlag
+from typing import Optional, List, Dict, Tuple, FrozenSet
+from uuid import UUID
+
+import pytest
+
+from serious import BinaryModel, JsonModel, LoadError, ValidationError, Timestamp, Email
+from serious.binary.errors import SchemaMismatch
+from serious.descriptors import TypeDescriptor
+from serious.serialization import Loading, Dumping, FieldSerializer, field_serializers
+from serious.test_utils import assert_symmetric
+from tests.entities import DataclassWithOptionalNested, DataclassWithOptional
+
+
+class Color(Enum):
+    RED = 'red'
+    GREEN = 'green'
+
+
+class Permission(IntFlag):
+    READ = 4
+    WRITE = 2
+
+
+@dataclass(frozen=True)
+class Location:
+    lat: float
+    lon: float
+
+
+@dataclass(frozen=True)
+class Event:
+    id: UUID
+    name: str
+    count: int
+    balance: Decimal
+    happened_at: Timestamp
+    created_at: datetime
+    day: date
+    at: time
+    color: Color
+    permissions: Permission
+    location: Optional[Location]
+    tags: Tuple[str, ...]
+    scores: Dict[str, float]
+    pair: Tuple[int, str]
+    ids: FrozenSet[int]
+    note: Optional[str]
+    active: bool
+    owner: Email
+
+
+def event(**overrides) -> Event:
+    values = dict(
+        id=UUID('d1d61dd7-c036-47d3-a6ed-91cc2e885fc8'),
+        name='Łódź ✓',
+        count=-150,
+        balance=Decimal('12.50'),
+        happened_at=Timestamp(1542473728.456753),
+        created_at=datetime(2018, 11, 17, 16, 55, 28, 456753, tzinfo=timezone(timedelta(hours=-5))),
+        day=date(1922, 9, 9),
+        at=time(7, 0, 1, 15),
+        color=Color.GREEN,
+        permissions=Permission.READ | Permission.WRITE,
+        location=Location(50.45, 30.52),
+        tags=('a', 'b'),
+        scores={'x': 1.5},
+        pair=(2 ** 70, 'big'),
+        ids=frozenset({1, 2}),
+        note=None,
+        active=True,
+        owner=Email('misha@drach.uk'),
+    )
+    values.update(overrides)
+    return Event(**values)  # type: ignore
+
+
+@dataclass(frozen=True)
+class Tree:
+    value: int
+    left: Optional[Tree]
+    right: Optional[Tree]
+
+
+class TestBinaryModel:
+
+    def setup_class(self):
+        self.model = BinaryModel(Event)
+
+    def test_symmetric(self):
+        assert_symmetric(self.model, event())
+
+    def test_symmetric_with_naive_datetime_and_missing_optionals(self):
+        assert_symmetric(self.model, event(created_at=datetime(1969, 7, 20, 20, 17), location=None, note='Hi'))
+
+    def test_many(self):
+        items = [event(), event(count=0, location=None)]
+        assert self.model.load_many(self.model.dump_many(items)) == items
+
+    def test_recursive(self):
+        model = BinaryModel(Tree)
+        tree = Tree(1, Tree(2, None, None), Tree(3, None, Tree(4, None, None)))
+        assert_symmetric(model, tree)
+
+    def test_smaller_than_json(self):
+        o = event()
+        assert len(self.model.dump(o)) * 2 < len(JsonModel(Event).dump(o))
+
+    def test_field_names_not_encoded(self):
+        assert b'happened' not in self.model.dump(event())
+
+    def test_optional_bitmap(self):
+        model = BinaryModel(DataclassWithOptionalNested)
+        assert model.dump(DataclassWithOptionalNested(None))[8:] == b'\x00'
+        assert model.dump(DataclassWithOptionalNested(DataclassWithOptional(None)))[8:] == b'\x01\x00'
+        assert model.dump(DataclassWithOptionalNested(DataclassWithOptional(-1)))[8:] == b'\x01\x01\x01'
+
+    def test_schema_mismatch(self):
+        data = BinaryModel(DataclassWithOptional).dump(DataclassWithOptional(1))
+        with pytest.raises(SchemaMismatch):
+            BinaryModel(DataclassWithOptionalNested).load(data)
+
+    def test_fingerprint_is_stable(self):
+        assert BinaryModel(Event).fingerprint == self.model.fingerprint
+
+    def test_truncated(self):
+        data = self.model.dump(event())
+        with pytest.raises(LoadError):
+            self.model.load(data[:-3])
+
+    def test_trailing_bytes(self):
+        data = self.model.dump(event())
+        with pytest.raises(LoadError):
+            self.model.load(data + b'\x00')
+
+    def test_validates_on_load(self):
+        data = self.model.dump(event(owner=Email('invalid')))
+        with pytest.raises(ValidationError):
+            self.model.load(data)
+
+    def test_load_from_memoryview(self):
+        o = event()
+        assert self.model.load(memoryview(self.model.dump(o))) == o
+
+
+@dataclass(frozen=True)
+class UserId:
+    value: int
+
+
+@dataclass(frozen=True)
+class User:
+    id: UserId
+    friends: List[UserId]
+
+
+class UserIdSerializer(FieldSerializer[UserId, int]):
+
+    def load(self, value: int, ctx: Loading) -> UserId:
+        return UserId(value)
+
+    def dump(self, value: UserId, ctx: Dumping) -> int:
+        return value.value
+
+    @classmethod
+    def fits(cls, desc: TypeDescriptor) -> bool:
+        return desc.cls is UserId
+
+
+def test_custom_serializer():
+    model = BinaryModel(User, serializers=field_serializers([UserIdSerializer]))
+    user = User(UserId(1), [UserId(2), UserId(3)])
+    assert_symmetric(model, user)
+    assert b'2' in model.dump(user)
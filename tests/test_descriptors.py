@@ -0,0 +1,98 @@
+import gc
+import pickle
+import weakref
+from dataclasses import dataclass, make_dataclass, replace
+from typing import Dict, List, Optional, Tuple, TypeVar, Generic
+
+from serious import FrozenDict
+from serious.descriptors import CACHE_SIZE, describe, scan_types
+
+T = TypeVar('T')
+
+
+@dataclass(frozen=True)
+class Box(Generic[T]):
+    item: T
+    items: List[T]
+
+
+@dataclass(frozen=True)
+class Shelf:
+    boxes: Dict[str, Box[int]]
+    label: Optional[Box[str]]
+
+
+@dataclass
+class Node:
+    links: List['Link']
+    name: str
+
+
+@dataclass
+class Link:
+    target: Optional[Node]
+    weight: float
+
+
+@dataclass
+class Graph:
+    root: Node
+
+
+class TestDescriptors:
+
+    def test_equal_descriptors_are_the_same(self):
+        assert describe(Dict[str, List[Tuple[int, str]]]) is describe(Dict[str, List[Tuple[int, str]]])
+        assert describe(Shelf).fields['boxes'].parameters[1] is describe(Box[int])
+
+    def test_generic_parameters_are_resolved(self):
+        assert describe(Box[int]).fields['item'] is describe(int)
+        assert describe(Box[str]).fields['item'] is describe(str)
+
+    def test_replaced_descriptors_are_equal(self):
+        optional = describe(Optional[Box[str]])
+        required = replace(optional, is_optional=False)
+        assert required == describe(Box[str])
+        assert hash(required) == hash(describe(Box[str]))
+        assert optional != required
+
+    def test_hash_is_not_pickled(self):
+        desc = describe(Shelf)
+        desc.fields  # Resolves and keeps the fields.
+        restored = pickle.loads(pickle.dumps((hash(desc), desc)))[1]
+        assert '_hash' not in restored.__dict__
+        assert '_fields' not in restored.__dict__
+        assert restored == desc
+
+    def test_scan_types(self):
+        types = scan_types(describe(Shelf)).types
+        assert {Shelf, Box, dict, list, str, int} <= set(types)
+
+    def test_scanned_subtrees_have_all_types(self):
+        assert {Graph, Node, Link, list, str, float} == set(scan_types(describe(Graph)).types)
+        assert {Node, Link, list, str, float} == set(scan_types(describe(Node)).types)
+        assert {Node, Link, list, str, float} == set(scan_types(describe(Link)).types)
+        assert {Node, Link, list, str, float} == set(scan_types(describe(List[Link])).types)
+
+    def test_created_classes_are_not_kept(self):
+        cls = make_dataclass('Created', [('boxes', List[Box[int]])])
+        scan_types(describe(cls))
+        created = weakref.ref(cls)
+        del cls
+        for i in range(CACHE_SIZE):  # Pushes the created class out of the caches.
+            scan_types(describe(TypeVar(f'T{i}')))
+        gc.collect()
+        assert created() is None
+
+
+class TestFrozenDictHash:
+
+    def test_hash_is_kept(self):
+        mapping = FrozenDict({'a': 1, 'b': 2})
+        assert hash(mapping) == hash(FrozenDict({'b': 2, 'a': 1}))
+        assert mapping._hash == hash(mapping)
+
+    def test_pickle(self):
+        mapping = FrozenDict({'a': 1})
+        hash(mapping)
+        assert pickle.loads(pickle.dumps(mapping)) == mapping
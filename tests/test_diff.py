@@ -0,0 +1,115 @@
+from dataclasses import dataclass
+from datetime import datetime, time, timedelta, timezone
+from decimal import Decimal
+from typing import List, Optional, Dict
+
+import pytest
+
+from serious import DictModel, JsonModel, LoadError, ValidationError
+from serious.errors import UnexpectedItem
+
+
+@dataclass(frozen=True)
+class Address:
+    city: str
+    street: str
+
+
+@dataclass(frozen=True)
+class Person:
+    name: str
+    address: Address
+    previous_address: Optional[Address]
+    tags: List[str]
+    scores: Dict[str, int]
+    age: int = 0
+
+    def __validate__(self):
+        if self.age < 0:
+            raise ValidationError('Negative age')
+
+
+@pytest.fixture
+def person():
+    return Person('Ann', Address('Kyiv', 'Main'), None, ['a'], {'x': 1})
+
+
+class TestDiff:
+
+    def setup_class(self):
+        self.model = DictModel(Person)
+
+    def test_no_changes(self, person):
+        assert self.model.dump_diff(person, person) == {}
+        assert self.model.dump_diff(person, Person('Ann', Address('Kyiv', 'Main'), None, ['a'], {'x': 1})) == {}
+        assert self.model.apply_diff(person, {}) is person
+
+    def test_changed_leaves(self, person):
+        new = Person('Ann', Address('Kyiv', 'Side'), None, ['a', 'b'], {'x': 1}, age=3)
+        diff = self.model.dump_diff(person, new)
+        assert diff == {'address.street': 'Side', 'tags': ['a', 'b'], 'age': 3}
+        assert self.model.apply_diff(person, diff) == new
+
+    def test_replaced_optional_dataclass(self, person):
+        new = Person('Ann', person.address, Address('Lviv', 'Old'), ['a'], {'x': 1})
+        diff = self.model.dump_diff(person, new)
+        assert diff == {'previous_address': {'city': 'Lviv', 'street': 'Old'}}
+        assert self.model.apply_diff(person, diff) == new
+        assert self.model.dump_diff(new, person) == {'previous_address': None}
+        assert self.model.apply_diff(new, {'previous_address': None}) == person
+
+    def test_nested_change_of_replaced_value(self, person):
+        diff = {'previous_address': {'city': 'Lviv', 'street': 'Old'}, 'previous_address.street': 'New'}
+        assert self.model.apply_diff(person, diff).previous_address == Address('Lviv', 'New')
+
+    def test_invalid_diffs(self, person):
+        with pytest.raises(UnexpectedItem):
+            self.model.apply_diff(person, {'address.zip': '0000'})
+        with pytest.raises(LoadError):
+            self.model.apply_diff(person, {'previous_address.city': 'Lviv'})
+        with pytest.raises(ValidationError):
+            self.model.apply_diff(person, {'age': '3'})
+        with pytest.raises(ValidationError):
+            self.model.apply_diff(person, {'age': -1})
+
+
+@dataclass(frozen=True)
+class Measurement:
+    amount: Decimal
+    x: float
+    history: List[float]
+
+
+def test_equal_values_dumped_differently():
+    model = DictModel(Measurement)
+    old = Measurement(Decimal('1.0'), 0.0, [0.0])
+    assert model.dump_diff(old, Measurement(Decimal('1.0'), 0.0, [0.0])) == {}
+    diff = model.dump_diff(old, Measurement(Decimal('1.00'), -0.0, [-0.0]))
+    assert diff == {'amount': '1.00', 'x': -0.0, 'history': [-0.0]}
+    assert repr(diff['x']) == '-0.0'
+
+
+@dataclass(frozen=True)
+class Meeting:
+    at: datetime
+    alarm: Optional[time]
+
+
+def test_equal_moments_in_other_time_zones():
+    model = DictModel(Meeting)
+    utc, cet = timezone.utc, timezone(timedelta(hours=1))
+    old = Meeting(datetime(2020, 1, 1, 12, tzinfo=utc), time(12, tzinfo=utc))
+    new = Meeting(datetime(2020, 1, 1, 13, tzinfo=cet), time(13, tzinfo=cet))
+    assert old == new
+    diff = model.dump_diff(old, new)
+    assert diff == {'at': '2020-01-01T13:00:00+01:00', 'alarm': '13:00:00+01:00'}
+    applied = model.apply_diff(old, diff)
+    assert applied.at.utcoffset() == applied.alarm.utcoffset() == timedelta(hours=1)
+
+
+def test_json_model(person):
+    model = JsonModel(Person)
+    new = Person('Bob', person.address, None, ['a'], {'x': 2})
+    diff = model.dump_diff(person, new)
+    assert diff == '{"name": "Bob", "scores": {"x": 2}}'
+    assert model.apply_diff(person, diff) == new
@@ -0,0 +1,217 @@
+import gc
+import pickle
+from dataclasses import dataclass
+from datetime import datetime, time, timedelta, timezone
+from decimal import Decimal
+from typing import List, Tuple
+
+import pytest
+
+from serious import DictModel, JsonModel, Timestamp
+from serious.caches import CacheOptions, CacheStats, DumpCache, LruCache, MISSING, strict_key
+
+
+@dataclass(frozen=True)
+class Currency:
+    code: str
+    digits: int
+
+
+@dataclass(frozen=True)
+class Product:
+    name: str
+    currency: Currency
+    tags: Tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class Tagged:
+    tags: List[str]
+
+
+@dataclass(frozen=True)
+class Payment:
+    amount: Decimal
+    x: float
+
+
+@dataclass(frozen=True)
+class Event:
+    at: datetime
+    alarm: time
+
+
+@dataclass(frozen=True)
+class Logged:
+    at: Timestamp
+
+
+utc = timezone.utc
+cet = timezone(timedelta(hours=1))
+
+
+@dataclass
+class Order:
+    product: Product
+    count: int
+
+
+def product(name='Tea'):
+    return Product(name, Currency('UAH', 2), ('hot',))
+
+
+class TestDumpCache:
+
+    def test_disabled_by_default(self):
+        model = DictModel(Product)
+        assert model.serious_model.dump_cache is None
+        assert model.dump_cache_stats() == CacheStats()
+
+    def test_repeated_dump(self):
+        model = DictModel(Product, dump_cache=True)
+        tea = product()
+        first = model.dump(tea)
+        assert model.dump(tea) is first
+        assert first == DictModel(Product).dump(tea)
+        assert model.dump_cache_stats() == CacheStats(hits=1, misses=2)
+
+    def test_nested_frozen_objects_of_mutable_root(self):
+        model = DictModel(Order, dump_cache=True)
+        tea = product()
+        first, second = model.dump_many([Order(tea, 1), Order(tea, 2)])
+        assert first is not second
+        assert first['product'] is second['product']
+        assert model.serious_model.dump_cache is None
+
+    def test_mutable_values_not_cached(self):
+        model = DictModel(Tagged, dump_cache=True)
+        tagged = Tagged(['a'])
+        model.dump(tagged)
+        tagged.tags.append('b')
+        assert model.dump(tagged) == {'tags': ['a', 'b']}
+        assert model.serious_model.dump_cache is None
+
+    def test_identity_keys(self):
+        model = DictModel(Product, dump_cache=True)
+        assert model.dump(product()) is not model.dump(product())
+
+    def test_identity_entries_dropped_with_objects(self):
+        model = DictModel(Product, dump_cache=True)
+        cache = model.serious_model.dump_cache
+        tea = product()
+        model.dump(tea)
+        assert len(cache) == 1
+        del tea
+        gc.collect()
+        assert len(cache) == 0
+
+    def test_hash_keys(self):
+        model = DictModel(Product, dump_cache=CacheOptions(key='hash'))
+        assert model.dump(product()) is model.dump(product())
+
+    def test_hash_keys_of_equal_objects_dumped_differently(self):
+        model = DictModel(Payment, dump_cache=CacheOptions(key='hash'))
+        assert model.dump(Payment(Decimal('1.0'), 0.0)) == {'amount': '1.0', 'x': 0.0}
+        dumped = model.dump(Payment(Decimal('1.00'), -0.0))
+        assert dumped == {'amount': '1.00', 'x': -0.0}
+        assert repr(dumped['x']) == '-0.0'
+
+    def test_hash_keys_of_equal_moments_in_other_time_zones(self):
+        model = DictModel(Event, dump_cache=CacheOptions(key='hash'))
+        noon = model.dump(Event(datetime(2020, 1, 1, 12, tzinfo=utc), time(12, tzinfo=utc)))
+        assert noon == {'at': '2020-01-01T12:00:00+00:00', 'alarm': '12:00:00+00:00'}
+        one = model.dump(Event(datetime(2020, 1, 1, 13, tzinfo=cet), time(13, tzinfo=cet)))
+        assert one == {'at': '2020-01-01T13:00:00+01:00', 'alarm': '13:00:00+01:00'}
+
+    def test_hash_keys_of_timestamps(self):
+        model = DictModel(Logged, dump_cache=CacheOptions(key='hash'))
+        assert model.dump(Logged(Timestamp(1.5))) is model.dump(Logged(Timestamp(1.5)))
+        assert model.dump(Logged(Timestamp(2.0))) == {'at': 2.0}
+        assert model.dump_cache_stats() == CacheStats(hits=1, misses=2)
+
+    def test_unhashable_lookups_counted_as_misses(self):
+        cache = DumpCache(CacheOptions(key='hash'))
+        assert cache.get(Tagged(['a'])) is MISSING
+        cache.put(Tagged(['a']), {'tags': ['a']})
+        assert len(cache) == 0
+        assert cache.stats == CacheStats(misses=1)
+
+    def test_pickled_model_has_empty_cache(self):
+        model = DictModel(Product, dump_cache=True)
+        model.dump(product())
+        restored = pickle.loads(pickle.dumps(model))
+        assert len(restored.serious_model.dump_cache) == 0
+        assert restored.dump(product()) == model.dump(product())
+
+    def test_size_and_eviction(self):
+        model = DictModel(Product, dump_cache=CacheOptions(size=2, key='hash'))
+        model.dump_many([product('Tea'), product('Coffee'), product('Tea'), product('Cocoa'), product('Coffee')])
+        stats = model.serious_model.dump_cache.stats
+        assert stats == CacheStats(hits=1, misses=4, evictions=2)
+
+    def test_json_model(self):
+        model = JsonModel(Order, dump_cache=16)
+        tea = product()
+        assert model.dump(Order(tea, 1)) == JsonModel(Order).dump(Order(tea, 1))
+        model.dump(Order(tea, 2))
+        assert model.dump_cache_stats().hits == 1
+
+    def test_invalid_options(self):
+        with pytest.raises(ValueError):
+            DictModel(Product, dump_cache=CacheOptions(key='equality'))
+        with pytest.raises(ValueError):
+            DictModel(Product, dump_cache=0)
+
+
+class TestLruCache:
+
+    def test_lru_eviction(self):
+        cache = LruCache(CacheOptions(size=2))
+        cache.put('a', 1)
+        cache.put('b', 2)
+        cache.get('a')
+        cache.put('c', 3)
+        assert cache.get('b') is MISSING
+        assert cache.get('a') == 1
+
+    def test_fifo_eviction(self):
+        cache = LruCache(CacheOptions(size=2, eviction='fifo'))
+        cache.put('a', 1)
+        cache.put('b', 2)
+        cache.get('a')
+        cache.put('c', 3)
+        assert cache.get('a') is MISSING
+        assert cache.get('b') == 2
+
+    def test_ttl(self):
+        cache = LruCache(CacheOptions(ttl=-1))
+        cache.put('a', 1)
+        assert cache.get('a') is MISSING
+        assert len(cache) == 0
+
+    def test_pickled_empty(self):
+        cache = LruCache(CacheOptions(size=2, eviction='fifo'))
+        cache.put('a', 1)
+        restored = pickle.loads(pickle.dumps(cache))
+        assert len(restored) == 0
+        assert restored.options == cache.options
+        restored.put('a', 1)
+        assert restored.get('a') == 1
+
+    def test_hit_rate(self):
+        assert CacheStats(hits=3, misses=1).hit_rate == 0.75
+        assert CacheStats().hit_rate == 0
+
+
+def test_strict_key():
+    assert strict_key(Decimal('1.0')) != strict_key(Decimal('1.00'))
+    assert strict_key(0.0) != strict_key(-0.0)
+    assert strict_key(1) != strict_key(True) != strict_key(1.0)
+    assert strict_key(float('nan')) == strict_key(float('nan'))
+    assert strict_key(product()) == strict_key(product())
+    assert strict_key((1, 'a')) != strict_key((1.0, 'a'))
+    assert strict_key(datetime(2020, 1, 1, 12, tzinfo=utc)) != strict_key(datetime(2020, 1, 1, 13, tzinfo=cet))
+    assert strict_key(time(12, tzinfo=utc)) != strict_key(time(13, tzinfo=cet))
+    assert strict_key(Timestamp(1.5)) == strict_key(Timestamp(1.5)) != strict_key(1.5)
+    with pytest.raises(TypeError):
+        hash(strict_key(Tagged(['a'])))
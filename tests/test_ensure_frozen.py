@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import gc
+import weakref
+from dataclasses import dataclass, make_dataclass
 from datetime import date, datetime, time
 from decimal import Decimal
 from enum import Enum
@@ -10,9 +12,10 @@ from uuid import UUID
 import pytest
 
 from serious import FrozenList, JsonModel, DictModel, Email, Timestamp, FrozenDict
-from serious.descriptors import TypeDescriptor
+from serious.descriptors import CACHE_SIZE, TypeDescriptor, describe, scan_types
 from serious.errors import MutableTypesInModel, ModelContainsAny
 from serious.serialization import FieldSerializer, field_serializers
+from serious.serialization.check_immutable import extract_mutable
 from tests.utils import with_
 
 
@@ -142,6 +145,36 @@ class TestEnsureFrozenTrue:
         assert new_model(FrozenEvent[cls], field_serializers([FrozenNodeSerializer]), ensure_frozen=[FrozenNode])
 
 
+class TestKeptVerdicts:
+
+    def test_repeated_checks(self):
+        for _ in range(2):
+            with pytest.raises(MutableTypesInModel):
+                DictModel(BlogPost, ensure_frozen=True)
+            assert DictModel(User, ensure_frozen=True)
+
+    def test_custom_immutable_types_are_part_of_verdict(self):
+        types = scan_types(describe(FrozenEvent[FrozenNode]))
+        assert extract_mutable(types, also_immutable=[FrozenNode]) == []
+        assert extract_mutable(types, also_immutable=[]) == [FrozenNode]
+        assert extract_mutable(types, also_immutable=[FrozenNode]) == []
+
+    def test_returned_lists_are_copies(self):
+        types = scan_types(describe(BlogPost))
+        extract_mutable(types, also_immutable=[]).clear()
+        assert extract_mutable(types, also_immutable=[]) == [list]
+
+    def test_created_classes_are_not_kept(self):
+        cls = make_dataclass('Created', [('posts', List[BlogPost])], frozen=True)
+        assert extract_mutable(scan_types(describe(cls)), also_immutable=[]) == [list]
+        created = weakref.ref(cls)
+        del cls
+        for i in range(CACHE_SIZE):  # Pushes the created class out of the caches.
+            extract_mutable(scan_types(describe(TypeVar(f'T{i}'))), also_immutable=[])
+        gc.collect()
+        assert created() is None
+
+
 class FrozenNodeSerializer(FieldSerializer[FrozenNode, list]):
     @classmethod
     def fits(cls, desc: TypeDescriptor) -> bool:
@@ -0,0 +1,150 @@
+import gc
+import pickle
+from dataclasses import dataclass
+from datetime import datetime, time
+from decimal import Decimal
+from typing import List, Tuple
+
+import pytest
+
+from serious import DictModel, JsonModel, BinaryModel, Timestamp
+
+
+@dataclass(frozen=True)
+class Currency:
+    code: str
+    digits: int
+
+
+@dataclass(frozen=True)
+class Location:
+    city: str
+    tags: Tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class Tagged:
+    tags: List[str]
+
+
+@dataclass(frozen=True)
+class Price:
+    amount: int
+    currency: Currency
+    location: Location
+
+
+@dataclass(frozen=True)
+class Amount:
+    value: Decimal
+    rate: float
+
+
+@dataclass(frozen=True)
+class Event:
+    at: datetime
+    alarm: time
+
+
+@dataclass(frozen=True)
+class Logged:
+    at: Timestamp
+
+
+@dataclass
+class Mutable:
+    currency: Currency
+
+
+def price_data(amount):
+    return {'amount': amount, 'currency': {'code': 'UAH', 'digits': 2}, 'location': {'city': 'Kyiv', 'tags': []}}
+
+
+class TestCanonicalize:
+
+    def test_disabled_by_default(self):
+        first, second = DictModel(Price).load_many([price_data(1), price_data(2)])
+        assert first.currency == second.currency
+        assert first.currency is not second.currency
+
+    def test_all_frozen_dataclasses(self):
+        model = DictModel(Price, canonicalize=True)
+        first, second, third = model.load_many([price_data(1), price_data(2), price_data(1)])
+        assert first.currency is second.currency
+        assert first is third
+
+    def test_selected_types(self):
+        model = DictModel(Price, canonicalize=[Currency])
+        first, second = model.load_many([price_data(1), price_data(1)])
+        assert first.currency is second.currency
+        assert first is not second
+
+    def test_unhashable_values_skipped(self):
+        model = DictModel(Tagged, canonicalize=True)
+        first, second = model.load_many([{'tags': ['a']}, {'tags': ['a']}])
+        assert first == second
+        assert first is not second
+
+    def test_mutable_root_is_not_shared(self):
+        model = DictModel(Mutable, canonicalize=True)
+        first, second = model.load_many([{'currency': {'code': 'UAH', 'digits': 2}}] * 2)
+        assert first is not second
+        assert first.currency is second.currency
+
+    def test_table_does_not_keep_instances(self):
+        model = DictModel(Price, canonicalize=[Currency])
+        table = model.serious_model.child_model(model.descriptor.fields['currency']).canonical
+        price = model.load(price_data(1))
+        assert len(table) == 1
+        del price
+        gc.collect()
+        assert len(table) == 0
+
+    def test_equal_values_dumped_differently_not_shared(self):
+        model = DictModel(Amount, canonicalize=True)
+        data = [{'value': '1.0', 'rate': 0.0}, {'value': '1.00', 'rate': 0.0}, {'value': '1.0', 'rate': -0.0},
+                {'value': '1.0', 'rate': 0.0}]
+        loaded = model.load_many(data)
+        assert model.dump_many(loaded) == data
+        assert loaded[0] is loaded[3]
+        assert len({id(amount) for amount in loaded}) == 3
+
+    def test_equal_moments_in_other_time_zones_not_shared(self):
+        model = DictModel(Event, canonicalize=True)
+        data = [{'at': '2020-01-01T12:00:00+00:00', 'alarm': '12:00:00+00:00'},
+                {'at': '2020-01-01T13:00:00+01:00', 'alarm': '13:00:00+01:00'},
+                {'at': '2020-01-01T12:00:00+00:00', 'alarm': '12:00:00+00:00'}]
+        loaded = model.load_many(data)
+        assert loaded[0] == loaded[1]
+        assert model.dump_many(loaded) == data
+        assert loaded[0] is loaded[2]
+        assert loaded[0] is not loaded[1]
+
+    def test_timestamps_shared(self):
+        model = DictModel(Logged, canonicalize=True)
+        first, second, third = model.load_many([{'at': 1.5}, {'at': 1.5}, {'at': 2.0}])
+        assert first is second
+        assert first is not third
+
+    def test_pickled_table_is_empty(self):
+        model = DictModel(Price, canonicalize=True)
+        first = model.load(price_data(1))
+        restored = pickle.loads(pickle.dumps(model))
+        assert len(restored.serious_model.canonical) == 0
+        second, third = restored.load_many([price_data(1), price_data(1)])
+        assert second == first
+        assert second is third
+
+    def test_only_frozen_dataclasses(self):
+        with pytest.raises(ValueError):
+            DictModel(Mutable, canonicalize=[Mutable])
+
+    def test_json_and_binary_models(self):
+        price = DictModel(Price).load(price_data(1))
+        json_model = JsonModel(Price, canonicalize=True)
+        first, second = json_model.load_many(json_model.dump_many([price, price]))
+        assert first is second
+        binary_model = BinaryModel(Price, canonicalize=[Currency])
+        first, second = binary_model.load_many(binary_model.dump_many([price, price]))
+        assert first is not second
+        assert first.currency is second.currency
@@ -0,0 +1,64 @@
+from dataclasses import dataclass
+from typing import Dict, List
+
+import pytest
+
+from serious import DictModel, JsonModel, BinaryModel
+from serious.serialization.interning import InternTable
+
+
+class Code(str):
+    pass
+
+
+@dataclass(frozen=True)
+class Country:
+    code: str
+    tags: List[str]
+    names: Dict[str, int]
+    special: Code
+
+
+def load_twice(model):
+    json = '{"code": "country-ua", "tags": ["tag-' + 'x' * 10 + '"], "names": {"name-key": 1}, "special": "special-code"}'
+    return model.load(json), model.load(json)
+
+
+class TestInterning:
+
+    def test_not_interned_by_default(self):
+        first, second = load_twice(JsonModel(Country))
+        assert first.code == second.code
+        assert first.code is not second.code
+
+    @pytest.mark.parametrize('option', [True, 100])
+    def test_interned(self, option):
+        first, second = load_twice(JsonModel(Country, intern_strings=option))
+        assert first.code is second.code
+        assert first.tags[0] is second.tags[0]
+        assert next(iter(first.names)) is next(iter(second.names))
+
+    def test_str_subclasses_kept(self):
+        first, second = load_twice(JsonModel(Country, intern_strings=True))
+        assert type(first.special) is Code
+
+    def test_table_is_bounded(self):
+        model = DictModel(Country, intern_strings=2)
+        data = [{'code': f'code-{i}', 'tags': [], 'names': {}, 'special': ''} for i in range(5)]
+        model.load_many(data)
+        table = model.serious_model.intern
+        assert isinstance(table, InternTable)
+        assert len(table) == 2
+        assert model.load({'code': ''.join(['code-', '0']), 'tags': [], 'names': {}, 'special': ''}).code \
+               is data[0]['code']
+
+    def test_binary_model(self):
+        model = BinaryModel(Country, intern_strings=True)
+        data = model.dump(Country('country-ua', ['tag-a'], {'key-a': 1}, Code('')))
+        first, second = model.load(data), model.load(data)
+        assert first.code is second.code
+        assert next(iter(first.names)) is next(iter(second.names))
+
+    def test_negative_table_size(self):
+        with pytest.raises(ValueError):
+            DictModel(Country, intern_strings=-1)
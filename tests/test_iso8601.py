@@ -0,0 +1,101 @@
+import re
+from datetime import datetime, date, time, timezone, timedelta
+
+import pytest
+
+from serious.serialization.iso8601 import parse_datetime, parse_date, parse_time
+
+utc = timezone.utc
+kyiv = timezone(timedelta(hours=2))
+
+
+@pytest.mark.parametrize('value,expected', [
+    ('2018-11-17T16:55:28', datetime(2018, 11, 17, 16, 55, 28)),
+    ('2018-11-17T16:55:28.456753+00:00', datetime(2018, 11, 17, 16, 55, 28, 456753, tzinfo=utc)),
+    ('2018-11-17T16:55:28Z', datetime(2018, 11, 17, 16, 55, 28, tzinfo=utc)),
+    ('2018-11-17T16:55:28.5-02:00', datetime(2018, 11, 17, 16, 55, 28, 500000, tzinfo=timezone(-timedelta(hours=2)))),
+    ('2018-11-17T16:55:28.123456789+02:00', datetime(2018, 11, 17, 16, 55, 28, 123456, tzinfo=kyiv)),
+    ('2020-02-29T00:00:00', datetime(2020, 2, 29)),
+])
+def test_datetime(value, expected):
+    parsed = parse_datetime(value)
+    assert parsed == expected
+    assert parsed.utcoffset() == expected.utcoffset()
+
+
+@pytest.mark.parametrize('value', [
+    '2018-11-17', '2018-11-17 16:55:28', '2018-11-17T16:55', '2018-11-17T24:00:00', '2018-11-7T16:55:28',
+    '2019-02-29T00:00:00', '2018-13-01T00:00:00', '2018-11-17T16:55:28+0200', '2018-11-17T16:55:28.+02:00',
+    '20181117T165528', '2018-W46-6T16:55:28', '２０18-11-17T16:55:28', '2018-11-17T16:55:28Z ',
+])
+def test_invalid_datetime(value):
+    with pytest.raises(ValueError):
+        parse_datetime(value)
+
+
+def test_date():
+    assert parse_date('1922-09-09') == date(1922, 9, 9)
+    assert parse_date('19220909') == date(1922, 9, 9)
+    for invalid in ['1922-0909', '1922-09-31', '1922-9-9', '1922-09-09T00:00:00']:
+        with pytest.raises(ValueError):
+            parse_date(invalid)
+
+
+def test_time():
+    assert parse_time('07:00:00') == time(7)
+    assert parse_time('070005') == time(7, 0, 5)
+    assert parse_time('07:00:00.25') == time(7, 0, 0, 250000)
+    assert parse_time('07:00:00Z') == time(7, tzinfo=utc)
+    assert parse_time('07:00:00+02') == time(7, tzinfo=kyiv)
+    assert parse_time('07:00:00+0200') == time(7, tzinfo=kyiv)
+    for invalid in ['24:00:00', '7:00:00', '07:0000', '07:00', '07:00:00+24:00']:
+        with pytest.raises(ValueError):
+            parse_time(invalid)
+
+
+def test_round_trip_of_isoformat():
+    moment = datetime(2018, 11, 17, 16, 55, 28, 456753, tzinfo=kyiv)
+    assert parse_datetime(moment.isoformat()) == moment
+    assert parse_time(moment.timetz().isoformat()) == moment.timetz()
+
+
+def _strict(cls):
+    """Simulates `fromisoformat` of Python before 3.11, accepting only extended formats with 0, 3 or 6 digit fractions."""
+    extended = re.compile(r'[\d:T-]+(\.(\d{3}|\d{6}))?([+-]\d\d:\d\d)?\Z')
+
+    class Strict(cls):
+        @classmethod
+        def fromisoformat(cls, value):
+            if not extended.match(value) or ('-' not in value and ':' not in value):
+                raise ValueError(value)
+            return super().fromisoformat(value)
+
+    return Strict
+
+
+def test_rewrites_forms_rejected_before_python_3_11(monkeypatch):
+    from serious.serialization import iso8601
+    monkeypatch.setattr(iso8601, 'datetime', _strict(datetime))
+    monkeypatch.setattr(iso8601, 'date', _strict(date))
+    monkeypatch.setattr(iso8601, 'time', _strict(time))
+    assert parse_datetime('2018-11-17T16:55:28.1234567Z') == datetime(2018, 11, 17, 16, 55, 28, 123456, tzinfo=utc)
+    assert parse_date('19220909') == date(1922, 9, 9)
+    assert parse_time('070005.5+02') == time(7, 0, 5, 500000, tzinfo=kyiv)
+    with pytest.raises(ValueError):
+        parse_datetime('2019-02-29T00:00:00Z')
+
+
+def test_isoformat_shapes_parsed_in_one_pass(monkeypatch):
+    from serious.serialization import iso8601
+
+    class Unused:
+        def match(self, value):
+            raise AssertionError(f'"{value}" checked by a pattern')
+
+    for name in ['_date_time_re', '_date_re', '_time_re']:
+        monkeypatch.setattr(iso8601, name, Unused())
+    moment = datetime(2018, 11, 17, 16, 55, 28, 456753, tzinfo=kyiv)
+    for value in [moment, moment.replace(microsecond=0), moment.replace(tzinfo=None), moment.replace(microsecond=0, tzinfo=None)]:
+        assert parse_datetime(value.isoformat()) == value
+        assert parse_time(value.timetz().isoformat()) == value.timetz()
+    assert parse_date(moment.date().isoformat()) == moment.date()
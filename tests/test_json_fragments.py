@@ -0,0 +1,139 @@
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from typing import List, Optional, Tuple
+
+import pytest
+
+from serious import JsonModel, ValidationError
+from serious.caches import CacheOptions, CacheStats
+from serious.errors import DumpError
+
+
+@dataclass(frozen=True)
+class Currency:
+    code: str
+    digits: int
+
+
+@dataclass(frozen=True)
+class Product:
+    product_name: str
+    currency: Currency
+    tags: Tuple[str, ...]
+
+
+@dataclass
+class Line:
+    product: Product
+    count: int
+    gift: Optional[Product] = None
+
+
+@dataclass
+class Order:
+    order_id: int
+    lines: List[Line]
+    first: Line
+
+
+@dataclass(frozen=True)
+class Checked:
+    value: int
+
+    def __validate__(self):
+        if self.value < 0:
+            raise ValidationError('Negative value')
+
+
+@dataclass
+class Node:
+    value: int
+    child: Optional['Node']
+    checked: Checked
+
+
+def tea():
+    return Product('Tea', Currency('UAH', 2), ('hot', 'ünïcode'))
+
+
+@dataclass(frozen=True)
+class Payment:
+    amount: Decimal
+    x: float
+
+
+@dataclass(frozen=True)
+class Event:
+    at: datetime
+
+
+@dataclass
+class Wrapper:
+    event: Event
+
+
+class TestFragmentCache:
+
+    def test_output_matches_plain_encoding(self):
+        product = tea()
+        order = Order(1, [Line(product, 1), Line(product, 2, gift=product)], Line(product, 3))
+        plain = JsonModel(Order)
+        cached = JsonModel(Order, fragment_cache=True)
+        assert cached.dump(order) == plain.dump(order)
+        assert cached.dump(order) == plain.dump(order)
+        assert cached.dump_many([order, order]) == plain.dump_many([order, order])
+        assert cached.dump_many([]) == plain.dump_many([])
+
+    def test_repeated_nested_objects(self):
+        model = JsonModel(Line, fragment_cache=True)
+        product = tea()
+        model.dump_many([Line(product, 1), Line(product, 2), Line(product, 3)])
+        assert model.fragment_cache_stats() == CacheStats(hits=2, misses=2)
+
+    def test_collections_of_dataclasses(self):
+        model = JsonModel(Order, fragment_cache=True)
+        product = tea()
+        model.dump(Order(1, [Line(product, 1), Line(product, 2)], Line(product, 3)))
+        assert model.fragment_cache_stats() == CacheStats(hits=2, misses=2)
+
+    def test_frozen_root(self):
+        model = JsonModel(Product, fragment_cache=True)
+        product = tea()
+        assert model.dump(product) is model.dump(product)
+
+    def test_size_and_eviction(self):
+        model = JsonModel(Currency, fragment_cache=CacheOptions(size=1, key='hash'))
+        model.dump_many([Currency('UAH', 2), Currency('UAH', 2), Currency('EUR', 2), Currency('UAH', 2)])
+        assert model.fragment_cache_stats() == CacheStats(hits=1, misses=3, evictions=2)
+
+    def test_hash_keys_of_equal_objects_encoded_differently(self):
+        model = JsonModel(Payment, fragment_cache=CacheOptions(key='hash'))
+        assert model.dump(Payment(Decimal('1.0'), 0.0)) == '{"amount": "1.0", "x": 0.0}'
+        assert model.dump(Payment(Decimal('1.00'), -0.0)) == '{"amount": "1.00", "x": -0.0}'
+
+    def test_hash_keys_of_equal_moments_in_other_time_zones(self):
+        model = JsonModel(Wrapper, fragment_cache=CacheOptions(key='hash'))
+        noon = Wrapper(Event(datetime(2020, 1, 1, 12, tzinfo=timezone.utc)))
+        one = Wrapper(Event(datetime(2020, 1, 1, 13, tzinfo=timezone(timedelta(hours=1)))))
+        assert noon == one
+        assert model.dump(noon) == '{"event": {"at": "2020-01-01T12:00:00+00:00"}}'
+        assert model.dump(one) == '{"event": {"at": "2020-01-01T13:00:00+01:00"}}'
+
+    def test_recursive_dataclass(self):
+        node = Node(1, Node(2, None, Checked(2)), Checked(1))
+        assert JsonModel(Node, fragment_cache=True).dump(node) == JsonModel(Node).dump(node)
+
+    def test_validation_and_errors(self):
+        model = JsonModel(Node, fragment_cache=True, validate_on_dump=True)
+        with pytest.raises(ValidationError):
+            model.dump(Node(1, None, Checked(-1)))
+        with pytest.raises(DumpError):
+            model.dump(Node(1, None, 'not checked'))  # type: ignore
+
+    def test_disabled_by_default(self):
+        assert JsonModel(Line).fragment_cache_stats() == CacheStats()
+
+    def test_indent_not_supported(self):
+        with pytest.raises(ValueError):
+            JsonModel(Line, fragment_cache=True, indent=2)
@@ -0,0 +1,153 @@
+import asyncio
+import json
+from typing import List
+
+import pytest
+
+from serious import JsonModel, ValidationError
+from serious.json import streams
+from serious.json.errors import UnexpectedJson
+from tests.entities import DataclassX, DataclassWithListStr
+
+
+class ChunkedReader:
+    """A stream returning its data in chunks of a fixed size, to split values between reads."""
+
+    def __init__(self, data: str, size: int):
+        self.data = data.encode('utf-8')
+        self.size = size
+
+    async def read(self, n: int) -> bytes:
+        chunk, self.data = self.data[:min(n, self.size)], self.data[min(n, self.size):]
+        return chunk
+
+
+class CollectingWriter:
+
+    def __init__(self):
+        self.writes: List[bytes] = []
+        self.drains = 0
+
+    def write(self, data: bytes):
+        self.writes.append(data)
+
+    async def drain(self):
+        self.drains += 1
+
+    @property
+    def text(self) -> str:
+        return b''.join(self.writes).decode('utf-8')
+
+
+def load_all(model, data: str, size: int = 3):
+    async def collect():
+        return [item async for item in model.aiter_load(ChunkedReader(data, size), chunk_size=size)]
+
+    return asyncio.run(collect())
+
+
+class TestAsyncLoad:
+
+    def setup_class(self):
+        self.model = JsonModel(DataclassX)
+
+    @pytest.mark.parametrize('size', [1, 2, 5, 100])
+    def test_array(self, size):
+        data = ' [ {"x": 1}, {"x": 22} ,{"x": 333}]\n'
+        assert load_all(self.model, data, size) == [DataclassX(1), DataclassX(22), DataclassX(333)]
+
+    @pytest.mark.parametrize('size', [1, 2, 5, 100])
+    def test_ndjson(self, size):
+        data = '{"x": 1}\n\n{"x": 22}\n{"x": 333}'
+        assert load_all(self.model, data, size) == [DataclassX(1), DataclassX(22), DataclassX(333)]
+
+    def test_multibyte_characters_split_between_chunks(self):
+        model = JsonModel(DataclassWithListStr)
+        assert load_all(model, '[{"xs": ["Ψ∑ü"]}]', 1) == [DataclassWithListStr(['Ψ∑ü'])]
+
+    def test_empty(self):
+        assert load_all(self.model, '[]') == []
+        assert load_all(self.model, '') == []
+
+    def test_invalid_array(self):
+        with pytest.raises(UnexpectedJson):
+            load_all(self.model, '[{"x": 1} {"x": 2}]')
+        with pytest.raises(UnexpectedJson):
+            load_all(self.model, '[{"x": 1},]')
+        with pytest.raises(UnexpectedJson):
+            load_all(self.model, '[{"x": 1}')
+
+    def test_invalid_item(self):
+        with pytest.raises(UnexpectedJson):
+            load_all(self.model, '[1]')
+        with pytest.raises(ValidationError):
+            load_all(self.model, '{"x": "1"}\n')
+
+    def test_invalid_item_stops_reading(self):
+        reader = ChunkedReader('[{"x": 1}, {"x" 2}, ' + '{"x": 3}, ' * 1000 + ']', 10)
+
+        async def collect():
+            return [item async for item in self.model.aiter_load(reader, chunk_size=10)]
+
+        with pytest.raises(UnexpectedJson):
+            asyncio.run(collect())
+        assert len(reader.data) > 9000
+
+    def test_long_value_decoded_logarithmic_times(self, monkeypatch):
+        decodes = []
+
+        class CountingDecoder:
+            def raw_decode(self, text, position):
+                decodes.append(position)
+                return json.JSONDecoder().raw_decode(text, position)
+
+        monkeypatch.setattr(streams, '_decoder', CountingDecoder())
+        model = JsonModel(DataclassWithListStr)
+        item = DataclassWithListStr([str(i) for i in range(2000)])
+        assert load_all(model, f'[{model.dump(item)}]', 16) == [item]
+        assert len(decodes) < 20
+
+
+class TestAsyncDump:
+
+    def setup_class(self):
+        self.model = JsonModel(DataclassX)
+
+    def dump(self, items, **kwargs) -> CollectingWriter:
+        writer = CollectingWriter()
+        asyncio.run(self.model.adump_to(writer, items, **kwargs))
+        return writer
+
+    def test_ndjson(self):
+        writer = self.dump([DataclassX(i) for i in range(3)])
+        assert writer.text == '{"x": 0}\n{"x": 1}\n{"x": 2}\n'
+
+    def test_array_in_chunks(self):
+        writer = self.dump([DataclassX(i) for i in range(10)], array=True, chunk_size=20)
+        assert json.loads(writer.text) == [{'x': i} for i in range(10)]
+        assert len(writer.writes) == writer.drains > 1
+
+    def test_chunk_size_in_bytes(self):
+        model = JsonModel(DataclassWithListStr)
+        writer = CollectingWriter()
+        asyncio.run(model.adump_to(writer, [DataclassWithListStr(['ΨΨΨΨΨ'])] * 3, chunk_size=20))
+        assert [len(data) for data in writer.writes] == [23, 23, 23]
+
+    def test_async_items(self):
+        async def items():
+            for i in range(3):
+                yield DataclassX(i)
+
+        assert self.dump(items(), array=True).text == '[{"x": 0},{"x": 1},{"x": 2}]'
+
+    def test_empty(self):
+        assert self.dump([], array=True).text == '[]'
+        assert self.dump([]).writes == []
+
+    def test_round_trip(self):
+        items = [DataclassX(i) for i in range(100)]
+        assert load_all(self.model, self.dump(items, chunk_size=64).text, 7) == items
+
+    def test_indented_ndjson(self):
+        with pytest.raises(ValueError):
+            asyncio.run(JsonModel(DataclassX, indent=2).adump_to(CollectingWriter(), []))
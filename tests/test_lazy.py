@@ -0,0 +1,125 @@
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+import pytest
+
+from serious import DictModel, JsonModel, LoadError, ValidationError
+from serious.errors import MissingField, UnexpectedItem, ReservedFieldName
+from serious.serialization import FieldSerializer, LazyProxy, field_serializers, Loading, Dumping
+from serious.descriptors import TypeDescriptor
+
+
+class CountingSerializer(FieldSerializer):
+    loads = 0
+
+    @classmethod
+    def fits(cls, desc: TypeDescriptor) -> bool:
+        return desc.cls is float
+
+    def load(self, value, ctx: Loading):
+        CountingSerializer.loads += 1
+        return float(value)
+
+    def dump(self, value, ctx: Dumping):
+        return value
+
+
+@dataclass(frozen=True)
+class Owner:
+    name: str
+    score: float
+
+
+@dataclass(frozen=True)
+class Repo:
+    id: int
+    owner: Owner
+    tags: List[str]
+    description: Optional[str] = None
+    stars: List[int] = field(default_factory=list)
+
+    def __validate__(self):
+        if self.id < 0:
+            raise ValidationError('Negative id')
+
+
+def repo_data(**kwargs):
+    data = {'id': 1, 'owner': {'name': 'Ann', 'score': 0.5}, 'tags': ['a', 'b']}
+    data.update(kwargs)
+    return data
+
+
+class TestLoadLazy:
+
+    def setup_class(self):
+        self.model = DictModel(Repo, serializers=field_serializers([CountingSerializer]), allow_missing=True)
+
+    def test_fields_loaded_on_access(self):
+        CountingSerializer.loads = 0
+        proxy = self.model.load_lazy(repo_data())
+        assert isinstance(proxy, LazyProxy)
+        assert proxy.id == 1
+        assert 'owner' not in vars(proxy)
+        assert proxy.owner.name == 'Ann'
+        assert CountingSerializer.loads == 0
+        assert proxy.owner.score == 0.5
+        assert proxy.owner.score == 0.5
+        assert CountingSerializer.loads == 1
+
+    def test_defaults(self):
+        proxy = self.model.load_lazy(repo_data())
+        assert proxy.description is None
+        assert proxy.stars == []
+
+    def test_materialize(self):
+        proxy = self.model.load_lazy(repo_data(stars=[1, 2]))
+        assert proxy.tags == ['a', 'b']
+        assert proxy.materialize() == self.model.load(repo_data(stars=[1, 2]))
+
+    def test_top_level_shape_checked(self):
+        with pytest.raises(MissingField):
+            DictModel(Repo).load_lazy(repo_data())
+        with pytest.raises(UnexpectedItem):
+            self.model.load_lazy(repo_data(extra=1))
+
+    def test_field_errors_on_access(self):
+        proxy = self.model.load_lazy(repo_data(id='1', owner={'name': 'Ann', 'score': 'x'}))
+        with pytest.raises(ValidationError):
+            proxy.id
+        with pytest.raises(LoadError):
+            proxy.owner.score
+
+    def test_dataclass_validated_on_materialize(self):
+        proxy = self.model.load_lazy(repo_data(id=-1))
+        assert proxy.id == -1
+        with pytest.raises(ValidationError):
+            proxy.materialize()
+
+    def test_read_only(self):
+        proxy = self.model.load_lazy(repo_data())
+        with pytest.raises(AttributeError):
+            proxy.id = 2
+
+    def test_repr_shows_loaded_fields(self):
+        proxy = self.model.load_lazy(repo_data())
+        proxy.id
+        assert repr(proxy) == '<lazy Repo(id=1)>'
+
+
+def test_json_model():
+    model = JsonModel(Repo)
+    proxy = model.load_lazy('{"id": 2, "owner": {"name": "Bob", "score": 1.0}, "tags": [], "description": null, "stars": [5]}')
+    assert proxy.stars == [5]
+    assert proxy.materialize() == Repo(2, Owner('Bob', 1.0), [], None, [5])
+
+
+@dataclass(frozen=True)
+class Step:
+    materialize: bool
+
+
+def test_rejects_field_names_of_proxies():
+    model = DictModel(Step)
+    assert model.load({'materialize': True}) == Step(True)
+    with pytest.raises(ReservedFieldName):
+        model.load_lazy({'materialize': True})
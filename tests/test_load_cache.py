@@ -0,0 +1,63 @@
+import time
+from dataclasses import dataclass
+from typing import List, Tuple
+
+import pytest
+
+from serious import JsonModel, ValidationError
+from serious.caches import CacheOptions, CacheStats
+
+
+@dataclass(frozen=True)
+class Event:
+    event_id: int
+    tags: Tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class Batch:
+    events: List[Event]
+
+
+class TestLoadCache:
+
+    def test_disabled_by_default(self):
+        model = JsonModel(Event)
+        assert model.load('{"eventId": 1, "tags": []}') is not model.load('{"eventId": 1, "tags": []}')
+        assert model.load_cache_stats() == CacheStats()
+
+    def test_same_input(self):
+        model = JsonModel(Event, load_cache=True)
+        first = model.load('{"eventId": 1, "tags": ["a"]}')
+        assert model.load('{"eventId": 1, "tags": ["a"]}') is first
+        assert model.load('{"eventId": 1, "tags": ["a"]}'.encode()) is first
+        assert model.load('{"eventId": 2, "tags": ["a"]}') == Event(2, ('a',))
+        assert model.load_cache_stats() == CacheStats(hits=2, misses=2)
+
+    def test_eviction(self):
+        model = JsonModel(Event, load_cache=1)
+        for event_id in [1, 1, 2, 1]:
+            model.load(f'{{"eventId": {event_id}, "tags": []}}')
+        assert model.load_cache_stats() == CacheStats(hits=1, misses=3, evictions=2)
+
+    def test_ttl(self):
+        model = JsonModel(Event, load_cache=CacheOptions(ttl=0.01))
+        first = model.load('{"eventId": 1, "tags": []}')
+        time.sleep(0.02)
+        assert model.load('{"eventId": 1, "tags": []}') is not first
+
+    def test_errors_not_cached(self):
+        model = JsonModel(Event, load_cache=True)
+        for _ in range(2):
+            with pytest.raises(ValidationError):
+                model.load('{"eventId": "x", "tags": []}')
+        assert model.load_cache_stats() == CacheStats(misses=2)
+
+    def test_projections_not_cached(self):
+        model = JsonModel(Event, load_cache=True)
+        assert model.load('{"eventId": 1, "tags": []}', only={'event_id'}).event_id == 1
+        assert model.load_cache_stats() == CacheStats()
+
+    def test_only_immutable_models(self):
+        with pytest.raises(ValueError):
+            JsonModel(Batch, load_cache=True)
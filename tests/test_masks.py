@@ -0,0 +1,107 @@
+from dataclasses import dataclass
+from typing import List, Optional
+
+import pytest
+
+from serious import DictModel, JsonModel, DumpError
+from serious.errors import InvalidFieldPath
+from serious.serialization import FieldSerializer, field_serializers, Loading, Dumping
+from serious.descriptors import TypeDescriptor
+
+
+class Secret:
+    def __init__(self, value: str):
+        self.value = value
+
+
+class SecretSerializer(FieldSerializer):
+    dumps = 0
+
+    @classmethod
+    def fits(cls, desc: TypeDescriptor) -> bool:
+        return desc.cls is Secret
+
+    def load(self, value, ctx: Loading):
+        return Secret(value)
+
+    def dump(self, value, ctx: Dumping):
+        SecretSerializer.dumps += 1
+        return value.value
+
+
+@dataclass
+class Profile:
+    name: str
+    password: Secret
+
+
+@dataclass
+class Account:
+    id: int
+    profile: Profile
+    backup: Optional[Profile]
+    tags: List[str]
+
+
+@pytest.fixture
+def account():
+    return Account(1, Profile('ann', Secret('qwerty')), None, ['a'])
+
+
+class TestDumpMasks:
+
+    def setup_class(self):
+        self.model = DictModel(Account, serializers=field_serializers([SecretSerializer]))
+
+    def test_include(self, account):
+        assert self.model.dump(account, include={'id', 'profile.name'}) == {'id': 1, 'profile': {'name': 'ann'}}
+
+    def test_exclude(self, account):
+        assert self.model.dump(account, exclude={'tags', 'profile.password'}) \
+               == {'id': 1, 'profile': {'name': 'ann'}, 'backup': None}
+
+    def test_include_and_exclude(self, account):
+        assert self.model.dump(account, include={'profile'}, exclude='profile.password') \
+               == {'profile': {'name': 'ann'}}
+
+    def test_excluded_serializers_not_called(self, account):
+        SecretSerializer.dumps = 0
+        self.model.dump(account, exclude={'profile.password'})
+        self.model.dump(account, include={'profile.name'})
+        assert SecretSerializer.dumps == 0
+        self.model.dump(account, include={'profile.password'})
+        assert SecretSerializer.dumps == 1
+
+    def test_optional_nested(self, account):
+        assert self.model.dump(account, include={'backup.name'}) == {'backup': None}
+        account.backup = Profile('bob', Secret('1'))
+        assert self.model.dump(account, include={'backup.name'}) == {'backup': {'name': 'bob'}}
+
+    def test_dump_many(self, account):
+        assert self.model.dump_many([account, account], include=['id']) == [{'id': 1}, {'id': 1}]
+
+    def test_masks_cached(self):
+        serious_model = self.model.serious_model
+        assert serious_model.mask({'id', 'tags'}, None) is serious_model.mask(['tags', 'id'])
+        assert serious_model.mask(exclude='id') is not serious_model.mask(include='id')
+
+    def test_invalid_path(self, account):
+        with pytest.raises(InvalidFieldPath):
+            self.model.dump(account, include={'profile.age'})
+
+    def test_errors_wrapped(self, account):
+        account.profile = 'ann'
+        with pytest.raises(DumpError):
+            self.model.dump(account, include={'profile.name'})
+
+
+def test_json_model_camel_case():
+    @dataclass
+    class Outer:
+        outer_id: int
+        inner_value: Profile
+
+    model = JsonModel(Outer, serializers=field_serializers([SecretSerializer]))
+    outer = Outer(1, Profile('ann', Secret('x')))
+    assert model.dump(outer, exclude={'inner_value.password'}) == '{"outerId": 1, "innerValue": {"name": "ann"}}'
+    assert model.dump_many([outer], include={'outer_id'}) == '[{"outerId": 1}]'
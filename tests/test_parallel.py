@@ -0,0 +1,132 @@
+from dataclasses import dataclass
+from multiprocessing import get_context
+
+import pytest
+
+from serious import DictModel, JsonModel
+from serious.parallel import ParallelModel, NdjsonReader
+from serious.parallel.errors import BatchLoadError, BatchDumpError, ShardLoadError
+from tests.entities import DataclassX, DataclassXs
+
+
+@dataclass(frozen=True)
+class Product:
+    name: str
+    price: int
+
+
+class TestParallelModel:
+
+    def setup_class(self):
+        self.model = ParallelModel(DictModel(DataclassXs), workers=2, chunk_size=3)
+
+    def teardown_class(self):
+        self.model.close()
+
+    def test_load_many_preserves_order(self):
+        data = [{'xs': [{'x': i}, {'x': -i}]} for i in range(20)]
+        assert self.model.load_many(data) == [DataclassXs([DataclassX(i), DataclassX(-i)]) for i in range(20)]
+
+    def test_dump_many_preserves_order(self):
+        items = [DataclassXs([DataclassX(i)]) for i in range(20)]
+        assert self.model.dump_many(iter(items)) == [{'xs': [{'x': i}]} for i in range(20)]
+
+    def test_single_chunk(self):
+        assert self.model.load_many([{'xs': []}]) == [DataclassXs([])]
+        assert self.model.load_many([]) == []
+
+    def test_failing_indexes(self):
+        data = [{'xs': [{'x': i}]} for i in range(10)]
+        data[2] = {'xs': [{'x': 'two'}]}
+        data[7] = {}
+        with pytest.raises(BatchLoadError) as e:
+            self.model.load_many(data)
+        assert set(e.value.failures) == {2, 7}
+        assert '[2, 7]' in e.value.message
+
+    def test_dump_failing_indexes(self):
+        items = [DataclassXs([DataclassX(i)]) for i in range(10)]
+        items[4] = DataclassX(4)
+        with pytest.raises(BatchDumpError) as e:
+            self.model.dump_many(items)
+        assert set(e.value.failures) == {4}
+
+
+def test_json_model():
+    with ParallelModel(JsonModel(DataclassX), workers=2, chunk_size=2) as model:
+        lines = [f'{{"x": {i}}}' for i in range(7)]
+        items = model.load_many(lines)
+        assert items == [DataclassX(i) for i in range(7)]
+        assert model.dump_many(items) == lines
+
+
+def test_spawned_workers_with_caches(tmp_path):
+    spawn = get_context('spawn')
+    products = [Product('Tea', i % 3) for i in range(10)]
+    dict_model = DictModel(Product, dump_cache=True, canonicalize=True, scalar_cache=True)
+    with ParallelModel(dict_model, workers=2, chunk_size=4, mp_context=spawn) as model:
+        dumped = model.dump_many(products)
+        assert dumped == [{'name': 'Tea', 'price': i % 3} for i in range(10)]
+        assert model.load_many(dumped) == products
+    json_model = JsonModel(Product, load_cache=True, fragment_cache=True)
+    path = tmp_path / 'products.ndjson'
+    path.write_text(''.join(json_model.dump(product) + '\n' for product in products))
+    with NdjsonReader(json_model, path, workers=2, shard_size=64, mp_context=spawn) as reader:
+        assert reader.load_all() == products
+
+
+class TestNdjsonReader:
+
+    def setup_class(self):
+        self.model = JsonModel(DataclassX)
+
+    def write(self, tmp_path, lines):
+        path = tmp_path / 'items.ndjson'
+        path.write_text('\n'.join(lines) + '\n')
+        return path
+
+    def test_shards_aligned_to_lines(self, tmp_path):
+        path = self.write(tmp_path, [f'{{"x": {i}}}' for i in range(100)])
+        shards = NdjsonReader(self.model, path, shard_size=50).shards()
+        content = path.read_bytes()
+        assert shards[0].start == 0
+        assert shards[-1].end == len(content)
+        for previous, shard in zip(shards, shards[1:]):
+            assert previous.end == shard.start
+            assert content[shard.start - 1:shard.start] == b'\n'
+
+    def test_ordered(self, tmp_path):
+        path = self.write(tmp_path, [f'{{"x": {i}}}' for i in range(1000)])
+        with NdjsonReader(self.model, path, workers=2, shard_size=256) as reader:
+            assert reader.load_all() == [DataclassX(i) for i in range(1000)]
+            assert reader.progress.items_done == 1000
+            assert reader.progress.shards_done == reader.progress.shards_total > 1
+            assert reader.progress.fraction == 1
+
+    def test_reused_pool_reads_grown_file(self, tmp_path):
+        path = self.write(tmp_path, [f'{{"x": {i}}}' for i in range(100)])
+        with NdjsonReader(self.model, path, workers=2, shard_size=256) as reader:
+            assert len(reader.load_all()) == 100
+            self.write(tmp_path, [f'{{"x": {i}}}' for i in range(1000)])
+            assert reader.load_all() == [DataclassX(i) for i in range(1000)]
+
+    def test_unordered(self, tmp_path):
+        path = self.write(tmp_path, [f'{{"x": {i}}}' for i in range(1000)])
+        with NdjsonReader(self.model, path, workers=2, shard_size=256, ordered=False) as reader:
+            assert sorted(item.x for item in reader) == list(range(1000))
+
+    def test_single_shard_and_blank_lines(self, tmp_path):
+        path = self.write(tmp_path, ['{"x": 1}', '', '{"x": 2}'])
+        assert NdjsonReader(self.model, path).load_all() == [DataclassX(1), DataclassX(2)]
+
+    def test_empty_file(self, tmp_path):
+        path = tmp_path / 'empty.ndjson'
+        path.write_text('')
+        assert NdjsonReader(self.model, path).load_all() == []
+
+    def test_failing_lines(self, tmp_path):
+        path = self.write(tmp_path, ['{"x": 1}', '{"x": "two"}', '{"x": 3}'])
+        with pytest.raises(ShardLoadError) as e:
+            NdjsonReader(self.model, path).load_all()
+        assert set(e.value.failures) == {9}
+        assert 'byte offsets [9]' in e.value.message
@@ -0,0 +1,171 @@
+import pickle
+from dataclasses import dataclass
+from typing import List
+
+import pytest
+
+from serious import DictModel, JsonModel, BinaryModel, PersistentDict, PersistentList, FrozenList, FrozenDict, \
+    ValidationError
+from serious.errors import ModelContainsAny, MutableTypesInModel
+
+
+@dataclass(frozen=True)
+class Inventory:
+    stock: PersistentDict[str, int]
+    log: PersistentList[str]
+
+
+@dataclass(frozen=True)
+class Shelves:
+    shelves: PersistentList[Inventory]
+    labels: FrozenList[str]
+
+
+class Colliding:
+    def __init__(self, value):
+        self.value = value
+
+    def __hash__(self):
+        return self.value % 3
+
+    def __eq__(self, other):
+        return isinstance(other, Colliding) and other.value == self.value
+
+
+class TestPersistentDict:
+
+    def test_set_and_delete_keep_original(self):
+        original = PersistentDict({'a': 1, 'b': 2})
+        changed = original.set('c', 3).delete('a')
+        assert original == {'a': 1, 'b': 2}
+        assert changed == {'b': 2, 'c': 3}
+        assert original.set('a', 1) is original
+
+    def test_many_keys(self):
+        reference = {str(i): i for i in range(5000)}
+        mapping = PersistentDict(reference)
+        for key in list(reference)[::3]:
+            mapping = mapping.delete(key)
+            del reference[key]
+        assert len(mapping) == len(reference)
+        assert dict(mapping.items()) == reference
+        assert all(mapping[key] == value for key, value in reference.items())
+
+    def test_hash_collisions(self):
+        mapping = PersistentDict((Colliding(i), i) for i in range(30))
+        assert mapping[Colliding(27)] == 27
+        mapping = mapping.delete(Colliding(27))
+        assert Colliding(27) not in mapping
+        assert len(mapping) == 29
+
+    def test_missing_key(self):
+        with pytest.raises(KeyError):
+            PersistentDict({'a': 1}).delete('b')
+        with pytest.raises(KeyError):
+            PersistentDict()['b']
+        assert PersistentDict().get('b', 0) == 0
+
+    def test_hash_and_pickle(self):
+        mapping = PersistentDict({'a': 1, 'b': (2, 3)})
+        assert hash(mapping) == hash(PersistentDict([('b', (2, 3)), ('a', 1)]))
+        assert pickle.loads(pickle.dumps(mapping)) == mapping
+
+    def test_equal_to_frozen_dict_with_the_same_hash(self):
+        mapping = PersistentDict({'a': 1, 'b': (2, 3)})
+        frozen = FrozenDict({'b': (2, 3), 'a': 1})
+        assert mapping == frozen and frozen == mapping
+        assert hash(mapping) == hash(frozen)
+        assert len({mapping, frozen}) == 1
+
+    def test_equality_of_unhashable_values(self):
+        assert PersistentDict({'a': [1]}) == PersistentDict({'a': [1]})
+        assert PersistentDict({'a': [1]}) != PersistentDict({'a': [2]})
+        assert PersistentDict({'a': 1}) != PersistentDict({'a': 2})
+        hashed = PersistentDict({'a': 1})
+        hash(hashed)
+        assert hashed != PersistentDict({'a': 2}) and hashed == PersistentDict({'a': 1})
+
+
+class TestPersistentList:
+
+    @pytest.mark.parametrize('size', [0, 1, 32, 33, 1056, 1057, 40_000])
+    def test_append_set_pop(self, size):
+        reference = list(range(size))
+        items = PersistentList(reference)
+        assert list(items.append(-1)) == reference + [-1]
+        if size:
+            assert list(items.set(size // 2, 'x')) == reference[:size // 2] + ['x'] + reference[size // 2 + 1:]
+            assert list(items.pop()) == reference[:-1]
+            assert items[-1] == reference[-1]
+        assert list(items) == reference
+
+    def test_grows_and_shrinks(self):
+        items = PersistentList()
+        for i in range(2000):
+            items = items.append(i)
+        assert list(items) == list(range(2000))
+        for _ in range(1990):
+            items = items.pop()
+        assert items == PersistentList(range(10))
+
+    def test_errors(self):
+        with pytest.raises(IndexError):
+            PersistentList([1])[1]
+        with pytest.raises(IndexError):
+            PersistentList().pop()
+
+    def test_hash_and_pickle(self):
+        items = PersistentList(['a', 'b'])
+        assert hash(items) == hash(PersistentList(['a', 'b']))
+        assert items[1:] == PersistentList(['b'])
+        assert pickle.loads(pickle.dumps(items)) == items
+
+    def test_equality_of_unhashable_values(self):
+        assert PersistentList([[1]]) == PersistentList([[1]])
+        assert PersistentList([[1]]) != PersistentList([[2]])
+
+
+class TestSerialization:
+
+    @pytest.mark.parametrize('model_cls', [DictModel, JsonModel, BinaryModel])
+    def test_load_dump(self, model_cls):
+        model = model_cls(Shelves, ensure_frozen=True)
+        inventory = Inventory(PersistentDict({'tea': 10}), PersistentList(['tea']))
+        shelves = Shelves(PersistentList([inventory, inventory]), FrozenList(['a', 'b', 'c']))
+        loaded = model.load(model.dump(shelves))
+        assert loaded == shelves
+        assert isinstance(loaded.shelves, PersistentList)
+        assert isinstance(loaded.shelves[0].stock, PersistentDict)
+
+    def test_dumped_as_standard_collections(self):
+        inventory = Inventory(PersistentDict({'tea': 10}), PersistentList(['tea']))
+        assert DictModel(Inventory).dump(inventory) == {'stock': {'tea': 10}, 'log': ['tea']}
+
+    @pytest.mark.parametrize('model_cls', [DictModel, JsonModel, BinaryModel])
+    def test_dumped_with_sorted_keys(self, model_cls):
+        model = model_cls(Inventory)
+        keys = [f'key {i}' for i in range(100)]
+        dumped = model.dump(Inventory(PersistentDict((key, 1) for key in reversed(keys)), PersistentList()))
+        assert dumped == model.dump(Inventory(PersistentDict((key, 1) for key in keys), PersistentList()))
+        if model_cls is DictModel:
+            assert list(dumped['stock']) == sorted(keys)
+
+    def test_validation(self):
+        with pytest.raises(ValidationError):
+            DictModel(Inventory).load({'stock': {'tea': 10}, 'log': 'tea'})
+
+    def test_unparameterized_contain_any(self):
+        @dataclass(frozen=True)
+        class Untyped:
+            items: PersistentList
+
+        with pytest.raises(ModelContainsAny):
+            DictModel(Untyped)
+
+    def test_mutable_items_fail_ensure_frozen(self):
+        @dataclass(frozen=True)
+        class Nested:
+            items: PersistentList[List[str]]
+
+        with pytest.raises(MutableTypesInModel):
+            DictModel(Nested, ensure_frozen=True)
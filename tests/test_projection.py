@@ -0,0 +1,105 @@
+from dataclasses import dataclass, fields, FrozenInstanceError
+from typing import List, Optional
+
+import pytest
+
+from serious import DictModel, JsonModel, ValidationError, LoadError
+from serious.errors import InvalidFieldPath, MissingField
+from serious.serialization import field_serializers
+from tests.test_lazy import CountingSerializer
+
+
+@dataclass(frozen=True)
+class User:
+    name: str
+    rating: float
+
+
+@dataclass(frozen=True)
+class Event:
+    id: int
+    owner: User
+    reviewer: Optional[User]
+    tags: List[str]
+
+    def __validate__(self):
+        raise ValidationError('Projections do not validate the original dataclass')
+
+
+def event_data(**kwargs):
+    data = {'id': 1, 'owner': {'name': 'Ann', 'rating': 1.5}, 'reviewer': None, 'tags': ['x']}
+    data.update(kwargs)
+    return data
+
+
+class TestProjection:
+
+    def setup_class(self):
+        self.model = DictModel(Event, serializers=field_serializers([CountingSerializer]))
+
+    def test_selected_fields(self):
+        CountingSerializer.loads = 0
+        event = self.model.load(event_data(), only={'id', 'owner.name'})
+        assert type(event).__name__ == 'EventProjection'
+        assert [f.name for f in fields(event)] == ['id', 'owner']
+        assert event.id == 1
+        assert event.owner.name == 'Ann'
+        assert [f.name for f in fields(event.owner)] == ['name']
+        assert CountingSerializer.loads == 0
+
+    def test_frozen(self):
+        event = self.model.load(event_data(), only=['id'])
+        with pytest.raises(FrozenInstanceError):
+            event.id = 2
+
+    def test_whole_field_wins(self):
+        event = self.model.load(event_data(), only={'owner.name', 'owner'})
+        assert event.owner == User('Ann', 1.5)
+
+    def test_optional_nested(self):
+        assert self.model.load(event_data(), only={'reviewer.name'}).reviewer is None
+        event = self.model.load(event_data(reviewer={'name': 'Bob'}), only={'reviewer.name'})
+        assert event.reviewer.name == 'Bob'
+
+    def test_plan_cached(self):
+        serious_model = self.model.serious_model
+        assert serious_model.projection({'id', 'owner.name'}) is serious_model.projection(['owner.name', 'id'])
+        assert type(self.model.load(event_data(), only='id')) is type(self.model.load(event_data(), only=['id']))
+
+    def test_unselected_fields_are_not_checked(self):
+        data = event_data(tags='not a list', unexpected=True)
+        del data['reviewer']
+        assert self.model.load(data, only={'id'}).id == 1
+
+    def test_selected_fields_are_checked(self):
+        with pytest.raises(MissingField):
+            self.model.load({'owner': {'name': 'Ann'}}, only={'id'})
+        with pytest.raises(ValidationError):
+            self.model.load(event_data(id='1'), only={'id'})
+        with pytest.raises(ValidationError):
+            self.model.load(event_data(owner=[]), only={'owner.name'})
+
+    def test_invalid_paths(self):
+        with pytest.raises(InvalidFieldPath):
+            self.model.load(event_data(), only={'name'})
+        with pytest.raises(InvalidFieldPath):
+            self.model.load(event_data(), only={'tags.x'})
+        with pytest.raises(InvalidFieldPath):
+            self.model.load(event_data(), only={'owner.id'})
+
+    def test_load_many(self):
+        events = self.model.load_many([event_data(id=i) for i in range(3)], only={'id'})
+        assert [event.id for event in events] == [0, 1, 2]
+
+
+def test_json_model_camel_case():
+    @dataclass(frozen=True)
+    class Snake:
+        snake_id: int
+        inner_snake: User
+
+    model = JsonModel(Snake)
+    snake = model.load('{"snakeId": 1, "innerSnake": {"name": "Sid", "rating": 0.1}}', only={'inner_snake.rating'})
+    assert snake.inner_snake.rating == 0.1
+    snakes = model.load_many('[{"snakeId": 1}, {"snakeId": 2}]', only={'snake_id'})
+    assert [s.snake_id for s in snakes] == [1, 2]
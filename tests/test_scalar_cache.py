@@ -0,0 +1,93 @@
+from dataclasses import dataclass
+from datetime import date, datetime, time
+from decimal import Decimal
+from enum import Enum, IntEnum
+from typing import List, Optional
+from uuid import UUID
+
+import pytest
+
+from serious import DictModel, JsonModel, ValidationError
+from serious.caches import CacheOptions, CacheStats
+
+
+class Currency(Enum):
+    UAH = 'UAH'
+    EUR = 'EUR'
+
+
+class Level(IntEnum):
+    LOW = 1
+    HIGH = 2
+
+
+@dataclass(frozen=True)
+class Payment:
+    id: UUID
+    amount: Decimal
+    currency: Currency
+    day: date
+    at: datetime
+    cutoff: time
+
+
+@dataclass(frozen=True)
+class Alert:
+    level: Level
+    levels: List[Level]
+    previous: Optional[Level]
+
+
+def payment(**changes):
+    data = {
+        'id': 'd1d61dc7-64bd-4d2b-a1f4-b0e2a6d5c9a1',
+        'amount': '12.50',
+        'currency': 'UAH',
+        'day': '2019-06-01',
+        'at': '2019-06-01T12:00:00+00:00',
+        'cutoff': '18:00:00',
+    }
+    data.update(changes)
+    return data
+
+
+class TestScalarCache:
+
+    def test_reuses_converted_values(self):
+        model = DictModel(Payment, scalar_cache=True)
+        first, second = model.load_many([payment(), payment()])
+        assert first == second == DictModel(Payment).load(payment())
+        assert first.id is second.id
+        assert first.amount is second.amount
+        assert first.day is second.day
+        assert first.at is second.at
+        assert model.scalar_cache_stats() == CacheStats(hits=6, misses=6)
+
+    def test_nested_and_collections(self):
+        model = JsonModel(Alert, scalar_cache=True)
+        alert = model.load('{"level": 1, "levels": [1, 2, 1], "previous": 2}')
+        assert alert == Alert(Level.LOW, [Level.LOW, Level.HIGH, Level.LOW], Level.HIGH)
+        assert model.scalar_cache_stats() == CacheStats(hits=1, misses=4)
+
+    def test_bool_is_not_confused_with_int(self):
+        model = DictModel(Alert, scalar_cache=True)
+        model.load({'level': 1, 'levels': [], 'previous': None})
+        with pytest.raises(ValidationError):
+            model.load({'level': True, 'levels': [], 'previous': None})
+
+    def test_invalid_values_are_not_cached(self):
+        model = DictModel(Payment, scalar_cache=True)
+        for _ in range(2):
+            with pytest.raises(ValidationError):
+                model.load(payment(amount='twelve'))
+        assert model.load(payment()).amount == Decimal('12.50')
+
+    def test_size_and_eviction(self):
+        model = DictModel(Payment, scalar_cache=CacheOptions(size=1))
+        model.load_many([payment(currency='UAH'), payment(currency='EUR'), payment(currency='UAH')])
+        assert model.scalar_cache_stats() == CacheStats(hits=10, misses=8, evictions=2)
+
+    def test_disabled_by_default(self):
+        model = DictModel(Payment)
+        model.load_many([payment(), payment()])
+        assert model.scalar_cache_stats() == CacheStats()
@@ -0,0 +1,90 @@
+from multiprocessing import get_context, get_all_start_methods
+
+import pytest
+
+pytest.importorskip('multiprocessing.shared_memory')
+
+from serious import BinaryModel, StructModel  # noqa: E402
+from serious.shared import SharedMemoryChannel, RingBuffer  # noqa: E402
+from tests.entities import DataclassX, DataclassXs  # noqa: E402
+
+
+def produce(channel: SharedMemoryChannel, batches: int):
+    for i in range(batches):
+        channel.send([DataclassXs([DataclassX(i), DataclassX(-i)])])
+    channel.close()
+
+
+class TestRingBuffer:
+
+    def setup_method(self):
+        self.ring = RingBuffer(16)
+
+    def teardown_method(self):
+        self.ring.close()
+
+    def test_put_get(self):
+        self.ring.put(b'hello')
+        assert self.ring.used == 9
+        assert self.ring.get() == b'hello'
+        assert self.ring.used == 0
+
+    def test_wraps_around(self):
+        for i in range(10):
+            message = bytes([i]) * (i % 7 + 1)
+            self.ring.put(message)
+            assert self.ring.get() == message
+
+    def test_attach_by_name(self):
+        attached = RingBuffer(name=self.ring.name)
+        attached.put(b'abc')
+        assert self.ring.get() == b'abc'
+        attached.close()
+
+    def test_full(self):
+        self.ring.put(b'0123456789')
+        with pytest.raises(TimeoutError):
+            self.ring.put(b'01', timeout=0.01)
+
+    def test_empty(self):
+        with pytest.raises(TimeoutError):
+            self.ring.get(timeout=0.01)
+
+    def test_too_large(self):
+        with pytest.raises(ValueError):
+            self.ring.put(b'0123456789abc')
+
+
+class TestSharedMemoryChannel:
+
+    def test_binary_model(self):
+        with SharedMemoryChannel(BinaryModel(DataclassXs), capacity=1024) as channel:
+            batch = [DataclassXs([DataclassX(1)]), DataclassXs([])]
+            channel.send(batch)
+            assert channel.receive() == batch
+
+    def test_struct_model(self):
+        with SharedMemoryChannel(StructModel(DataclassX), capacity=1024) as channel:
+            batch = [DataclassX(i) for i in range(10)]
+            channel.send(batch)
+            assert channel.receive() == batch
+
+    def test_between_processes(self):
+        with SharedMemoryChannel(BinaryModel(DataclassXs), capacity=64) as channel:
+            process = get_context('spawn').Process(target=produce, args=(channel, 20))
+            process.start()
+            received = [channel.receive(timeout=30) for _ in range(20)]
+            process.join()
+        assert received == [[DataclassXs([DataclassX(i), DataclassX(-i)])] for i in range(20)]
+
+    @pytest.mark.skipif('fork' not in get_all_start_methods(), reason='fork is not available')
+    def test_forked_child_keeps_block(self):
+        with SharedMemoryChannel(BinaryModel(DataclassXs), capacity=64) as channel:
+            process = get_context('fork').Process(target=produce, args=(channel, 3))
+            process.start()
+            received = [channel.receive(timeout=30) for _ in range(3)]
+            process.join()
+            assert process.exitcode == 0
+            attached = RingBuffer(name=channel.name)  # The child closed its copy of the owner without unlinking.
+            attached.close()
+        assert received == [[DataclassXs([DataclassX(i), DataclassX(-i)])] for i in range(3)]
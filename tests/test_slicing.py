@@ -0,0 +1,76 @@
+import asyncio
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from serious import DictModel, JsonModel, ValidationError
+from serious.slicing import load_sliced
+from tests.entities import DataclassX
+
+
+async def count_loop_turns(coroutine):
+    """Runs a coroutine alongside a task counting how many times the loop let it run."""
+    turns = 0
+    done = False
+
+    async def count():
+        nonlocal turns
+        while not done:
+            turns += 1
+            await asyncio.sleep(0)
+
+    counter = asyncio.ensure_future(count())
+    try:
+        result = await coroutine
+    finally:
+        done = True
+        await counter
+    return result, turns
+
+
+class TestAsyncLoadMany:
+
+    def setup_class(self):
+        self.model = DictModel(DataclassX)
+        self.data = [{'x': i} for i in range(100)]
+        self.expected = [DataclassX(i) for i in range(100)]
+
+    def test_item_budget_yields_to_loop(self):
+        result, turns = asyncio.run(count_loop_turns(self.model.aload_many(self.data, item_budget=10)))
+        assert result == self.expected
+        assert turns >= 10
+
+    def test_time_budget(self):
+        result, turns = asyncio.run(count_loop_turns(self.model.aload_many(iter(self.data), time_budget=0)))
+        assert result == self.expected
+        assert turns >= 100
+
+    def test_executor(self):
+        with ThreadPoolExecutor(1) as executor:
+            result = asyncio.run(self.model.aload_many(self.data, item_budget=7, executor=executor))
+        assert result == self.expected
+
+    def test_json_model(self):
+        model = JsonModel(DataclassX)
+        assert asyncio.run(model.aload_many(model.dump_many(self.expected), item_budget=30)) == self.expected
+
+    def test_empty(self):
+        assert asyncio.run(self.model.aload_many([])) == []
+
+    def test_errors_propagate(self):
+        with pytest.raises(ValidationError):
+            asyncio.run(self.model.aload_many([{'x': 1}, {'x': 'two'}], item_budget=1))
+
+    def test_budget_required(self):
+        with pytest.raises(ValueError):
+            asyncio.run(load_sliced(self.model.load, self.data, time_budget=None))
+        with pytest.raises(ValueError):
+            asyncio.run(load_sliced(self.model.load, self.data, item_budget=0))
+
+
+def test_import_does_not_load_asyncio():
+    check = 'import sys, serious; assert "asyncio" not in sys.modules and "concurrent.futures" not in sys.modules'
+    subprocess.run([sys.executable, '-c', check], cwd=str(Path(__file__).parent.parent), check=True)
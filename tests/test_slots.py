@@ -0,0 +1,80 @@
+import pickle
+from dataclasses import dataclass
+from typing import List, Optional
+
+import pytest
+
+from serious import DictModel, JsonModel, BinaryModel, Timestamp, Email
+from serious.caches import CacheOptions
+
+
+@dataclass(frozen=True)
+class Point:
+    __slots__ = ('x', 'y')
+    x: int
+    y: int
+
+
+@dataclass(frozen=True)
+class WeakPoint:
+    __slots__ = ('x', 'y', '__weakref__')
+    x: int
+    y: int
+
+
+@dataclass
+class Track:
+    __slots__ = ('name', 'at', 'points', 'last')
+    name: str
+    at: Timestamp
+    points: List[Point]
+    last: Optional[Point]
+
+
+def track():
+    return Track('Walk', Timestamp(1), [Point(1, 2), Point(3, 4)], Point(3, 4))
+
+
+class TestSlottedDataclasses:
+
+    @pytest.mark.parametrize('model', [DictModel(Track), JsonModel(Track), BinaryModel(Track)])
+    def test_load_dump(self, model):
+        assert model.load(model.dump(track())) == track()
+
+    def test_lazy_load(self):
+        proxy = DictModel(Track).load_lazy(DictModel(Track).dump(track()))
+        assert proxy.name == 'Walk'
+        assert proxy.materialize() == track()
+
+    def test_diff(self):
+        model = DictModel(Track)
+        changed = model.apply_diff(track(), model.dump_diff(track(), Track('Run', Timestamp(1), [], None)))
+        assert changed == Track('Run', Timestamp(1), [], None)
+
+    def test_canonicalize_requires_weak_references(self):
+        first, second = DictModel(Point, canonicalize=True).load_many([{'x': 1, 'y': 2}] * 2)
+        assert first == second
+        assert first is not second
+        first, second = DictModel(WeakPoint, canonicalize=True).load_many([{'x': 1, 'y': 2}] * 2)
+        assert first is second
+
+    def test_dump_cache(self):
+        point = Point(1, 2)
+        assert DictModel(Point, dump_cache=True).dump(point) == {'x': 1, 'y': 2}
+        model = DictModel(Point, dump_cache=CacheOptions(key='hash'))
+        assert model.dump(point) is model.dump(Point(1, 2))
+
+
+class TestSlottedTypes:
+
+    def test_timestamp(self):
+        timestamp = Timestamp(1.5)
+        assert not hasattr(timestamp, '__dict__')
+        assert pickle.loads(pickle.dumps(timestamp)) == timestamp
+        with pytest.raises(AttributeError):
+            timestamp.value = 2.0
+
+    def test_email(self):
+        email = Email('Leonardo@Vinci.it')
+        assert not hasattr(email, '__dict__')
+        assert pickle.loads(pickle.dumps(email)) == email
@@ -0,0 +1,239 @@
+from dataclasses import dataclass, field
+from datetime import date
+from enum import Enum, IntEnum
+from typing import Optional, List
+from uuid import UUID
+
+import pytest
+
+from serious import StructModel, LoadError, DumpError, ValidationError, Timestamp
+from serious.errors import ReservedFieldName
+from serious.struct.errors import VariableLengthField, EmptyRecord
+from serious.test_utils import assert_symmetric
+
+
+class Status(Enum):
+    OK = 'ok'
+    FAILED = 'failed'
+
+
+class Priority(IntEnum):
+    LOW = -1
+    HIGH = 10
+
+
+@dataclass(frozen=True)
+class Point:
+    sensor: UUID
+    at: Timestamp
+    value: float
+    count: int
+    valid: bool
+    status: Status
+    priority: Priority
+    day: date
+
+
+def point(i: int = 0) -> Point:
+    return Point(
+        sensor=UUID('d1d61dd7-c036-47d3-a6ed-91cc2e885fc8'),
+        at=Timestamp(1542473728.456753 + i),
+        value=i / 3,
+        count=-i,
+        valid=i % 2 == 0,
+        status=Status.FAILED,
+        priority=Priority.LOW,
+        day=date(2019, 9, 1),
+    )
+
+
+@dataclass(frozen=True)
+class Reading:
+    value: float
+
+    def __validate__(self):
+        if self.value < 0:
+            raise ValidationError('Negative reading')
+
+
+class TestStructModel:
+
+    def setup_class(self):
+        self.model = StructModel(Point)
+
+    def test_format(self):
+        assert self.model.format == '<16sddq?Bqi'
+        assert self.model.size == 16 + 8 + 8 + 8 + 1 + 1 + 8 + 4
+
+    def test_symmetric(self):
+        assert_symmetric(self.model, point())
+
+    def test_pack_unpack(self):
+        data = self.model.pack(point(1))
+        assert len(data) == self.model.size
+        assert self.model.unpack(data) == point(1)
+
+    def test_pack_many_into_preallocated(self):
+        items = [point(i) for i in range(10)]
+        buffer = bytearray(3 + self.model.size * 10)
+        result = self.model.pack_many(items, buffer, offset=3)
+        assert result is buffer
+        assert self.model.unpack(buffer, 3 + self.model.size * 4) == point(4)
+        assert list(self.model.iter_unpack(buffer, offset=3)) == items
+
+    def test_iter_unpack_count(self):
+        items = [point(i) for i in range(5)]
+        buffer = memoryview(self.model.pack_many(items))
+        assert list(self.model.iter_unpack(buffer, offset=self.model.size, count=2)) == items[1:3]
+
+    def test_iter_unpack_out_of_bounds(self):
+        buffer = self.model.pack_many([point()])
+        with pytest.raises(LoadError) as e:
+            list(self.model.iter_unpack(buffer, count=2))
+        assert e.value._data == b''
+
+    def test_load_many_reports_incomplete_record(self):
+        buffer = self.model.dump_many([point(), point(1)]) + b'\x01\x02'
+        with pytest.raises(LoadError) as e:
+            self.model.load_many(buffer)
+        assert e.value._data == b'\x01\x02'
+
+    def test_unpack_reports_record(self):
+        buffer = b'\x00' * self.model.size * 2
+        with pytest.raises(LoadError) as e:
+            self.model.unpack(buffer, self.model.size + 1)
+        assert e.value._data == b'\x00' * (self.model.size - 1)
+
+    def test_load_many(self):
+        items = [point(i) for i in range(3)]
+        assert self.model.load_many(self.model.dump_many(items)) == items
+
+    def test_load_invalid_size(self):
+        with pytest.raises(LoadError):
+            self.model.load(self.model.dump(point())[:-1])
+
+    def test_dump_overflow(self):
+        with pytest.raises(DumpError):
+            self.model.pack(Point(**{**point().__dict__, 'count': 2 ** 64}))
+
+    def test_validates_on_load(self):
+        model = StructModel(Reading)
+        assert model.unpack(model.pack(Reading(1.0))) == Reading(1.0)
+        with pytest.raises(ValidationError):
+            model.unpack(model.pack(Reading(-1.0)))
+
+
+@dataclass(frozen=True)
+class Area:
+    width: int
+    height: int
+    size: int = field(init=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, 'size', self.width * self.height)
+
+
+def test_loads_fields_excluded_from_init():
+    model = StructModel(Area)
+    assert model.format == '<qqq'
+    assert_symmetric(model, Area(2, 3))
+    assert model.view(model.pack(Area(2, 3))).size == 6
+
+
+@dataclass(frozen=True)
+class Empty:
+    pass
+
+
+def test_rejects_empty_dataclass():
+    with pytest.raises(EmptyRecord):
+        StructModel(Empty)
+
+
+@dataclass(frozen=True)
+class WithMaterialize:
+    materialize: int
+
+
+@dataclass(frozen=True)
+class WithBuffer:
+    _buffer: int
+
+
+@pytest.mark.parametrize('cls', [WithMaterialize, WithBuffer])
+def test_rejects_field_names_of_views(cls):
+    with pytest.raises(ReservedFieldName):
+        StructModel(cls)
+
+
+@dataclass(frozen=True)
+class WithString:
+    id: int
+    name: str
+
+
+@dataclass(frozen=True)
+class WithOptional:
+    value: Optional[int]
+
+
+@dataclass(frozen=True)
+class WithList:
+    values: List[int]
+
+
+@pytest.mark.parametrize('cls', [WithString, WithOptional, WithList])
+def test_rejects_variable_length_fields(cls):
+    with pytest.raises(VariableLengthField):
+        StructModel(cls)
+
+
+class TestRecordViews:
+
+    def setup_class(self):
+        self.model = StructModel(Point)
+        self.items = [point(i) for i in range(5)]
+        self.buffer = self.model.pack_many(self.items)
+
+    def test_fields_read_from_buffer(self):
+        view = self.model.view(self.buffer, self.model.size * 2)
+        expected = self.items[2]
+        assert view.sensor == expected.sensor
+        assert view.at == expected.at
+        assert view.value == expected.value
+        assert view.count == expected.count
+        assert view.valid == expected.valid
+        assert view.status == expected.status
+        assert view.priority == expected.priority
+        assert view.day == expected.day
+
+    def test_materialize(self):
+        view = self.model.view(self.buffer, self.model.size)
+        assert view.materialize() == self.items[1]
+
+    def test_reads_are_not_copied(self):
+        buffer = bytearray(self.buffer)
+        view = self.model.view(buffer)
+        self.model.pack_into(buffer, 0, self.items[3])
+        assert view.count == self.items[3].count
+
+    def test_random_access(self):
+        views = self.model.views(self.buffer)
+        assert len(views) == 5
+        assert views[-1].materialize() == self.items[-1]
+        assert [view.count for view in views[1:3]] == [-1, -2]
+        assert [view.materialize() for view in views] == self.items
+        with pytest.raises(IndexError):
+            assert views[5]
+
+    def test_view_class(self):
+        assert self.model.view_class is self.model.view_class
+        assert self.model.view_class.__name__ == 'PointView'
+        with pytest.raises(AttributeError):
+            self.model.view(self.buffer).unknown
+
+    def test_too_small_buffer(self):
+        with pytest.raises(ValueError):
+            self.model.view(self.buffer, len(self.buffer) - 1)
+        with pytest.raises(ValueError):
+            self.model.views(self.buffer, count=6)